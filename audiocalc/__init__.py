@@ -1,10 +1,40 @@
 # encoding: utf-8
 
+"""
+A few audio/sound calculation utilities.
+
+The functions are provided by the backend selected in
+audiocalc.backends, which is imported on first use.
+BACKEND is the name of the selected backend.
+
+Set the environment variable AUDIOCALC_INSTRUMENT to instrument the
+functions on import, see audiocalc.instrument.
+"""
+
 from __future__ import absolute_import
 
-try:
-    from ._audiocalc import *
-    print("Using Cython implementation of 'audiocalc'.")
-except ImportError:
-    from .py_audiocalc import *
-    print("Using Python implementation of 'audiocalc'.")
+import os
+
+from . import backends
+from . import instrument
+from .backends import available_backends, get_backend, use_backend
+
+__all__ = list(backends.API)
+
+if os.environ.get(instrument.ENV_VAR):
+    instrument.enable()
+
+
+def __getattr__(name):
+    if name == 'BACKEND':
+        return backends.get_backend().name
+    if name in backends.API:
+        value = backends.resolve(name)
+        # cache for later lookups, use_backend() drops it again
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(backends.API) | set(['BACKEND']))
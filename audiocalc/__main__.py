@@ -0,0 +1,36 @@
+# encoding: utf-8
+
+"""
+Lists the available backends and optionally checks their parity.
+
+    python -m audiocalc --parity
+"""
+
+import argparse
+import sys
+
+from . import backends
+
+
+def main(argv=None):
+    info = "List audiocalc backends and check their parity"
+    parser = argparse.ArgumentParser(description=info)
+    parser.add_argument('--parity', dest="parity", action="store_true",
+            help='Compare the results of all available backends', default=False)
+    args = parser.parse_args(argv)
+    names = backends.available_backends()
+    print("Available backends: %s" % ", ".join(names))
+    print("Selected backend: %s" % backends.get_backend().name)
+    if args.parity:
+        mismatches = backends.check_parity(names)
+        for name, func_name, func_args, expected, result in mismatches:
+            print("MISMATCH %s.%s%r: expected %r, got %r" % (
+                name, func_name, func_args, expected, result))
+        if mismatches:
+            return 1
+        print("All backends agree.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
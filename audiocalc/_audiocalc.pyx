@@ -1,6 +1,9 @@
 # encoding: utf-8
 
-from libc.math cimport exp, log, log10, pow, sqrt
+cimport cython
+from cpython cimport array
+from libc.math cimport exp, isnan, log, log10, pow, sqrt
+import array
 
 ctypedef double mydouble
 
@@ -16,8 +19,17 @@ OCTAVE_BANDS = {
     'f8000': (8000, -1.15)
 }
 
+from .py_audiocalc import BANDS, OctaveSpectrum, _band_items
 
-cpdef mydouble damping(mydouble temp, int relhum, mydouble freq, mydouble pres=101325.0):
+# middle frequencies and A factors in the order of BANDS
+cdef mydouble _FREQUENCIES[8]
+cdef mydouble _A_FACTORS[8]
+for _index, _band in enumerate(BANDS):
+    _FREQUENCIES[_index] = OCTAVE_BANDS[_band][0]
+    _A_FACTORS[_index] = OCTAVE_BANDS[_band][1]
+
+
+cpdef mydouble damping(mydouble temp, mydouble relhum, mydouble freq, mydouble pres=101325.0):
     """
     Calculates the damping factor for sound in dB/m
     depending on temperature, humidity and sound frequency.
@@ -28,6 +40,10 @@ cpdef mydouble damping(mydouble temp, int relhum, mydouble freq, mydouble pres=1
     freq: Sound frequency in herz
     pres: Atmospheric pressure in kilopascal
     """
+    return _damping(temp, relhum, freq, pres)
+
+
+cdef inline mydouble _damping(mydouble temp, mydouble relhum, mydouble freq, mydouble pres) noexcept nogil:
     cdef mydouble c_humid
     cdef mydouble hum
     cdef mydouble tempr
@@ -44,7 +60,6 @@ cpdef mydouble damping(mydouble temp, int relhum, mydouble freq, mydouble pres=1
     return 8.686 * freq * freq * (1.84e-11 * (1.0 / pres) * sqrt(tempr) + pow(tempr, -2.5) * (0.01275 * (exp(-2239.1 / temp) * 1.0 / (frO + freq * freq / frO)) + 0.1068 * (exp(-3352 / temp) * 1.0 / (frN + freq * freq / frN))))
 
 
-
 def total_level(source_levels):
     """
     Calculates the total sound pressure level based on octave band frequencies
@@ -52,6 +67,9 @@ def total_level(source_levels):
     cdef mydouble level
     cdef mydouble sums = 0.0
 
+    if isinstance(source_levels, OctaveSpectrum):
+        source_levels = [l for index, l in source_levels.band_items]
+
     for l in source_levels:
         if l is None:
             continue
@@ -68,15 +86,14 @@ def total_rated_level(octave_frequencies):
     based on octave band frequencies
     """
     cdef mydouble level
-    cdef mydouble dummy
-    cdef mydouble afactor
+    cdef mydouble band_level
+    cdef Py_ssize_t index
     cdef mydouble sums = 0.0
 
-    for band, (dummy, afactor) in OCTAVE_BANDS.iteritems():
-        if octave_frequencies.get(band) is None:
+    for index, band_level in _band_items(octave_frequencies):
+        if band_level == 0:
             continue
-
-        sums += pow(10.0, ((<mydouble>octave_frequencies[band] + afactor) / 10.0))
+        sums += pow(10.0, ((band_level + _A_FACTORS[index]) / 10.0))
 
     level = 10.0 * log10(sums)
     return level
@@ -86,16 +103,21 @@ cpdef mydouble leq3(levels):
     """
     Calculates the energy-equivalent (Leq3) value
     given a regular measurement interval.
+
+    levels may be any iterable, it is consumed in a single pass.
     """
-    cdef mydouble n
+    cdef mydouble n = 0.0
+    cdef mydouble level_sum = 0.0
     cdef mydouble sums = 0.0
-    n = <mydouble>len(levels)
-    if sum(levels) == 0.0:
-        return 0.0
+    cdef mydouble l
     for l in levels:
+        n += 1.0
+        level_sum += l
         if l == 0:
             continue
-        sums += pow(10.0, <mydouble>l / 10.0)
+        sums += pow(10.0, l / 10.0)
+    if level_sum == 0.0:
+        return 0.0
     leq3 = 10.0 * log10((1.0 / n) * sums)
     leq3 = max(0.0, leq3)
     return leq3
@@ -119,33 +141,31 @@ cpdef mydouble distant_level(mydouble reference_level, mydouble distance, mydoub
 
 cpdef mydouble distant_total_damped_rated_level(
             octave_frequencies,
-            int distance,
+            mydouble distance,
             mydouble temp,
-            int relhum,
-            mydouble reference_distance=1.0):
+            mydouble relhum,
+            mydouble reference_distance=1.0,
+            mydouble pres=101325.0):
     """
     Calculates the damped, A-rated total sound pressure level
-    in a given distance, temperature and relative humidity
+    in a given distance, temperature, relative humidity and
+    atmospheric pressure (in Pa)
     from octave frequency sound pressure levels in a reference distance
     """
     cdef mydouble damping_distance
     cdef mydouble sums
     cdef mydouble distant_val
     cdef mydouble damp_per_meter
-    cdef mydouble level
-    cdef mydouble midfreq
-    cdef mydouble afactor
+    cdef mydouble band_level
+    cdef Py_ssize_t index
 
     damping_distance = distance - reference_distance
     sums = 0.0
 
-    for band, (midfreq, afactor) in OCTAVE_BANDS.iteritems():
-        if octave_frequencies.get(band) is None:
-            continue
-
+    for index, band_level in _band_items(octave_frequencies):
         # distance-adjusted level per band
         distant_val = distant_level(
-            reference_level=<mydouble>octave_frequencies[band],
+            reference_level=band_level,
             distance=distance,
             reference_distance=reference_distance
         )
@@ -153,15 +173,39 @@ cpdef mydouble distant_total_damped_rated_level(
         damp_per_meter = damping(
             temp=temp,
             relhum=relhum,
-            freq=midfreq)
+            freq=_FREQUENCIES[index],
+            pres=pres)
         distant_val = distant_val - (damping_distance * damp_per_meter)
         # applyng A-rating
-        distant_val += afactor
+        distant_val += _A_FACTORS[index]
         sums += pow(10.0, (distant_val / 10.0))
 
     return 10.0 * log10(sums)
 
 
+def enable_damping_cache(maxsize=4096, ndigits=2):
+    """
+    Does nothing and returns None: the compiled damping is cheaper
+    than a cache lookup, so this backend has no damping cache.
+    Provided so that code written for the Python backend runs
+    unchanged.
+    """
+    return None
+
+
+def disable_damping_cache():
+    """
+    Does nothing, see enable_damping_cache.
+    """
+
+
+def damping_cache_info():
+    """
+    Returns None, this backend has no damping cache.
+    """
+    return None
+
+
 def level_to_power(mydouble level):
     """
     Converts logarithmic sound pressure level value (dB)
@@ -192,7 +236,7 @@ def benchmark_damping():
     reference_distance = 300
 
     import time
-    start = time.clock()
+    start = time.perf_counter()
 
     for temp in range(-20, 35):
         for hum in range(30, 98):
@@ -204,4 +248,294 @@ def benchmark_damping():
                     temp=<mydouble>temp,
                     relhum=hum)
 
-    print("Duration: %.3f sec" % (time.clock() - start))
+    print("Duration: %.3f sec" % (time.perf_counter() - start))
+
+
+# Batch kernels. They work on typed buffers of doubles (e.g. NumPy
+# arrays or array.array('d')) and release the GIL, so that several
+# threads can evaluate parts of a batch in parallel.
+
+# frequency independent terms of the damping formula
+cdef struct _Weather:
+    mydouble classic
+    mydouble oxygen
+    mydouble nitrogen
+    mydouble frO
+    mydouble frN
+
+
+cdef inline void _weather_terms(mydouble temp, mydouble relhum, mydouble pres, _Weather* w) noexcept nogil:
+    cdef mydouble c_humid
+    cdef mydouble hum
+    cdef mydouble tempr
+
+    temp += 273.15  # convert to kelvin
+    pres = pres / 101325.0  # convert to relative pressure
+    c_humid = 4.6151 - 6.8346 * pow((273.15 / temp), 1.261)
+    hum = relhum * pow(10.0, c_humid) * pres
+    tempr = temp / 293.15  # convert to relative air temp (re 20 deg C)
+    w.frO = pres * (24.0 + 4.04e4 * hum * (0.02 + hum) / (0.391 + hum))
+    w.frN = pres * pow(tempr, -0.5) * (9.0 + 280.0 * hum * exp(-4.17 * (pow(tempr, (-1.0 / 3.0)) - 1.0)))
+    w.classic = 1.84e-11 * (1.0 / pres) * sqrt(tempr)
+    w.oxygen = pow(tempr, -2.5) * 0.01275 * exp(-2239.1 / temp)
+    w.nitrogen = pow(tempr, -2.5) * 0.1068 * exp(-3352 / temp)
+
+
+cdef inline mydouble _band_absorption(_Weather* w, mydouble freq) noexcept nogil:
+    return 8.686 * freq * freq * (w.classic + w.oxygen / (w.frO + freq * freq / w.frO) + w.nitrogen / (w.frN + freq * freq / w.frN))
+
+cdef inline mydouble _damped_rated_level(
+            const mydouble* band_levels,
+            mydouble distance,
+            mydouble reference_distance,
+            _Weather* w) noexcept nogil:
+    # damped, A-rated total level of 8 band levels (NaN = missing)
+    cdef Py_ssize_t band
+    cdef mydouble distant_val
+    cdef mydouble spreading = 20.0 * log10(reference_distance / distance)
+    cdef mydouble sums = 0.0
+    for band in range(8):
+        if isnan(band_levels[band]):
+            continue
+        distant_val = (band_levels[band] + spreading -
+            (distance - reference_distance) *
+            _band_absorption(w, _FREQUENCIES[band]) +
+            _A_FACTORS[band])
+        sums += pow(10.0, distant_val / 10.0)
+    return 10.0 * log10(sums)
+
+
+# Table of the temperature dependent factors of the damping formula
+# for the approximate mode, see approx.py. factors has 6 values per
+# temperature, the temperatures are spaced evenly from temp_min to
+# temp_max. Weather states outside the envelope use _weather_terms.
+cdef struct _Table:
+    const mydouble* factors
+    Py_ssize_t n
+    mydouble inv_step
+    mydouble temp_min
+    mydouble temp_max
+    mydouble relhum_min
+    mydouble relhum_max
+    mydouble pres_min
+    mydouble pres_max
+
+
+cdef _Table _make_table(const mydouble[:, ::1] factors, const mydouble[::1] envelope) except *:
+    cdef _Table table
+    if factors.shape[0] < 2 or factors.shape[1] != 6:
+        raise ValueError("Expected a table of shape (n, 6) with n >= 2")
+    if envelope.shape[0] != 6:
+        raise ValueError("Expected the envelope as (temp_min, temp_max, relhum_min, "
+                         "relhum_max, pres_min, pres_max)")
+    table.factors = &factors[0, 0]
+    table.n = factors.shape[0]
+    table.temp_min = envelope[0]
+    table.temp_max = envelope[1]
+    table.relhum_min = envelope[2]
+    table.relhum_max = envelope[3]
+    table.pres_min = envelope[4]
+    table.pres_max = envelope[5]
+    table.inv_step = (table.n - 1) / (table.temp_max - table.temp_min)
+    return table
+
+
+cdef inline void _table_weather_terms(
+            _Table* table, mydouble temp, mydouble relhum, mydouble pres, _Weather* w) noexcept nogil:
+    cdef mydouble position
+    cdef mydouble fraction
+    cdef mydouble hum
+    cdef mydouble f[6]
+    cdef const mydouble* row
+    cdef Py_ssize_t index
+    cdef Py_ssize_t k
+    if not (table.temp_min <= temp <= table.temp_max and
+            table.relhum_min <= relhum <= table.relhum_max and
+            table.pres_min <= pres <= table.pres_max):
+        _weather_terms(temp, relhum, pres, w)
+        return
+    position = (temp - table.temp_min) * table.inv_step
+    index = <Py_ssize_t>position
+    if index > table.n - 2:
+        index = table.n - 2
+    fraction = position - index
+    row = table.factors + 6 * index
+    for k in range(6):
+        f[k] = (1.0 - fraction) * row[k] + fraction * row[k + 6]
+    pres = pres / 101325.0  # convert to relative pressure
+    hum = relhum * f[0] * pres
+    w.frO = pres * (24.0 + 4.04e4 * hum * (0.02 + hum) / (0.391 + hum))
+    w.frN = pres * f[2] * (9.0 + 280.0 * hum * f[3])
+    w.classic = 1.84e-11 * (1.0 / pres) * f[1]
+    w.oxygen = f[4]
+    w.nitrogen = f[5]
+
+
+cdef array.array _double_template = array.array('d')
+
+
+cdef array.array _new_out(Py_ssize_t n):
+    return array.clone(_double_template, n, zero=False)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def damping_batch(
+            const mydouble[::1] temp,
+            const mydouble[::1] relhum,
+            const mydouble[::1] freq,
+            const mydouble[::1] pres,
+            mydouble[::1] out=None):
+    """
+    Calculates the damping in dB/m for buffers of equal length,
+    see damping(). Returns out, or a new array('d') if out is None.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = temp.shape[0]
+    if relhum.shape[0] != n or freq.shape[0] != n or pres.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    if out is None:
+        out = _new_out(n)
+    elif out.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    with nogil:
+        for i in range(n):
+            out[i] = _damping(temp[i], relhum[i], freq[i], pres[i])
+    return out.base
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def total_rated_level_batch(const mydouble[:, ::1] band_levels, mydouble[::1] out=None):
+    """
+    Calculates the A-rated total sound pressure level for each row
+    of band levels, see total_rated_level(). band_levels has the shape
+    (n, len(BANDS)) and is ordered like BANDS, NaN marks missing bands.
+    Returns out, or a new array('d') if out is None.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t band
+    cdef Py_ssize_t n = band_levels.shape[0]
+    cdef mydouble sums
+    cdef mydouble level
+    if band_levels.shape[1] != 8:
+        raise ValueError("Expected 8 octave band levels per row")
+    if out is None:
+        out = _new_out(n)
+    elif out.shape[0] != n:
+        raise ValueError("out must have one element per row")
+    with nogil:
+        for i in range(n):
+            sums = 0.0
+            for band in range(8):
+                level = band_levels[i, band]
+                if isnan(level) or level == 0:
+                    continue
+                sums += pow(10.0, (level + _A_FACTORS[band]) / 10.0)
+            out[i] = 10.0 * log10(sums)
+    return out.base
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def distant_total_damped_rated_level_batch(
+            const mydouble[::1] band_levels,
+            const mydouble[::1] distance,
+            const mydouble[::1] temp,
+            const mydouble[::1] relhum,
+            const mydouble[::1] pres,
+            mydouble reference_distance=1.0,
+            mydouble[::1] out=None):
+    """
+    Calculates the damped, A-rated total sound pressure level of one
+    source for buffers of equal length of distance, temperature,
+    humidity and pressure, see distant_total_damped_rated_level().
+    band_levels holds len(BANDS) levels ordered like BANDS, NaN marks
+    missing bands. Returns out, or a new array('d') if out is None.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = distance.shape[0]
+    cdef _Weather weather
+    if band_levels.shape[0] != 8:
+        raise ValueError("Expected 8 octave band levels")
+    if temp.shape[0] != n or relhum.shape[0] != n or pres.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    if out is None:
+        out = _new_out(n)
+    elif out.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    with nogil:
+        for i in range(n):
+            _weather_terms(temp[i], relhum[i], pres[i], &weather)
+            out[i] = _damped_rated_level(&band_levels[0], distance[i], reference_distance, &weather)
+    return out.base
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def band_damping_table_batch(
+            const mydouble[::1] temp,
+            const mydouble[::1] relhum,
+            const mydouble[::1] pres,
+            const mydouble[:, ::1] factors,
+            const mydouble[::1] envelope,
+            mydouble[::1] out=None):
+    """
+    Calculates the approximate damping in dB/m of all octave bands
+    for buffers of equal length, with a table of temperature factors
+    (see approx.py). The result holds len(BANDS) values per weather
+    state, ordered like BANDS. Returns out, or a new array('d') if
+    out is None.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t band
+    cdef Py_ssize_t n = temp.shape[0]
+    cdef _Weather weather
+    cdef _Table table = _make_table(factors, envelope)
+    if relhum.shape[0] != n or pres.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    if out is None:
+        out = _new_out(n * 8)
+    elif out.shape[0] != n * 8:
+        raise ValueError("out must have len(BANDS) elements per weather state")
+    with nogil:
+        for i in range(n):
+            _table_weather_terms(&table, temp[i], relhum[i], pres[i], &weather)
+            for band in range(8):
+                out[i * 8 + band] = _band_absorption(&weather, _FREQUENCIES[band])
+    return out.base
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def distant_total_damped_rated_level_table_batch(
+            const mydouble[::1] band_levels,
+            const mydouble[::1] distance,
+            const mydouble[::1] temp,
+            const mydouble[::1] relhum,
+            const mydouble[::1] pres,
+            const mydouble[:, ::1] factors,
+            const mydouble[::1] envelope,
+            mydouble reference_distance=1.0,
+            mydouble[::1] out=None):
+    """
+    Like distant_total_damped_rated_level_batch(), with the
+    approximate damping of band_damping_table_batch().
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = distance.shape[0]
+    cdef _Weather weather
+    cdef _Table table = _make_table(factors, envelope)
+    if band_levels.shape[0] != 8:
+        raise ValueError("Expected 8 octave band levels")
+    if temp.shape[0] != n or relhum.shape[0] != n or pres.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    if out is None:
+        out = _new_out(n)
+    elif out.shape[0] != n:
+        raise ValueError("All buffers must have the same length")
+    with nogil:
+        for i in range(n):
+            _table_weather_terms(&table, temp[i], relhum[i], pres[i], &weather)
+            out[i] = _damped_rated_level(&band_levels[0], distance[i], reference_distance, &weather)
+    return out.base
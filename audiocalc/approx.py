@@ -0,0 +1,189 @@
+# encoding: utf-8
+
+"""
+Fast approximate air absorption for screening studies.
+
+All pow() and exp() calls of the damping formula depend on the
+temperature only. They are precomputed on a fine temperature grid
+and interpolated linearly, the remaining (rational) parts of the
+formula are evaluated exactly. Within the operating envelope the
+error is far below 0.01 dB/km in all octave bands, see
+AbsorptionTable.max_error(). Outside the envelope the exact formula
+is used.
+
+The approximation is evaluated by the batch kernels of the compiled
+backend, where the pow() and exp() calls dominate the cost of the
+formula. Without the compiled backend, the exact NumPy functions are
+used: NumPy evaluates them vectorized, so a table lookup is no faster.
+"""
+
+import collections
+
+import numpy as np
+
+from . import np_audiocalc
+from . import threaded
+from .interpolate import inside, multilinear
+
+
+Envelope = collections.namedtuple('Envelope', ['temp', 'relhum', 'pres'])
+
+# (min, max) of temperature in degrees celsius, relative humidity
+# in percent and atmospheric pressure in pascal
+ENVELOPE = Envelope(temp=(-30.0, 45.0), relhum=(5.0, 100.0), pres=(80000.0, 110000.0))
+
+# temperature resolution of the table in kelvin
+TEMP_STEP = 0.05
+
+# whether the compiled table kernels are available
+HAVE_KERNELS = threaded.HAVE_KERNELS and hasattr(threaded._audiocalc, 'band_damping_table_batch')
+
+
+class AbsorptionTable(object):
+    """
+    Table of the temperature dependent factors of the damping
+    formula over an operating envelope.
+
+    envelope: Envelope of the weather states evaluated approximately
+    temp_step: temperature resolution in kelvin
+    """
+
+    def __init__(self, envelope=ENVELOPE, temp_step=TEMP_STEP):
+        self.envelope = Envelope(*[tuple(float(v) for v in limits) for limits in envelope])
+        low, high = self.envelope.temp
+        count = int(np.ceil((high - low) / temp_step)) + 1
+        self.temp_axis = np.linspace(low, high, max(count, 2))
+        self.values = np.ascontiguousarray(np.stack(
+            np_audiocalc._temperature_factors(self.temp_axis + 273.15), axis=-1))
+        self._limits = np.array([v for limits in self.envelope for v in limits])
+
+    def inside(self, temp, relhum, pres=101325):
+        """
+        Returns a boolean array, True for weather states within
+        the envelope.
+        """
+        return inside(
+            [np.array(limits) for limits in self.envelope], [temp, relhum, pres])
+
+    def _table_band_damping(self, temp, relhum, pres):
+        """
+        Evaluates the table with NumPy, for weather states within
+        the envelope. The compiled kernels calculate the same values.
+        """
+        factors = multilinear([self.temp_axis], self.values, [temp])
+        terms = np_audiocalc._combine_terms(
+            np.moveaxis(factors, -1, 0),
+            np.asarray(relhum, dtype=float),
+            np.asarray(pres, dtype=float) / 101325.0)
+        return np_audiocalc._absorption(
+            [t[..., np.newaxis] for t in terms], np_audiocalc.BAND_FREQUENCIES)
+
+    def band_damping(self, temp, relhum, pres=101325, threads=None):
+        """
+        Calculates the damping in dB/m for all octave bands like
+        np_audiocalc.band_damping, using `threads` threads (see
+        threaded). Weather states outside the envelope are
+        evaluated exactly.
+        """
+        if not HAVE_KERNELS:
+            return np_audiocalc.band_damping(temp, relhum, pres)
+        shape, arrays = threaded._flat(temp, relhum, pres)
+        out = np.empty((arrays[0].size, len(np_audiocalc.BANDS)))
+
+        def kernel(temp, relhum, pres, out):
+            threaded._audiocalc.band_damping_table_batch(
+                temp, relhum, pres, self.values, self._limits, out=out.reshape(-1))
+
+        return threaded._map(kernel, arrays, out, threads).reshape(shape + out.shape[-1:])
+
+    def distant_total_damped_rated_level(
+                self,
+                octave_frequencies,
+                distance,
+                temp,
+                relhum,
+                reference_distance=1.0,
+                pres=101325,
+                threads=None):
+        """
+        Calculates the damped, A-rated total sound pressure level of
+        one source like threaded.distant_total_damped_rated_level,
+        with the approximate damping.
+        """
+        if not HAVE_KERNELS:
+            return np_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies, distance, temp, relhum, reference_distance, pres)
+        band_levels = np_audiocalc._band_levels(octave_frequencies)
+        shape, arrays = threaded._flat(distance, temp, relhum, pres)
+        out = np.empty(arrays[0].size)
+
+        def kernel(distance, temp, relhum, pres, out):
+            threaded._audiocalc.distant_total_damped_rated_level_table_batch(
+                band_levels, distance, temp, relhum, pres, self.values, self._limits,
+                float(reference_distance), out=out)
+
+        return threaded._map(kernel, arrays, out, threads).reshape(shape)
+
+    def max_error(self, samples=100000, seed=0):
+        """
+        Measures the maximum absolute error in dB/m per octave band
+        against the exact formula. The weather states are random
+        states within the envelope and the midpoints between the
+        temperatures of the table (at the extreme humidities and
+        pressures), where the interpolation error is largest.
+
+        Returns an array ordered like BANDS.
+        """
+        rng = np.random.default_rng(seed)
+        temp = [rng.uniform(*self.envelope.temp, size=samples)]
+        relhum = [rng.uniform(*self.envelope.relhum, size=samples)]
+        pres = [rng.uniform(*self.envelope.pres, size=samples)]
+        midpoints = (self.temp_axis[1:] + self.temp_axis[:-1]) / 2.0
+        for h in self.envelope.relhum:
+            for p in self.envelope.pres:
+                temp.append(midpoints)
+                relhum.append(np.full(midpoints.shape, h))
+                pres.append(np.full(midpoints.shape, p))
+        temp, relhum, pres = [np.concatenate(a) for a in (temp, relhum, pres)]
+        error = np.abs(
+            self._table_band_damping(temp, relhum, pres) -
+            np_audiocalc.band_damping(temp, relhum, pres))
+        return error.max(axis=0)
+
+
+_default_table = None
+
+
+def default_table():
+    """
+    Returns the table for ENVELOPE, building it on first use.
+    """
+    global _default_table
+    if _default_table is None:
+        _default_table = AbsorptionTable()
+    return _default_table
+
+
+def band_damping(temp, relhum, pres=101325, threads=None):
+    """
+    Calculates the damping in dB/m for all octave bands like
+    np_audiocalc.band_damping with the default table.
+    """
+    return default_table().band_damping(temp, relhum, pres, threads)
+
+
+def distant_total_damped_rated_level(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325,
+            threads=None):
+    """
+    Calculates the damped, A-rated total sound pressure level of one
+    source like np_audiocalc.distant_total_damped_rated_level with
+    the default table.
+    """
+    return default_table().distant_total_damped_rated_level(
+        octave_frequencies, distance, temp, relhum, reference_distance, pres, threads)
@@ -0,0 +1,128 @@
+# encoding: utf-8
+
+"""
+Air absorption along slant paths through a stratified atmosphere,
+e.g. from an aircraft to the ground.
+
+The atmosphere is a stack of horizontal layers of constant temperature,
+humidity and pressure. The damping per layer and octave band is
+calculated once per profile. The length of a straight path within
+each layer follows from the altitudes of its end points, so the
+attenuation of many paths is one matrix product of their layer lengths
+with the damping of the layers.
+"""
+
+import numpy as np
+
+from . import np_audiocalc
+from .np_audiocalc import BANDS, CHUNK_SIZE
+
+
+class Profile(object):
+    """
+    A layered atmospheric profile.
+
+    altitudes: ascending lower bounds of the layers in meters. The
+        lowest layer extends downwards and the highest layer upwards
+        without limit.
+    temp: temperature in degrees celsius per layer
+    relhum: relative humidity in percent per layer
+    pres: atmospheric pressure in pascal per layer, or one value
+        for all layers
+    """
+
+    def __init__(self, altitudes, temp, relhum, pres=101325):
+        self.altitudes = np.asarray(altitudes, dtype=float).ravel()
+        if self.altitudes.size < 1 or np.any(np.diff(self.altitudes) <= 0):
+            raise ValueError("altitudes must be ascending with at least one value")
+        shape = self.altitudes.shape
+        try:
+            self.temp, self.relhum, self.pres = [
+                np.broadcast_to(np.asarray(a, dtype=float), shape) for a in (temp, relhum, pres)]
+        except ValueError:
+            raise ValueError("Expected one temp, relhum and pres per layer")
+        self.absorption = np_audiocalc.band_damping(self.temp, self.relhum, self.pres)
+        self._bottoms = np.concatenate([[-np.inf], self.altitudes[1:]])
+        self._tops = np.concatenate([self.altitudes[1:], [np.inf]])
+
+    def __len__(self):
+        return self.altitudes.size
+
+    def layer_lengths(self, start_altitude, end_altitude, length):
+        """
+        Returns the length in meters of straight paths within each
+        layer, an array of shape broadcast shape + (len(self),).
+
+        start_altitude, end_altitude: altitudes of the end points
+        length: lengths of the paths, broadcast against the altitudes
+        """
+        start_altitude, end_altitude, length = np.broadcast_arrays(
+            *[np.asarray(a, dtype=float) for a in (start_altitude, end_altitude, length)])
+        low = np.minimum(start_altitude, end_altitude)[..., np.newaxis]
+        high = np.maximum(start_altitude, end_altitude)[..., np.newaxis]
+        overlap = np.clip(np.minimum(high, self._tops) - np.maximum(low, self._bottoms), 0.0, None)
+        height = high - low
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = overlap / height
+        # horizontal paths lie in the layer of their altitude
+        level = (low >= self._bottoms) & (low < self._tops)
+        fraction = np.where(height > 0.0, fraction, level)
+        return fraction * length[..., np.newaxis]
+
+    def attenuation(self, source, receiver, reference_distance=1.0):
+        """
+        Returns the air absorption in dB per octave band between the
+        point in reference_distance from the source towards the
+        receiver and the receiver, an array of shape
+        broadcast shape + (len(BANDS),).
+
+        source, receiver: positions (x, y, altitude) in meters,
+            arrays of shape (..., 3)
+        """
+        lengths, _ = self._paths(source, receiver, reference_distance)
+        return np.matmul(lengths, self.absorption)
+
+    def _paths(self, source, receiver, reference_distance):
+        source = np.asarray(source, dtype=float)
+        receiver = np.asarray(receiver, dtype=float)
+        distance = np.sqrt(np.square(receiver - source).sum(axis=-1))
+        damping_distance = distance - reference_distance
+        with np.errstate(divide='ignore', invalid='ignore'):
+            share = np.where(distance > 0.0, reference_distance / distance, 0.0)
+        start = source[..., 2] + share * (receiver[..., 2] - source[..., 2])
+        # damping_distance is negative within the reference distance,
+        # like in distant_total_damped_rated_level
+        lengths = self.layer_lengths(start, receiver[..., 2], np.abs(damping_distance))
+        return lengths * np.sign(damping_distance)[..., np.newaxis], distance
+
+    def distant_total_damped_rated_level(self, octave_frequencies, source, receiver,
+                                         reference_distance=1.0):
+        """
+        Calculates the damped, A-rated total sound pressure level of
+        one source at receivers, like
+        np_audiocalc.distant_total_damped_rated_level with the
+        absorption integrated along the path through the layers.
+
+        octave_frequencies: dict of band levels, OctaveSpectrum or
+            array of len(BANDS) in the reference distance
+        source, receiver: positions (x, y, altitude) in meters,
+            arrays of shape (..., 3) broadcast against each other
+        reference_distance: reference distance in meters
+
+        The paths are evaluated in chunks to keep the memory use
+        bounded. Returns an array of the broadcast shape.
+        """
+        source_energy = np_audiocalc._source_energy(octave_frequencies)
+        source, receiver = np.broadcast_arrays(
+            np.asarray(source, dtype=float), np.asarray(receiver, dtype=float))
+        shape = source.shape[:-1]
+        source = source.reshape(-1, 3)
+        receiver = receiver.reshape(-1, 3)
+        out = np.empty(source.shape[0])
+        step = max(1, CHUNK_SIZE // max(len(self), len(BANDS)))
+        for start in range(0, out.size, step):
+            chunk = slice(start, start + step)
+            lengths, distance = self._paths(source[chunk], receiver[chunk], reference_distance)
+            attenuation = np.power(10.0, -np.matmul(lengths, self.absorption) / 10.0)
+            out[chunk] = np.square(reference_distance / distance) * np.dot(attenuation, source_energy)
+        return 10.0 * np.log10(out).reshape(shape)
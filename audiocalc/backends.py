@@ -0,0 +1,210 @@
+# encoding: utf-8
+
+"""
+Registry of 'audiocalc' implementations ("backends").
+
+The functions available as audiocalc.<name> are taken from the
+selected backend. A backend is only imported when it is selected
+(or explicitly probed), so that e.g. NumPy is not imported by
+processes that only use the pure Python backend.
+
+The backend is selected by use_backend() or, on first use, by the
+environment variable AUDIOCALC_BACKEND. Without either, the compiled
+backend is used if it has been built, otherwise the Python backend.
+
+Run `python -m audiocalc --parity` to compare the results of
+all available backends.
+"""
+
+import collections
+import importlib
+import logging
+import math
+import os
+import sys
+
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = 'AUDIOCALC_BACKEND'
+
+# names provided by the audiocalc package
+API = (
+    'OCTAVE_BANDS',
+    'BANDS',
+    'OctaveSpectrum',
+    'damping',
+    'total_level',
+    'total_rated_level',
+    'leq3',
+    'distant_level',
+    'distant_total_damped_rated_level',
+    'level_to_power',
+    'benchmark_damping',
+    'DampingCache',
+    'enable_damping_cache',
+    'disable_damping_cache',
+    'damping_cache_info',
+)
+
+# backends tried in this order if none is selected explicitly
+AUTO_ORDER = ('cython', 'python')
+
+Backend = collections.namedtuple('Backend', ['name', 'module'])
+
+# backend name to module name, relative to this package
+_registry = collections.OrderedDict([
+    ('python', '.py_audiocalc'),
+    ('numpy', '.np_audiocalc'),
+    ('cython', '._audiocalc'),
+])
+
+_selected = None
+
+
+def register_backend(name, module_name):
+    """
+    Registers a backend. The module is imported only when the
+    backend is selected. Names of API missing in the module are
+    taken from the Python backend.
+
+    name: backend name, e.g. for AUDIOCALC_BACKEND
+    module_name: absolute module name, or relative to this package
+    """
+    _registry[name] = module_name
+
+
+def load_backend(name):
+    """
+    Imports and returns the backend of the given name.
+    Raises ValueError for unknown names and ImportError
+    if the backend is not available.
+    """
+    if name not in _registry:
+        raise ValueError("Unknown audiocalc backend %r, known backends are: %s" % (
+            name, ", ".join(_registry)))
+    module = importlib.import_module(_registry[name], __package__)
+    return Backend(name, module)
+
+
+def available_backends():
+    """
+    Returns the names of all backends that can be imported.
+    Note that this imports all registered backends.
+    """
+    names = []
+    for name in _registry:
+        try:
+            load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def use_backend(name=None):
+    """
+    Selects the backend used by the audiocalc package and returns it.
+
+    name: backend name, or None or "auto" for the first available
+        backend of AUTO_ORDER
+    """
+    global _selected
+    if name in (None, '', 'auto'):
+        for candidate in AUTO_ORDER:
+            try:
+                backend = load_backend(candidate)
+            except ImportError:
+                logger.debug("audiocalc backend %r is not available", candidate)
+                continue
+            break
+    else:
+        backend = load_backend(name)
+    _selected = backend
+    # drop names the package has resolved from the previous backend
+    package = sys.modules.get(__package__)
+    if package is not None:
+        for api_name in API:
+            package.__dict__.pop(api_name, None)
+    logger.debug("Using audiocalc backend %r", backend.name)
+    return backend
+
+
+def get_backend():
+    """
+    Returns the selected backend, selecting it on first use
+    according to the environment variable AUDIOCALC_BACKEND.
+    """
+    if _selected is None:
+        return use_backend(os.environ.get(ENV_VAR))
+    return _selected
+
+
+def resolve(name, backend=None):
+    """
+    Returns the API object `name` of a backend (by default the
+    selected one), falling back to the Python backend.
+    """
+    if backend is None:
+        backend = get_backend()
+    try:
+        return getattr(backend.module, name)
+    except AttributeError:
+        return getattr(load_backend('python').module, name)
+
+
+# inputs for the parity check, as (function name, positional arguments)
+PARITY_CASES = [
+    ('damping', (20, 80, 8000)),
+    ('damping', (-15, 35, 62.5, 95000)),
+    ('damping', (33.5, 90.5, 4000)),
+    ('total_level', ([71.5, 68.5, 64, 58, 53, 47, 40, 32],)),
+    ('total_level', ([71.5, None, 0, 58],)),
+    ('total_rated_level', ({'f63': 71.5, 'f125': 68.5, 'f250': 64, 'f500': 58,
+                            'f1000': 53, 'f2000': 47, 'f4000': 40, 'f8000': 32},)),
+    ('total_rated_level', ({'f63': 71.5, 'f250': None, 'f1000': 0, 'f8000': 32},)),
+    # bands whose A-rated level is 0 are summed, only 0 input levels are skipped
+    ('total_rated_level', ({'f63': 26.21, 'f1000': 60},)),
+    ('total_rated_level', ({'f63': 26.21},)),
+    ('leq3', ([30, 30, 30],)),
+    ('leq3', ([30, 45.5, 0, 60],)),
+    ('leq3', ([0, 0, 0.1],)),
+    ('distant_level', (100, 100, 1)),
+    ('distant_level', (86.5, 250.5, 300)),
+    ('distant_total_damped_rated_level', (
+        {'f63': 86, 'f125': 89.5, 'f250': 87.5, 'f500': 86.0,
+         'f1000': 83.0, 'f2000': 80.0, 'f4000': 77, 'f8000': 67.5},
+        5000, 20, 80, 300)),
+    ('distant_total_damped_rated_level', (
+        {'f63': 71.5, 'f125': None, 'f1000': 53, 'f8000': 32},
+        200.5, -5.5, 45.5, 300)),
+    ('distant_total_damped_rated_level', (
+        {'f63': 86, 'f500': 86.0, 'f4000': 77, 'f8000': 67.5},
+        1500, 10.5, 60, 1, 85000)),
+    ('level_to_power', (100,)),
+]
+
+
+def check_parity(names=None, rtol=1e-9):
+    """
+    Evaluates PARITY_CASES with every available backend and compares
+    the results to the Python backend.
+
+    Returns a list of (backend name, function name, arguments,
+    expected result, result) tuples for all results that differ by
+    more than the relative tolerance rtol.
+
+    names: backend names to check, defaults to all available backends
+    """
+    if names is None:
+        names = available_backends()
+    reference = load_backend('python')
+    mismatches = []
+    for name in names:
+        backend = load_backend(name)
+        for func_name, args in PARITY_CASES:
+            expected = getattr(reference.module, func_name)(*args)
+            result = float(resolve(func_name, backend)(*args))
+            if not math.isclose(result, expected, rel_tol=rtol, abs_tol=1e-12):
+                mismatches.append((name, func_name, args, expected, result))
+    return mismatches
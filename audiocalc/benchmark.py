@@ -0,0 +1,351 @@
+# encoding: utf-8
+
+"""
+Benchmark suite for all public functions and backends.
+
+Each benchmark evaluates a workload of `size` items (function calls for
+scalar functions, array elements for array functions) and reports the
+best of several repetitions as calls per second and nanoseconds per call.
+
+Usage:
+
+    python -m audiocalc.benchmark --output results.json
+    python -m audiocalc.benchmark --compare results.json
+"""
+
+import json
+import platform
+import random
+import re
+import sys
+import time
+
+from . import backends
+
+try:
+    import numpy as np
+    from . import np_audiocalc
+    from . import leq
+    from . import threaded
+    from . import approx
+except ImportError:
+    np = None
+    np_audiocalc = None
+
+
+# workload sizes, multiples of 100
+DEFAULT_SIZES = (1000, 100000)
+
+# maximum relative loss of calls/sec before a benchmark counts as a regression
+DEFAULT_THRESHOLD = 0.1
+
+# sound source used by all benchmarks
+OCTAVE_FREQUENCIES = {
+    'f63': 86,
+    'f125': 89.5,
+    'f250': 87.5,
+    'f500': 86.0,
+    'f1000': 83.0,
+    'f2000': 80.0,
+    'f4000': 77,
+    'f8000': 67.5
+}
+REFERENCE_DISTANCE = 300
+
+
+def _inputs(size):
+    """
+    Returns reproducible random inputs for `size` evaluations.
+    """
+    rnd = random.Random(size)
+    return {
+        'temp': [rnd.uniform(-20, 35) for i in range(size)],
+        'relhum': [rnd.uniform(10, 100) for i in range(size)],
+        'freq': [rnd.choice([62.5, 125, 250, 500, 1000, 2000, 4000, 8000])
+                 for i in range(size)],
+        'distance': [rnd.uniform(100, 10000) for i in range(size)],
+        'level': [rnd.uniform(20, 100) for i in range(size)],
+    }
+
+
+def _scalar_benchmarks(module, size):
+    """
+    Returns a dict of benchmark name to callable for the scalar API
+    of module, each evaluating `size` calls.
+    """
+    data = _inputs(size)
+    temp, relhum, freq = data['temp'], data['relhum'], data['freq']
+    distance, level = data['distance'], data['level']
+    spectra = [OCTAVE_FREQUENCIES] * size
+    level_lists = [level[i:i + 8] for i in range(size)]
+
+    def damping():
+        for i in range(size):
+            module.damping(temp[i], relhum[i], freq[i])
+
+    def total_level():
+        for levels in level_lists:
+            module.total_level(levels)
+
+    def total_rated_level():
+        for spectrum in spectra:
+            module.total_rated_level(spectrum)
+
+    def leq3():
+        # one call over all levels, size counts the levels
+        module.leq3(level)
+
+    def distant_level():
+        for i in range(size):
+            module.distant_level(level[i], distance[i], REFERENCE_DISTANCE)
+
+    def distant_total_damped_rated_level():
+        for i in range(size):
+            module.distant_total_damped_rated_level(
+                OCTAVE_FREQUENCIES, distance[i], temp[i], relhum[i],
+                REFERENCE_DISTANCE)
+
+    return {
+        'damping': damping,
+        'total_level': total_level,
+        'total_rated_level': total_rated_level,
+        'leq3': leq3,
+        'distant_level': distant_level,
+        'distant_total_damped_rated_level': distant_total_damped_rated_level,
+    }
+
+
+def _numpy_benchmarks(size):
+    """
+    Returns a dict of benchmark name to callable for the array API,
+    each evaluating `size` array elements.
+    """
+    data = dict((key, np.array(value)) for key, value in _inputs(size).items())
+    temp, relhum, freq = data['temp'], data['relhum'], data['freq']
+    distance, level = data['distance'], data['level']
+    # axes of a grid with `size` cells (for multiples of 100)
+    grid_temp = np.linspace(-20, 35, 10)
+    grid_relhum = np.linspace(10, 100, 10)
+    grid_distance = np.linspace(500, 10000, max(1, size // 100))
+    spectra = _spectra(size)
+
+    def damping():
+        np_audiocalc.damping(temp, relhum, freq)
+
+    def band_damping():
+        # 8 bands per weather state
+        np_audiocalc.band_damping(temp[:size // 8], relhum[:size // 8])
+
+    def total_rated_level():
+        np_audiocalc.total_rated_level(spectra)
+
+    def distant_level():
+        np_audiocalc.distant_level(level, distance, REFERENCE_DISTANCE)
+
+    def distant_total_damped_rated_level():
+        np_audiocalc.distant_total_damped_rated_level(
+            OCTAVE_FREQUENCIES, distance, temp, relhum, REFERENCE_DISTANCE)
+
+    def distant_total_damped_rated_level_grid():
+        np_audiocalc.distant_total_damped_rated_level_grid(
+            OCTAVE_FREQUENCIES, REFERENCE_DISTANCE,
+            grid_temp, grid_relhum, grid_distance)
+
+    def leq_update_many():
+        leq.LeqAccumulator().update_many(level)
+
+    return {
+        'damping': damping,
+        'band_damping': band_damping,
+        'total_rated_level': total_rated_level,
+        'distant_level': distant_level,
+        'distant_total_damped_rated_level': distant_total_damped_rated_level,
+        'distant_total_damped_rated_level_grid': distant_total_damped_rated_level_grid,
+        'leq_update_many': leq_update_many,
+    }
+
+
+def _spectra(size):
+    """
+    Returns `size` spectra of band levels around OCTAVE_FREQUENCIES,
+    an array of shape (size, len(BANDS)).
+    """
+    base = np_audiocalc._band_levels(OCTAVE_FREQUENCIES)
+    return base + np.random.RandomState(size).uniform(-10, 10, (size, base.size))
+
+
+def _batch_benchmarks(size):
+    """
+    Returns a dict of benchmark name to callable for the multi-threaded
+    batch functions (threaded) and the approximate absorption (approx),
+    with the default number of threads and with one thread. Workloads
+    are the same as for the array benchmarks.
+    """
+    data = dict((key, np.array(value)) for key, value in _inputs(size).items())
+    temp, relhum, freq, distance = data['temp'], data['relhum'], data['freq'], data['distance']
+    spectra = _spectra(size)
+    # build the table before timing
+    table = approx.default_table()
+    result = {}
+    for suffix, threads in (('', None), ('.threads1', 1)):
+        def damping(threads=threads):
+            threaded.damping(temp, relhum, freq, threads=threads)
+
+        def total_rated_level(threads=threads):
+            threaded.total_rated_level(spectra, threads=threads)
+
+        def distant_total_damped_rated_level(threads=threads):
+            threaded.distant_total_damped_rated_level(
+                OCTAVE_FREQUENCIES, distance, temp, relhum, REFERENCE_DISTANCE, threads=threads)
+
+        def approx_band_damping(threads=threads):
+            # 8 bands per weather state, like numpy.band_damping
+            table.band_damping(temp[:size // 8], relhum[:size // 8], threads=threads)
+
+        def approx_distant_total_damped_rated_level(threads=threads):
+            table.distant_total_damped_rated_level(
+                OCTAVE_FREQUENCIES, distance, temp, relhum, REFERENCE_DISTANCE, threads=threads)
+
+        result.update({
+            'threaded.damping' + suffix: damping,
+            'threaded.total_rated_level' + suffix: total_rated_level,
+            'threaded.distant_total_damped_rated_level' + suffix: distant_total_damped_rated_level,
+            'approx.band_damping' + suffix: approx_band_damping,
+            'approx.distant_total_damped_rated_level' + suffix:
+                approx_distant_total_damped_rated_level,
+        })
+    return result
+
+
+def benchmarks(size):
+    """
+    Returns a dict of benchmark name to callable for all available
+    backends. Names have the form "<backend>.<function>[<size>]" for
+    scalar calls, "numpy.<function>.bulk[<size>]" for array calls and
+    "threaded.<function>[<size>]" or "approx.<function>[<size>]" for
+    the batch kernels, with the suffix ".threads1" for one thread.
+    Without the compiled backend, threaded and approx fall back to
+    NumPy, see report().
+    """
+    result = {}
+    for backend in backends.available_backends():
+        module = backends.load_backend(backend).module
+        for name, func in _scalar_benchmarks(module, size).items():
+            result['%s.%s[%d]' % (backend, name, size)] = func
+    if np_audiocalc is not None:
+        for name, func in _numpy_benchmarks(size).items():
+            result['numpy.%s.bulk[%d]' % (name, size)] = func
+        for name, func in _batch_benchmarks(size).items():
+            result['%s[%d]' % (name, size)] = func
+    return result
+
+
+def run(sizes=DEFAULT_SIZES, repeat=3, pattern=None, out=None):
+    """
+    Runs all benchmarks whose name matches the regular expression
+    `pattern` for each workload size and returns a dict of benchmark
+    name to result dict with the keys "size", "seconds",
+    "calls_per_sec" and "ns_per_call".
+
+    out: optional file to print a line per benchmark to
+    """
+    results = {}
+    for size in sizes:
+        for name, func in sorted(benchmarks(size).items()):
+            if pattern is not None and not re.search(pattern, name):
+                continue
+            best = None
+            for i in range(repeat):
+                start = time.perf_counter()
+                func()
+                duration = time.perf_counter() - start
+                if best is None or duration < best:
+                    best = duration
+            best = max(best, 1e-9)
+            results[name] = {
+                'size': size,
+                'seconds': best,
+                'calls_per_sec': size / best,
+                'ns_per_call': best * 1e9 / size,
+            }
+            if out is not None:
+                out.write("%-60s %14.0f calls/sec %12.1f ns/call\n" % (
+                    name, results[name]['calls_per_sec'], results[name]['ns_per_call']))
+    return results
+
+
+def report(results):
+    """
+    Returns a JSON serializable dict of the results and
+    a description of the environment they were measured in.
+    """
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+        # whether threaded and approx ran the compiled kernels
+        'kernels': threaded.HAVE_KERNELS if np is not None else False,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares results to the results of a baseline report and returns
+    a list of (name, baseline calls/sec, calls/sec, relative change)
+    for all benchmarks that lost more than `threshold` of their
+    baseline throughput.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['calls_per_sec']
+        after = result['calls_per_sec']
+        change = (after - before) / before
+        if change < -threshold:
+            regressions.append((name, before, after, change))
+    return regressions
+
+
+def main(argv=None):
+    import argparse
+    info = "Run the audiocalc benchmark suite"
+    parser = argparse.ArgumentParser(description=info)
+    parser.add_argument('-s', '--sizes', dest="sizes",
+            default=",".join(str(s) for s in DEFAULT_SIZES),
+            help='Comma separated workload sizes')
+    parser.add_argument('-r', '--repeat', dest="repeat", type=int, default=3,
+            help='Repetitions per benchmark, the best one is reported')
+    parser.add_argument('-f', '--filter', dest="pattern", default=None,
+            help='Only run benchmarks matching this regular expression')
+    parser.add_argument('-o', '--output', dest="output", default=None,
+            help='Write results as JSON to this file')
+    parser.add_argument('-c', '--compare', dest="compare", default=None,
+            help='Compare results to this JSON baseline')
+    parser.add_argument('-t', '--threshold', dest="threshold", type=float,
+            default=DEFAULT_THRESHOLD,
+            help='Relative loss of calls/sec that counts as regression')
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    results = run(sizes=sizes, repeat=args.repeat, pattern=args.pattern,
+                  out=sys.stdout)
+    if args.output:
+        with open(args.output, 'w') as jsonfile:
+            json.dump(report(results), jsonfile, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as jsonfile:
+            baseline = json.load(jsonfile)
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for name, before, after, change in regressions:
+            print("REGRESSION %-49s %14.0f -> %14.0f calls/sec (%+.1f%%)" % (
+                name, before, after, change * 100))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,6 +4,7 @@
 Performance test
 
 Run with -p parameter to activate profiling.
+See audiocalc.benchmark for the full benchmark suite.
 """
 
 import audiocalc
@@ -0,0 +1,178 @@
+# encoding: utf-8
+
+"""
+Chunked reading and writing of columnar data, e.g. weather series,
+spectra and calculation results.
+
+Two file formats are supported, selected by the file extension:
+
+* .csv: comma separated text with a header row of column names.
+  Values must be numeric.
+* .npy: NumPy array file of a structured array with one field per
+  column. It can be memory-mapped with numpy.load(path, mmap_mode='r').
+
+Memory use only depends on the chunk size, not on the file size.
+"""
+
+import itertools
+import os
+import struct
+
+import numpy as np
+
+from .py_audiocalc import BANDS
+
+
+DEFAULT_CHUNK_SIZE = 2 ** 16
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in ('.csv', '.npy'):
+        raise ValueError("Unsupported file format %r, use .csv or .npy" % ext)
+    return ext[1:]
+
+
+def _npy_header(dtype, count, size):
+    """
+    Returns a .npy (version 1.0) header for `count` records of a
+    structured dtype, padded to `size` bytes.
+    """
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(dtype), count)
+    header = header.ljust(size - len(_NPY_MAGIC) - 2 - 1) + '\n'
+    return _NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+class ColumnWriter(object):
+    """
+    Writes columns chunk by chunk to a .csv or .npy file.
+
+    path: file name, the extension selects the format
+    columns: list of column names
+    formats: optional list of printf-style formats per column for
+        .csv files, e.g. ['%d', '%.3f']. Defaults to '%.10g'.
+    dtype: dtype of all columns in .npy files
+    newline: line terminator of .csv files, defaults to '\r\n'
+        like the csv module
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path, columns, formats=None, dtype=float, newline='\r\n'):
+        self.path = path
+        self.columns = list(columns)
+        self.format = _format(path)
+        self.count = 0
+        if formats is None:
+            formats = ['%.10g'] * len(self.columns)
+        if len(formats) != len(self.columns):
+            raise ValueError("Expected one format per column")
+        self.formats = list(formats)
+        self.newline = newline
+        self.dtype = np.dtype([(name, dtype) for name in self.columns])
+        self._file = open(path, 'wb')
+        if self.format == 'csv':
+            self._file.write((",".join(self.columns) + newline).encode('ascii'))
+        else:
+            # room for any record count, aligned to 64 bytes
+            size = len(_npy_header(self.dtype, 10 ** 20, 0)) + 1
+            self._header_size = size + (-size % 64)
+            self._file.write(_npy_header(self.dtype, 0, self._header_size))
+
+    def write(self, chunk):
+        """
+        Writes a chunk of rows.
+
+        chunk: dict of column name to array, or a sequence of arrays
+            in column order. All arrays must have the same length.
+        """
+        if isinstance(chunk, dict):
+            chunk = [chunk[name] for name in self.columns]
+        if len(chunk) != len(self.columns):
+            raise ValueError("Expected %d columns, got %d" % (len(self.columns), len(chunk)))
+        arrays = [np.asarray(a).ravel() for a in chunk]
+        n = arrays[0].size
+        if any(a.size != n for a in arrays):
+            raise ValueError("All columns must have the same length")
+        if self.format == 'csv':
+            np.savetxt(self._file, np.column_stack(arrays), fmt=self.formats,
+                       delimiter=',', newline=self.newline)
+        else:
+            records = np.empty(n, dtype=self.dtype)
+            for name, a in zip(self.columns, arrays):
+                records[name] = a
+            records.tofile(self._file)
+        self.count += n
+
+    def close(self):
+        """
+        Finishes the file. For .npy files, the header is updated
+        with the number of records written.
+        """
+        if self._file.closed:
+            return
+        if self.format == 'npy':
+            self._file.seek(0)
+            self._file.write(_npy_header(self.dtype, self.count, self._header_size))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_columns(path, columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads a .csv or .npy file chunk by chunk and yields a dict of
+    column name to array per chunk. .npy files are memory-mapped,
+    so their chunks are views into the page cache.
+
+    columns: names of the columns to read, defaults to all columns
+    chunk_size: number of rows per chunk
+    """
+    if _format(path) == 'npy':
+        records = np.load(path, mmap_mode='r')
+        names = records.dtype.names if columns is None else columns
+        for start in range(0, records.shape[0], chunk_size):
+            chunk = records[start:start + chunk_size]
+            yield dict((name, chunk[name]) for name in names)
+        return
+
+    with open(path) as csvfile:
+        header = [name.strip() for name in csvfile.readline().strip().split(',')]
+        names = header if columns is None else columns
+        indices = [header.index(name) for name in names]
+        while True:
+            lines = list(itertools.islice(csvfile, chunk_size))
+            if not lines:
+                break
+            data = np.loadtxt(lines, delimiter=',', ndmin=2, usecols=indices)
+            yield dict((name, data[:, i]) for i, name in enumerate(names))
+
+
+def read_spectra(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads octave spectra from a file with one column per band
+    (named like the keys of OCTAVE_BANDS) and yields arrays of shape
+    (rows, len(BANDS)) per chunk. Missing band columns are NaN.
+    """
+    if _format(path) == 'npy':
+        available = np.load(path, mmap_mode='r').dtype.names
+    else:
+        with open(path) as csvfile:
+            available = [name.strip() for name in csvfile.readline().strip().split(',')]
+    present = [band for band in BANDS if band in available]
+    if not present:
+        raise ValueError("%s has no octave band columns" % path)
+    for chunk in read_columns(path, columns=present, chunk_size=chunk_size):
+        n = len(chunk[present[0]])
+        out = np.full((n, len(BANDS)), np.nan)
+        for index, band in enumerate(BANDS):
+            if band in chunk:
+                out[:, index] = chunk[band]
+        yield out
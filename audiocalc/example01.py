@@ -6,8 +6,10 @@ of values describing the damping effect of
 temperature, humidity and distance.
 """
 
-import audiocalc
-import csv
+import numpy as np
+
+from audiocalc import np_audiocalc
+from audiocalc.bulkio import ColumnWriter
 
 # this is our sound source (a Airbus A319 airplane at start, maybe?)
 octave_frequencies = {
@@ -24,16 +26,20 @@ octave_frequencies = {
 # the above values have been measure in this distance:
 reference_distance = 300
 
-with open('example01.csv', 'wb') as csvfile:
-    writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
-    writer.writerow(['humidity', 'temperature', 'distance', 'sound_pressure_level'])
-    for temp in range(35):
-        for hum in range(20, 90):
-            for distance in [500, 1000, 1500, 2000, 2500]:
-                level = audiocalc.distant_total_damped_rated_level(
-                    octave_frequencies=octave_frequencies,
-                    reference_distance=reference_distance,
-                    distance=distance,
-                    temp=temp,
-                    relhum=hum)
-                writer.writerow([str(hum), str(temp), str(distance), "%.3f" % level])
+temps = np.arange(35)
+hums = np.arange(20, 90)
+distances = np.array([500, 1000, 1500, 2000, 2500])
+
+# levels for all combinations, shape (temps, hums, distances)
+levels = np_audiocalc.distant_total_damped_rated_level_grid(
+    octave_frequencies=octave_frequencies,
+    reference_distance=reference_distance,
+    temp=temps,
+    relhum=hums,
+    distance=distances)
+temp, hum, distance = np.meshgrid(temps, hums, distances, indexing='ij')
+
+with ColumnWriter('example01.csv',
+        columns=['humidity', 'temperature', 'distance', 'sound_pressure_level'],
+        formats=['%d', '%d', '%d', '%.3f']) as writer:
+    writer.write([hum, temp, distance, levels])
@@ -0,0 +1,93 @@
+# encoding: utf-8
+
+"""
+Level time histories of moving sources, e.g. aircraft flyovers,
+at a fixed receiver, and the single event levels Lmax and SEL.
+
+The source is treated as a point source with the same spectrum in all
+directions. Doppler shift and propagation time are neglected.
+"""
+
+import collections
+
+import numpy as np
+
+from . import np_audiocalc
+
+
+# Result of flyover(). level has the shape of the trajectory samples,
+# lmax and sel one value per track.
+FlyoverResult = collections.namedtuple(
+    'FlyoverResult', ['distance', 'level', 'lmax', 'sel'])
+
+
+def sound_exposure_level(times, levels, reference_duration=1.0):
+    """
+    Calculates the sound exposure level of level time histories along
+    the last axis: the level of a constant sound of reference_duration
+    seconds with the same energy. The energy is integrated with the
+    trapezoidal rule, so samples don't need to be evenly spaced.
+
+    times: sample times in seconds, broadcastable to levels
+    levels: levels in dB
+    """
+    times = np.asarray(times, dtype=float)
+    levels = np.asarray(levels, dtype=float)
+    energy = np.power(10.0, levels / 10.0)
+    exposure = (0.5 * (energy[..., 1:] + energy[..., :-1]) * np.diff(times, axis=-1)).sum(axis=-1)
+    with np.errstate(divide='ignore'):
+        return 10.0 * np.log10(exposure / reference_duration)
+
+
+def flyover(
+            times,
+            positions,
+            receiver,
+            octave_frequencies,
+            reference_distance,
+            temp,
+            relhum,
+            pres=101325,
+            min_distance=1.0):
+    """
+    Calculates the damped, A-rated level at a receiver over the
+    samples of one or many source trajectories, and the Lmax and SEL
+    of each track.
+
+    times: sample times in seconds, shape (n,) or (..., n)
+    positions: source positions in meters, shape (..., n, 3)
+    receiver: receiver position in meters, shape (3,)
+    octave_frequencies: band levels in the reference distance, a dict,
+        OctaveSpectrum or an array of shape (..., len(BANDS)) with one
+        spectrum per track
+    reference_distance: reference distance in meters
+    temp, relhum, pres: weather, constant over each track: scalars
+        or arrays of the track shape (...)
+    min_distance: distances are clamped to at least this value
+
+    The damping is calculated once per track weather, not per sample.
+    Returns a FlyoverResult with distance and level of shape (..., n),
+    lmax and sel of shape (...).
+    """
+    positions = np.asarray(positions, dtype=float)
+    receiver = np.asarray(receiver, dtype=float)
+    distance = np.sqrt(np.square(positions - receiver).sum(axis=-1))
+    np.maximum(distance, min_distance, out=distance)
+
+    absorption = np_audiocalc.band_damping(temp, relhum, pres)
+    source_energy = np_audiocalc._source_energy(octave_frequencies)
+    if source_energy.ndim > 1:
+        # one spectrum per track, the same for all of its samples
+        source_energy = source_energy[..., np.newaxis, :]
+    energy = np_audiocalc._damped_rated_energy(
+        source_energy,
+        absorption[..., np.newaxis, :],
+        distance,
+        reference_distance)
+    with np.errstate(divide='ignore'):
+        level = 10.0 * np.log10(energy)
+    return FlyoverResult(
+        distance,
+        level,
+        level.max(axis=-1),
+        sound_exposure_level(times, level))
@@ -0,0 +1,203 @@
+# encoding: utf-8
+
+"""
+Long-term noise indicators (Lday, Levening, Lnight, Lden) of
+time-stamped level logs.
+
+The logs are consumed chunk by chunk, e.g. from bulkio.read_columns().
+Levels are accumulated as energy sums per hour, so memory depends on
+the number of hours covered (8760 per year), not on the number of
+levels. Partial aggregates of several files or workers can be merged.
+
+Like leq3(), levels of 0 dB count as samples without energy.
+"""
+
+import collections
+
+import numpy as np
+
+from .leq import _energy_leq, _level_energy
+
+
+# A period of the day. start and end are hours of the (local) day,
+# end may be smaller than start for periods spanning midnight.
+# penalty in dB is added to the period level in the weighted
+# day-evening-night level.
+Period = collections.namedtuple('Period', ['name', 'start', 'end', 'penalty'])
+
+# Periods of the EU Environmental Noise Directive 2002/49/EC
+DEFAULT_PERIODS = (
+    Period('day', 7, 19, 0.0),
+    Period('evening', 19, 23, 5.0),
+    Period('night', 23, 7, 10.0),
+)
+
+# name of the weighted day-evening-night level in results
+DEN = 'den'
+
+
+def _seconds(timestamps):
+    """
+    Returns timestamps as float POSIX seconds. Accepts numbers
+    (seconds) and numpy datetime64 values.
+    """
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.datetime64):
+        return (timestamps - np.datetime64(0, 's')) / np.timedelta64(1, 's')
+    return timestamps.astype(float)
+
+
+class IndicatorAggregator(object):
+    """
+    Aggregates time-stamped levels into hourly energy sums and
+    calculates period levels and the weighted level over all
+    periods ('den') from them.
+
+    periods: sequence of Period covering the 24 hours of a day
+        without overlaps, defaults to DEFAULT_PERIODS
+    utc_offset: offset of local time to the timestamps in seconds,
+        e.g. 3600 for timestamps in UTC and periods in CET
+
+    A reporting day starts with the first period, so with the default
+    periods the night from 23:00 to 07:00 belongs to the day before.
+    """
+
+    def __init__(self, periods=DEFAULT_PERIODS, utc_offset=0):
+        self.periods = tuple(Period(*period) for period in periods)
+        self.utc_offset = utc_offset
+        # period index of every hour of the day
+        self._hour_period = np.full(24, -1, dtype=int)
+        for index, period in enumerate(self.periods):
+            hours = np.arange(period.start, period.end + (24 if period.end <= period.start else 0))
+            if np.any(self._hour_period[hours % 24] >= 0):
+                raise ValueError("Period %r overlaps another period" % period.name)
+            self._hour_period[hours % 24] = index
+        if np.any(self._hour_period < 0):
+            raise ValueError("The periods must cover all 24 hours of a day")
+        self._day_start = self.periods[0].start
+        # local hour number (since the epoch) to [count, energy]
+        self._hours = {}
+
+    def update(self, timestamps, levels):
+        """
+        Adds levels in dB with their timestamps.
+
+        timestamps: POSIX seconds or numpy datetime64 values
+        levels: levels, same length as timestamps
+        """
+        seconds = _seconds(timestamps).ravel()
+        levels = np.asarray(levels, dtype=float).ravel()
+        if seconds.shape != levels.shape:
+            raise ValueError("Expected one timestamp per level")
+        if not levels.size:
+            return
+        hours = np.floor((seconds + self.utc_offset) / 3600.0).astype(np.int64)
+        keys, inverse = np.unique(hours, return_inverse=True)
+        energies = _level_energy(levels)
+        counts = np.bincount(inverse, minlength=keys.size)
+        sums = np.bincount(inverse, weights=energies, minlength=keys.size)
+        for key, count, energy in zip(keys.tolist(), counts.tolist(), sums.tolist()):
+            state = self._hours.get(key)
+            if state is None:
+                self._hours[key] = [count, energy]
+            else:
+                state[0] += count
+                state[1] += energy
+
+    def merge(self, other):
+        """
+        Adds the hourly sums of another aggregator with the same
+        periods and utc_offset. Returns self.
+        """
+        if other.periods != self.periods or other.utc_offset != self.utc_offset:
+            raise ValueError("Can only merge aggregators with the same periods and utc_offset")
+        for key, (count, energy) in other._hours.items():
+            state = self._hours.get(key)
+            if state is None:
+                self._hours[key] = [count, energy]
+            else:
+                state[0] += count
+                state[1] += energy
+        return self
+
+    def _arrays(self):
+        """
+        Returns local hour numbers, counts and energy sums as
+        arrays sorted by hour.
+        """
+        keys = np.array(sorted(self._hours), dtype=np.int64)
+        counts = np.array([self._hours[key][0] for key in keys.tolist()], dtype=float)
+        energies = np.array([self._hours[key][1] for key in keys.tolist()], dtype=float)
+        return keys, counts, energies
+
+    def _timestamps(self, local_hours):
+        return local_hours * 3600.0 - self.utc_offset
+
+    def hourly(self):
+        """
+        Returns a dict with the columns 'start' (POSIX seconds of the
+        start of the hour) and 'leq' (Leq3 of the hour), for all hours
+        with levels.
+        """
+        keys, counts, energies = self._arrays()
+        leq = np.array([_energy_leq(e, n) for e, n in zip(energies.tolist(), counts.tolist())])
+        return {'start': self._timestamps(keys), 'leq': leq}
+
+    def _period_levels(self, group, size):
+        """
+        Sums the hours per group and period and returns an array of
+        shape (size, len(periods)) of period levels, NaN for periods
+        without levels.
+        """
+        keys, counts, energies = self._arrays()
+        index = group * len(self.periods) + self._hour_period[keys % 24]
+        length = size * len(self.periods)
+        counts = np.bincount(index, weights=counts, minlength=length)
+        energies = np.bincount(index, weights=energies, minlength=length)
+        levels = np.full(length, np.nan)
+        for i in np.flatnonzero(counts).tolist():
+            levels[i] = _energy_leq(energies[i], counts[i])
+        return levels.reshape(size, len(self.periods))
+
+    def _den(self, levels):
+        """
+        Returns the weighted level of period levels (last axis),
+        with the penalties and period durations as weights.
+        """
+        hours = np.array([(period.end - period.start) % 24 or 24 for period in self.periods])
+        penalties = np.array([period.penalty for period in self.periods])
+        return 10.0 * np.log10(np.sum(
+            hours / 24.0 * np.power(10.0, (levels + penalties) / 10.0), axis=-1))
+
+    def daily(self):
+        """
+        Returns a dict of columns with one row per reporting day with
+        levels: 'start' (POSIX seconds of the start of the first
+        period), one column of Leq3 values per period name (NaN if
+        the period has no levels) and 'den'.
+        """
+        keys = self._arrays()[0]
+        if not keys.size:
+            result = {'start': np.zeros(0), DEN: np.zeros(0)}
+            result.update((period.name, np.zeros(0)) for period in self.periods)
+            return result
+        days = (keys - self._day_start) // 24
+        unique_days, group = np.unique(days, return_inverse=True)
+        levels = self._period_levels(group, unique_days.size)
+        result = {'start': self._timestamps(unique_days * 24 + self._day_start)}
+        for index, period in enumerate(self.periods):
+            result[period.name] = levels[:, index]
+        result[DEN] = self._den(levels)
+        return result
+
+    def levels(self):
+        """
+        Returns a dict of the long-term Leq3 per period name over all
+        levels added so far, and the weighted level 'den' of them.
+        Periods without levels are NaN.
+        """
+        keys = self._arrays()[0]
+        levels = self._period_levels(np.zeros(keys.size, dtype=int), 1)[0]
+        result = dict((period.name, float(level)) for period, level in zip(self.periods, levels))
+        result[DEN] = float(self._den(levels))
+        return result
@@ -0,0 +1,273 @@
+# encoding: utf-8
+
+"""
+Opt-in instrumentation of the calculation functions.
+
+When enabled, the functions listed in FUNCTIONS are replaced in the
+backend modules by wrappers that count calls, sum up the time spent
+and count input sizes in power-of-two buckets. The input size of a
+call is the number of elements of its broadcast array arguments, with
+a spectrum of octave band levels counting as one input. When disabled (the
+default), the original functions are in place and cost nothing extra.
+
+Enable with enable() or by setting the environment variable
+AUDIOCALC_INSTRUMENT to a non-empty value before importing audiocalc.
+snapshot() returns the statistics, including those of the damping
+cache, as a dict; snapshot_json() as JSON.
+
+Times are inclusive: a function calling other instrumented functions
+counts their time as well. Calls between functions of the compiled
+backend are not seen by the wrappers.
+"""
+
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+
+
+ENV_VAR = 'AUDIOCALC_INSTRUMENT'
+
+# modules instrumented by default, relative to this package.
+# Modules that can't be imported (e.g. without NumPy) are skipped.
+MODULES = ('.py_audiocalc', '.np_audiocalc', '._audiocalc', '.threaded', '.weather')
+
+# names of the functions instrumented in each module, if present
+FUNCTIONS = (
+    'damping',
+    'band_damping',
+    'total_level',
+    'total_rated_level',
+    'leq3',
+    'distant_level',
+    'distant_total_damped_rated_level',
+    'distant_total_damped_rated_level_grid',
+    'threshold_distance',
+    'level_to_power',
+    'damping_batch',
+    'total_rated_level_batch',
+    'distant_total_damped_rated_level_batch',
+)
+
+_lock = threading.Lock()
+# (module, name) to original function, while enabled
+_originals = {}
+# qualified function name to _Stats
+_stats = {}
+
+
+class _Stats(object):
+
+    __slots__ = ('calls', 'seconds', 'sizes')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        # power of two to number of calls with an input size up to it
+        self.sizes = {}
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'seconds': self.seconds,
+            'sizes': dict((str(bucket), count) for bucket, count in sorted(self.sizes.items())),
+        }
+
+
+# functions whose first argument is an octave spectrum: a dict, an
+# OctaveSpectrum or an array of shape (..., len(BANDS)) of band levels.
+# A spectrum counts as one input, not as len(BANDS).
+_SPECTRUM_FUNCTIONS = frozenset([
+    'total_rated_level',
+    'distant_total_damped_rated_level',
+    'distant_total_damped_rated_level_grid',
+    'threshold_distance',
+    'total_rated_level_batch',
+    'distant_total_damped_rated_level_batch',
+])
+
+# names the spectrum argument is passed as by keyword
+_SPECTRUM_ARGS = ('octave_frequencies', 'band_levels')
+
+# positions of the temp, relhum and distance axes of
+# distant_total_damped_rated_level_grid
+_GRID_AXES = ((2, 'temp'), (3, 'relhum'), (4, 'distance'))
+
+
+def _shape(value):
+    """
+    Returns the shape of an array, (len,) of a list or tuple,
+    () of anything else.
+    """
+    shape = getattr(value, 'shape', None)
+    if isinstance(shape, tuple):
+        return shape
+    if isinstance(value, (list, tuple)):
+        return (len(value),)
+    return ()
+
+
+def _product(values):
+    result = 1
+    for value in values:
+        result *= value
+    return result
+
+
+def _broadcast_size(shapes):
+    """
+    Returns the number of elements of the broadcast shape, or the
+    largest size if the shapes don't broadcast.
+    """
+    ndim = max(len(shape) for shape in shapes)
+    result = []
+    for dim in range(-ndim, 0):
+        lengths = set(shape[dim] for shape in shapes if len(shape) >= -dim) - set([1])
+        if len(lengths) > 1:
+            return max(_product(shape) for shape in shapes)
+        result.append(lengths.pop() if lengths else 1)
+    return _product(result)
+
+
+def _input_size(name, args, kwargs):
+    """
+    Returns the number of inputs of a call: the size of the broadcast
+    shape of all array and sequence arguments, with spectra counted
+    once per spectrum, and the number of grid cells of the grid
+    evaluator.
+    """
+    args = list(args)
+    kwargs = dict(kwargs)
+    if name == 'distant_total_damped_rated_level_grid' and kwargs.get(
+            'grid', args[6] if len(args) > 6 else True):
+        return _product(
+            _product(_shape(args[index] if index < len(args) else kwargs.get(key)))
+            for index, key in _GRID_AXES)
+    shapes = []
+    if name in _SPECTRUM_FUNCTIONS:
+        spectrum = args.pop(0) if args else None
+        for key in _SPECTRUM_ARGS:
+            spectrum = kwargs.pop(key, spectrum)
+        shapes.append(_shape(spectrum)[:-1])
+    shapes.extend(_shape(value) for value in args + list(kwargs.values()))
+    if not shapes:
+        return 0
+    return _broadcast_size(shapes)
+
+
+def _wrap(func, name):
+    stats = _stats.setdefault(name, _Stats())
+    func_name = name.rpartition('.')[2]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - started
+            size = _input_size(func_name, args, kwargs)
+            bucket = 1 << max(size - 1, 0).bit_length()
+            with _lock:
+                stats.calls += 1
+                stats.seconds += seconds
+                stats.sizes[bucket] = stats.sizes.get(bucket, 0) + 1
+
+    return wrapper
+
+
+def enabled():
+    """
+    Returns whether the instrumentation is enabled.
+    """
+    return bool(_originals)
+
+
+def enable(modules=MODULES):
+    """
+    Replaces the functions of the given modules by instrumented
+    wrappers. Does nothing for modules that are already instrumented.
+
+    modules: module names, absolute or relative to this package
+    """
+    for module_name in modules:
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError:
+            continue
+        short_name = module.__name__.rpartition('.')[2]
+        for name in FUNCTIONS:
+            func = getattr(module, name, None)
+            if func is None or (module, name) in _originals:
+                continue
+            _originals[(module, name)] = func
+            setattr(module, name, _wrap(func, '%s.%s' % (short_name, name)))
+    _forget_resolved()
+
+
+def disable():
+    """
+    Restores the original functions. The statistics are kept
+    until reset() is called.
+    """
+    for (module, name), func in list(_originals.items()):
+        setattr(module, name, func)
+        del _originals[(module, name)]
+    _forget_resolved()
+
+
+def _forget_resolved():
+    """
+    Drops the functions the audiocalc package has resolved from its
+    backend, so the next lookup gets the current (wrapped or original)
+    function.
+    """
+    package = sys.modules.get(__package__)
+    if package is not None:
+        from . import backends
+        for api_name in backends.API:
+            package.__dict__.pop(api_name, None)
+
+
+def reset():
+    """
+    Resets all statistics.
+    """
+    with _lock:
+        for stats in _stats.values():
+            stats.calls = 0
+            stats.seconds = 0.0
+            stats.sizes.clear()
+
+
+def snapshot():
+    """
+    Returns the statistics as a dict with the entries
+    'enabled', 'functions' (qualified function name to calls,
+    cumulative seconds and input size buckets) and 'damping_cache'
+    (see damping_cache_info, None if the cache is disabled).
+    Only functions that have been called are listed.
+    """
+    from . import py_audiocalc
+    with _lock:
+        functions = dict(
+            (name, stats.as_dict()) for name, stats in _stats.items() if stats.calls)
+    cache = py_audiocalc.damping_cache_info()
+    if cache is not None:
+        lookups = cache['hits'] + cache['misses']
+        cache['hit_rate'] = cache['hits'] / lookups if lookups else 0.0
+    return {
+        'enabled': enabled(),
+        'functions': functions,
+        'damping_cache': cache,
+    }
+
+
+def snapshot_json(**kwargs):
+    """
+    Returns snapshot() as a JSON string. Keyword arguments are
+    passed to json.dumps.
+    """
+    return json.dumps(snapshot(), **kwargs)
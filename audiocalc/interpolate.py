@@ -0,0 +1,77 @@
+# encoding: utf-8
+
+"""
+Multilinear interpolation in tables on rectilinear grids,
+shared by the approximate and the precomputed table modes.
+"""
+
+import itertools
+
+import numpy as np
+
+
+def _locate(axis, x):
+    """
+    Returns the index of the grid cell containing x (clamped to the
+    first and last cell) and the relative position of x in the cell,
+    NaN for NaN coordinates.
+    Regularly spaced axes are located arithmetically, others by
+    binary search.
+    """
+    n = axis.shape[0]
+    step = (axis[-1] - axis[0]) / (n - 1)
+    if np.allclose(np.diff(axis), step, rtol=1e-9, atol=0.0):
+        # clip before the cast, NaN would become the smallest integer
+        index = np.clip(np.nan_to_num(np.floor((x - axis[0]) / step)), 0, n - 2).astype(np.intp)
+    else:
+        index = np.clip(np.searchsorted(axis, x, 'right') - 1, 0, n - 2)
+    weight = (x - axis[index]) / (axis[index + 1] - axis[index])
+    return index, weight
+
+
+def inside(axes, points):
+    """
+    Returns a boolean array, True where all coordinates of the points
+    are within the range of their axis.
+
+    axes: sequence of ascending 1-D axes
+    points: sequence of coordinate arrays, one per axis,
+        broadcast against each other
+    """
+    result = True
+    for axis, x in zip(axes, points):
+        x = np.asarray(x, dtype=float)
+        result = result & (x >= axis[0]) & (x <= axis[-1])
+    return np.asarray(result)
+
+
+def multilinear(axes, values, points):
+    """
+    Interpolates a table multilinearly.
+
+    axes: sequence of d ascending 1-D axes with at least two
+        points each
+    values: array of shape (len(axes[0]), ..., len(axes[d - 1]))
+        + value_shape
+    points: sequence of d coordinate arrays, broadcast against
+        each other. Points outside the axes are extrapolated
+        linearly from the outermost cell.
+
+    Returns an array of shape broadcast shape + value_shape.
+    """
+    if len(axes) != len(points):
+        raise ValueError("Expected one coordinate array per axis")
+    axes = [np.asarray(axis, dtype=float) for axis in axes]
+    points = np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in points])
+    located = [_locate(axis, x) for axis, x in zip(axes, points)]
+    value_dims = values.ndim - len(axes)
+    result = 0.0
+    for corner in itertools.product((0, 1), repeat=len(axes)):
+        weight = 1.0
+        index = []
+        for offset, (cell, position) in zip(corner, located):
+            weight = weight * (position if offset else 1.0 - position)
+            index.append(cell + offset)
+        weight = np.asarray(weight).reshape(np.shape(weight) + (1,) * value_dims)
+        result = result + weight * values[tuple(index)]
+    return result
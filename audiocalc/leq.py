@@ -0,0 +1,288 @@
+# encoding: utf-8
+
+"""
+Incremental calculation of the energy-equivalent level (Leq3)
+and statistical levels for level series that don't fit into memory
+or arrive one by one.
+"""
+
+import collections
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _level_energy(level):
+    """
+    Returns the energy of a level, or an array of energies for a NumPy
+    array of levels: zero for levels of 0 like leq3 does, inf for
+    levels whose energy overflows.
+    """
+    if np is not None and isinstance(level, np.ndarray):
+        with np.errstate(over='ignore'):
+            return np.where(level == 0, 0.0, np.power(10.0, level / 10.0))
+    if level == 0:
+        return 0.0
+    try:
+        return pow(10.0, float(level) / 10.0)
+    except OverflowError:
+        return math.inf
+
+
+def _fsum(values):
+    """
+    Returns math.fsum of values, NaN if they contain inf and -inf.
+    """
+    try:
+        return math.fsum(values)
+    except ValueError:
+        return math.nan
+
+
+def _energy_leq(energy, n):
+    """
+    Converts an energy sum over n levels into the Leq3 value.
+    """
+    if energy <= 0.0:
+        return 0.0
+    return max(0.0, 10.0 * math.log10(energy / n))
+
+
+class LeqAccumulator(object):
+    """
+    Accumulates the energy-equivalent (Leq3) value of a level series
+    with constant memory. The value is the same as leq3() of all
+    levels passed to update() and update_many().
+    """
+
+    __slots__ = ('count', 'level_sum', 'energy')
+
+    def __init__(self):
+        self.count = 0
+        self.level_sum = 0.0
+        self.energy = 0.0
+
+    def update(self, level):
+        """
+        Adds a single level in dB.
+        """
+        self.count += 1
+        self.level_sum += level
+        self.energy += _level_energy(level)
+
+    def update_many(self, levels):
+        """
+        Adds a sequence or array of levels in dB.
+        """
+        if np is None:
+            for level in levels:
+                self.update(level)
+            return
+        levels = np.asarray(levels, dtype=float).ravel()
+        self.count += levels.size
+        self.level_sum += float(levels.sum())
+        self.energy += float(_level_energy(levels).sum())
+
+    def merge(self, other):
+        """
+        Adds the state of another accumulator, e.g. one that has
+        been filled by a parallel worker. Returns self.
+        """
+        self.count += other.count
+        self.level_sum += other.level_sum
+        self.energy += other.energy
+        return self
+
+    @property
+    def leq(self):
+        """
+        The energy-equivalent level of all levels added so far.
+        """
+        if self.level_sum == 0.0:
+            return 0.0
+        return _energy_leq(self.energy, self.count)
+
+
+class SlidingLeq(object):
+    """
+    Energy-equivalent (Leq3) value of the latest `window` levels,
+    e.g. a rolling 1-hour Leq over 1-second levels with window=3600.
+
+    Updates take amortized constant time. The energy sum is
+    recalculated from scratch once per window to avoid accumulating
+    rounding errors.
+
+    Like leq3(), the value is 0.0 while the levels in the window sum
+    up to 0.
+    """
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self._levels = collections.deque()
+        self._energies = collections.deque()
+        self._level_sum = 0.0
+        self._energy = 0.0
+        self._updates = 0
+
+    def __len__(self):
+        return len(self._energies)
+
+    def update(self, level):
+        """
+        Adds a single level in dB, dropping the oldest level
+        once the window is full.
+        """
+        level = float(level)
+        energy = _level_energy(level)
+        self._levels.append(level)
+        self._energies.append(energy)
+        self._level_sum += level
+        self._energy += energy
+        if len(self._energies) > self.window:
+            self._level_sum -= self._levels.popleft()
+            self._energy -= self._energies.popleft()
+        self._updates += 1
+        if self._updates >= self.window:
+            self._updates = 0
+            self._level_sum = _fsum(self._levels)
+            self._energy = _fsum(self._energies)
+        elif not (math.isfinite(self._level_sum) and math.isfinite(self._energy)):
+            # inf - inf is NaN, recalculate while infinite values are in the window
+            self._level_sum = _fsum(self._levels)
+            self._energy = _fsum(self._energies)
+
+    def update_many(self, levels):
+        """
+        Adds a sequence or array of levels in dB.
+        """
+        if np is not None:
+            levels = np.asarray(levels, dtype=float).ravel()
+            if levels.size >= self.window:
+                # only the latest levels remain in the window. The sums
+                # are recalculated from scratch, and the update counter
+                # advances as if the levels were added one by one.
+                self._updates = (self._updates + levels.size) % self.window
+                levels = levels[-self.window:]
+                self._levels = collections.deque(levels.tolist())
+                self._energies = collections.deque(_level_energy(levels).tolist())
+                self._level_sum = _fsum(self._levels)
+                self._energy = _fsum(self._energies)
+                return
+        for level in levels:
+            self.update(level)
+
+    @property
+    def leq(self):
+        """
+        The energy-equivalent level of the levels in the window.
+        """
+        if self._level_sum == 0.0:
+            return 0.0
+        return _energy_leq(self._energy, len(self._energies))
+
+
+class LevelStatistics(object):
+    """
+    Accumulates statistical levels of a level series with constant
+    memory: the levels exceeded N percent of the time (L10, L50, L90,
+    ...), the minimum and maximum level and the Leq3, all from one
+    pass over the data. Requires NumPy.
+
+    Levels are counted in a histogram of `resolution` dB bins from
+    min_level to max_level, levels outside are counted in the first
+    or last bin. L_N values are interpolated within their bin, so
+    they are accurate to the bin width. lmin, lmax and leq are exact.
+    """
+
+    def __init__(self, resolution=0.1, min_level=0.0, max_level=200.0):
+        if np is None:
+            raise ImportError("LevelStatistics requires numpy")
+        if resolution <= 0 or max_level <= min_level:
+            raise ValueError("Expected resolution > 0 and max_level > min_level")
+        self.resolution = float(resolution)
+        self.min_level = float(min_level)
+        self.max_level = float(max_level)
+        bins = int(math.ceil((self.max_level - self.min_level) / self.resolution))
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.lmin = math.inf
+        self.lmax = -math.inf
+        self._leq = LeqAccumulator()
+
+    @property
+    def count(self):
+        """
+        The number of levels added so far.
+        """
+        return self._leq.count
+
+    def update(self, level):
+        """
+        Adds a single level in dB.
+        """
+        self.update_many([level])
+
+    def update_many(self, levels):
+        """
+        Adds a sequence or array of levels in dB.
+        """
+        levels = np.asarray(levels, dtype=float).ravel()
+        if not levels.size:
+            return
+        index = np.floor((levels - self.min_level) / self.resolution).astype(np.intp)
+        np.clip(index, 0, self.counts.size - 1, out=index)
+        self.counts += np.bincount(index, minlength=self.counts.size)
+        self.lmin = min(self.lmin, float(levels.min()))
+        self.lmax = max(self.lmax, float(levels.max()))
+        self._leq.update_many(levels)
+
+    def merge(self, other):
+        """
+        Adds the state of another LevelStatistics with the same bins,
+        e.g. one that has been filled by a parallel worker. Returns self.
+        """
+        if (other.resolution, other.min_level, other.counts.size) != (
+                self.resolution, self.min_level, self.counts.size):
+            raise ValueError("Can only merge LevelStatistics with the same bins")
+        self.counts += other.counts
+        self.lmin = min(self.lmin, other.lmin)
+        self.lmax = max(self.lmax, other.lmax)
+        self._leq.merge(other._leq)
+        return self
+
+    @property
+    def leq(self):
+        """
+        The energy-equivalent level of all levels added so far.
+        """
+        return self._leq.leq
+
+    def ln(self, n):
+        """
+        Returns the level exceeded by n percent of the levels,
+        e.g. ln(90) for L90. NaN if no levels have been added.
+        """
+        if not 0 <= n <= 100:
+            raise ValueError("n must be between 0 and 100")
+        total = self.count
+        if total == 0:
+            return math.nan
+        # number of levels at or above the result
+        above = n / 100.0 * total
+        # count of levels in and above each bin
+        cumulative = np.cumsum(self.counts[::-1])[::-1]
+        index = max(int(np.searchsorted(-cumulative, -above, 'right')) - 1, 0)
+        upper = cumulative[index + 1] if index + 1 < cumulative.size else 0
+        fraction = (above - upper) / self.counts[index] if self.counts[index] else 0.0
+        level = self.min_level + (index + 1 - fraction) * self.resolution
+        return min(max(float(level), self.lmin), self.lmax)
+
+    def percentiles(self, ns=(10, 50, 90)):
+        """
+        Returns a dict of 'L<n>' to ln(n) for all n in ns.
+        """
+        return dict(('L%g' % n, self.ln(n)) for n in ns)
@@ -0,0 +1,212 @@
+# encoding: utf-8
+
+"""
+Monte Carlo propagation of weather and source uncertainty to the
+damped, A-rated level.
+
+Samples are drawn and evaluated in fixed-size chunks and reduced on
+the fly into count, mean, variance and a level histogram (see
+leq.LevelStatistics), so memory does not depend on the number of
+samples. Every chunk has its own random generator spawned from one
+seed, so results are reproducible and don't depend on the number
+of processes.
+"""
+
+import collections
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import np_audiocalc
+from .leq import LevelStatistics
+from .py_audiocalc import BANDS, OctaveSpectrum
+
+
+class Normal(collections.namedtuple('Normal', ['mean', 'std'])):
+    """
+    Normal distribution.
+    """
+
+    def sample(self, rng, size):
+        return rng.normal(self.mean, self.std, size)
+
+
+class Uniform(collections.namedtuple('Uniform', ['low', 'high'])):
+    """
+    Uniform distribution between low and high.
+    """
+
+    def sample(self, rng, size):
+        return rng.uniform(self.low, self.high, size)
+
+
+def _sample(value, rng, size):
+    """
+    Draws `size` samples of a distribution, or repeats a constant.
+    """
+    if hasattr(value, 'sample'):
+        return np.asarray(value.sample(rng, size), dtype=float)
+    return np.full(size, float(value))
+
+
+def _band_distributions(octave_frequencies):
+    """
+    Returns a list of (band index, level or distribution) tuples
+    for all bands with a level, ordered like BANDS.
+    """
+    if isinstance(octave_frequencies, OctaveSpectrum):
+        return list(octave_frequencies.band_items)
+    return [(index, octave_frequencies[band]) for index, band in enumerate(BANDS)
+            if octave_frequencies.get(band) is not None]
+
+
+class MonteCarloResult(object):
+    """
+    Running statistics of sampled levels: count, mean and variance
+    (merged with the parallel algorithm of Chan et al.), and a
+    histogram of the levels for percentiles.
+
+    resolution: bin width of the level histogram in dB
+    """
+
+    def __init__(self, resolution=0.1):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.statistics = LevelStatistics(resolution=resolution)
+
+    def update(self, levels):
+        """
+        Adds an array of levels in dB.
+        """
+        levels = np.asarray(levels, dtype=float).ravel()
+        if not levels.size:
+            return
+        chunk = MonteCarloResult(self.statistics.resolution)
+        chunk.count = levels.size
+        chunk.mean = float(levels.mean())
+        chunk._m2 = float(np.square(levels - chunk.mean).sum())
+        chunk.statistics.update_many(levels)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Adds the state of another result. Returns self.
+        """
+        count = self.count + other.count
+        if count:
+            delta = other.mean - self.mean
+            self._m2 += other._m2 + delta * delta * self.count * other.count / count
+            self.mean += delta * other.count / count
+        self.count = count
+        self.statistics.merge(other.statistics)
+        return self
+
+    @property
+    def std(self):
+        """
+        The sample standard deviation of the levels.
+        """
+        if self.count < 2:
+            return float('nan')
+        return (self._m2 / (self.count - 1)) ** 0.5
+
+    def percentile(self, q):
+        """
+        Returns the level below which q percent of the samples lie,
+        accurate to the histogram resolution.
+        """
+        return self.statistics.ln(100.0 - q)
+
+    def interval(self, confidence=0.95):
+        """
+        Returns the central interval (low, high) containing
+        `confidence` of the samples.
+        """
+        tail = (1.0 - confidence) / 2.0 * 100.0
+        return self.percentile(tail), self.percentile(100.0 - tail)
+
+
+def _evaluate_chunk(band_items, distance, temp, relhum, reference_distance,
+                    pres, size, seed, resolution):
+    """
+    Draws and evaluates one chunk of samples and returns its
+    MonteCarloResult.
+    """
+    rng = np.random.default_rng(seed)
+    temp = _sample(temp, rng, size)
+    relhum = _sample(relhum, rng, size)
+    pres = _sample(pres, rng, size)
+    distance = _sample(distance, rng, size)
+    band_levels = np.full((size, len(BANDS)), np.nan)
+    for index, level in band_items:
+        band_levels[:, index] = _sample(level, rng, size)
+    energy = np_audiocalc._damped_rated_energy(
+        np_audiocalc._source_energy(band_levels),
+        np_audiocalc.band_damping(temp, relhum, pres),
+        distance,
+        reference_distance)
+    result = MonteCarloResult(resolution)
+    result.update(10.0 * np.log10(energy))
+    return result
+
+
+def monte_carlo(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325,
+            samples=10 ** 6,
+            chunk_size=2 ** 16,
+            seed=None,
+            processes=None,
+            max_pending=None,
+            resolution=0.1):
+    """
+    Propagates uncertain inputs to the damped, A-rated total sound
+    pressure level (see distant_total_damped_rated_level) by Monte
+    Carlo sampling and returns a MonteCarloResult.
+
+    octave_frequencies: dict of band name to a level or a distribution
+    distance, temp, relhum, pres: constants or distributions
+        (Normal, Uniform or any object with a sample(rng, size)
+        method returning an array)
+    reference_distance: reference distance in meters
+    samples: number of samples
+    chunk_size: number of samples evaluated at once
+    seed: seed of numpy.random.SeedSequence. Chunk i draws from the
+        i-th spawned generator, so results only depend on seed,
+        samples and chunk_size.
+    processes: number of worker processes. With None (the default),
+        0 or 1, all chunks are evaluated in this process.
+    max_pending: maximum number of chunks submitted but not yet
+        reduced. Defaults to 2 * processes.
+    resolution: bin width of the level histogram in dB
+    """
+    sizes = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = (_band_distributions(octave_frequencies), distance, temp, relhum, reference_distance, pres)
+    chunks = ((size, chunk_seed, resolution) for size, chunk_seed in zip(sizes, seeds))
+    result = MonteCarloResult(resolution)
+
+    if processes is None or processes <= 1:
+        for chunk in chunks:
+            result.merge(_evaluate_chunk(*(args + chunk)))
+        return result
+
+    if max_pending is None:
+        max_pending = 2 * processes
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = collections.deque()
+        while True:
+            for chunk in chunks:
+                pending.append(executor.submit(_evaluate_chunk, *(args + chunk)))
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                break
+            # merge in chunk order, so the result does not depend on timing
+            result.merge(pending.popleft().result())
+    return result
@@ -0,0 +1,104 @@
+# encoding: utf-8
+
+"""
+Noise maps: the A-rated total sound pressure level of many point
+sources on a regular grid of receivers.
+"""
+
+import collections
+
+import numpy as np
+
+from . import np_audiocalc
+
+
+# A point source. position is (x, y) or (x, y, z) in meters,
+# octave_frequencies the band levels measured at reference_distance.
+PointSource = collections.namedtuple(
+    'PointSource', ['position', 'octave_frequencies', 'reference_distance'])
+
+
+def cull_radius(source, floor, temp, relhum, pres=101325):
+    """
+    Returns the distance beyond which the damped, A-rated level of
+    a source is below `floor` dB.
+    """
+    return float(np_audiocalc.threshold_distance(
+        source.octave_frequencies, source.reference_distance, floor,
+        temp, relhum, pres))
+
+
+def noise_map(
+            sources,
+            x,
+            y,
+            temp,
+            relhum,
+            pres=101325,
+            receiver_height=0.0,
+            floor=None,
+            min_distance=1.0):
+    """
+    Calculates the energetically summed, damped, A-rated sound pressure
+    level of all sources at every receiver of a grid. Returns an array
+    of shape (len(y), len(x)). Receivers without any contribution get
+    -inf.
+
+    sources: sequence of PointSource (or tuples of the same fields)
+    x, y: ascending 1-D axes of the receiver grid in meters
+    temp, relhum, pres: weather, the same for all paths
+    receiver_height: z coordinate of all receivers in meters
+    floor: optional level in dB. Contributions below it are skipped:
+        only receivers within the distance at which a source drops to
+        this level (see cull_radius) are evaluated for that source.
+        The receiver grid is used as spatial index, so the receivers
+        in range are found without looking at the others.
+    min_distance: distances are clamped to at least this value,
+        to avoid infinite levels at receivers on top of a source
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    absorption = np_audiocalc.band_damping(temp, relhum, pres)
+    energy = np.zeros((y.size, x.size))
+
+    for source in sources:
+        source = PointSource(*source)
+        position = tuple(source.position) + (0.0,) * (3 - len(source.position))
+        sx, sy, sz = [float(c) for c in position]
+        dz = sz - receiver_height
+        reference_distance = float(source.reference_distance)
+        source_energy = np_audiocalc._source_energy(source.octave_frequencies)
+
+        if floor is None:
+            ix, iy = slice(None), slice(None)
+            radius = np.inf
+        else:
+            radius = cull_radius(source, floor, temp, relhum, pres)
+            if abs(dz) > radius:
+                continue
+            horizontal = np.sqrt(radius ** 2 - dz ** 2)
+            ix = slice(np.searchsorted(x, sx - horizontal, 'left'),
+                       np.searchsorted(x, sx + horizontal, 'right'))
+            iy = slice(np.searchsorted(y, sy - horizontal, 'left'),
+                       np.searchsorted(y, sy + horizontal, 'right'))
+            if ix.start >= ix.stop or iy.start >= iy.stop:
+                continue
+
+        distance = np.sqrt(
+            (x[ix] - sx)[np.newaxis, :] ** 2 +
+            (y[iy] - sy)[:, np.newaxis] ** 2 +
+            dz ** 2)
+        np.maximum(distance, min_distance, out=distance)
+        damping_distance = distance - reference_distance
+        block = np.zeros(distance.shape)
+        for band, band_energy in enumerate(source_energy):
+            if band_energy == 0:
+                continue
+            block += band_energy * np.power(10.0, -absorption[band] * damping_distance / 10.0)
+        block *= np.square(reference_distance / distance)
+        if floor is not None:
+            block[distance > radius] = 0.0
+        energy[iy, ix] += block
+
+    with np.errstate(divide='ignore'):
+        return 10.0 * np.log10(energy)
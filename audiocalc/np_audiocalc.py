@@ -0,0 +1,602 @@
+# encoding: utf-8
+
+"""
+NumPy implementation of 'audiocalc' for array inputs.
+
+All functions accept scalars or broadcastable arrays and return
+NumPy arrays (or NumPy scalars for scalar input).
+"""
+
+import collections
+
+import numpy as np
+
+from .py_audiocalc import OCTAVE_BANDS, BANDS, OctaveSpectrum, _band_items
+
+
+# middle frequencies and A factors in the order of BANDS
+BAND_FREQUENCIES = np.array([OCTAVE_BANDS[band][0] for band in BANDS], dtype=float)
+BAND_A_FACTORS = np.array([OCTAVE_BANDS[band][1] for band in BANDS], dtype=float)
+
+
+def _temperature_factors(temp):
+    """
+    Calculates the temperature dependent factors of the damping
+    formula, which hold all of its pow() and exp() calls.
+
+    temp: temperature in kelvin
+
+    Returns a tuple (saturation, sqrt_tempr, inv_sqrt_tempr,
+    nitrogen_relax, oxygen, nitrogen) of arrays.
+    """
+    c_humid = 4.6151 - 6.8346 * np.power(273.15 / temp, 1.261)
+    tempr = temp / 293.15  # convert to relative air temp (re 20 deg C)
+    tempr_pow = np.power(tempr, -2.5)
+    return (
+        np.power(10.0, c_humid),
+        np.sqrt(tempr),
+        np.power(tempr, -0.5),
+        np.exp(-4.17 * (np.power(tempr, -1.0 / 3.0) - 1.0)),
+        tempr_pow * 0.01275 * np.exp(-2239.1 / temp),
+        tempr_pow * 0.1068 * np.exp(-3352 / temp),
+    )
+
+
+def _combine_terms(factors, relhum, pres):
+    """
+    Calculates the terms of _absorption_terms from the temperature
+    factors (see _temperature_factors), the relative humidity and
+    the relative pressure (re 101325 Pa).
+    """
+    saturation, sqrt_tempr, inv_sqrt_tempr, nitrogen_relax, oxygen, nitrogen = factors
+    hum = relhum * saturation * pres
+    frO = pres * (24.0 + 4.04e4 * hum * (0.02 + hum) / (0.391 + hum))
+    frN = pres * inv_sqrt_tempr * (9.0 + 280.0 * hum * nitrogen_relax)
+    classic = 1.84e-11 * (1.0 / pres) * sqrt_tempr
+    return np.broadcast_arrays(classic, oxygen, nitrogen, frO, frN)
+
+
+def _absorption_terms(temp, relhum, pres):
+    """
+    Calculates the frequency independent terms of the damping formula
+    once per weather state.
+
+    Returns a tuple (classic, oxygen, nitrogen, frO, frN) of arrays
+    broadcast to the common shape of temp, relhum and pres.
+    """
+    temp = np.asarray(temp, dtype=float) + 273.15  # convert to kelvin
+    pres = np.asarray(pres, dtype=float) / 101325.0  # convert to relative pressure
+    relhum = np.asarray(relhum, dtype=float)
+    return _combine_terms(_temperature_factors(temp), relhum, pres)
+
+
+def _absorption(terms, freq):
+    """
+    Evaluates the damping formula in dB/m for precomputed
+    weather terms (see _absorption_terms) and frequencies.
+    """
+    classic, oxygen, nitrogen, frO, frN = terms
+    freq_sq = np.asarray(freq, dtype=float) ** 2
+    return 8.686 * freq_sq * (
+        classic +
+        oxygen / (frO + freq_sq / frO) +
+        nitrogen / (frN + freq_sq / frN)
+    )
+
+
+def damping(temp, relhum, freq, pres=101325):
+    """
+    Calculates the damping factor for sound in dB/m
+    depending on temperature, humidity and sound frequency.
+    All arguments are broadcast against each other.
+
+    temp: Temperature in degrees celsius
+    relhum: Relative humidity as percentage, e.g. 50
+    freq: Sound frequency in herz
+    pres: Atmospheric pressure in pascal
+    """
+    return _absorption(_absorption_terms(temp, relhum, pres), freq)
+
+
+def band_damping(temp, relhum, pres=101325):
+    """
+    Calculates the damping in dB/m for all octave bands.
+    The weather dependent terms are calculated only once per
+    weather state, not once per band.
+
+    Returns an array of shape (..., len(BANDS)) where the leading
+    dimensions are the broadcast shape of temp, relhum and pres.
+    The last axis is ordered like BANDS.
+    """
+    terms = _absorption_terms(temp, relhum, pres)
+    terms = [term[..., np.newaxis] for term in terms]
+    return _absorption(terms, BAND_FREQUENCIES)
+
+
+# number of (weather, distance) cells evaluated at once in grid functions
+CHUNK_SIZE = 2 ** 18
+
+
+def stack_spectra(spectra):
+    """
+    Stacks octave spectra into an array of shape (len(spectra), len(BANDS)),
+    ordered like BANDS. Missing bands are NaN.
+
+    spectra: sequence of OctaveSpectrum objects or dicts of band levels
+    """
+    out = np.full((len(spectra), len(BANDS)), np.nan)
+    for row, spectrum in enumerate(spectra):
+        for index, level in _band_items(spectrum):
+            out[row, index] = level
+    return out
+
+
+def _band_levels(octave_frequencies):
+    """
+    Returns the octave band levels as an array of shape (..., len(BANDS)),
+    ordered like BANDS. Missing bands are NaN.
+
+    octave_frequencies: dict of band name to level, an OctaveSpectrum,
+        or an array of band levels
+    """
+    if isinstance(octave_frequencies, (dict, OctaveSpectrum)):
+        return stack_spectra([octave_frequencies])[0]
+    return np.asarray(octave_frequencies, dtype=float)
+
+
+def _source_energy(octave_frequencies):
+    """
+    Returns the A-rated energy per octave band, zero for missing bands.
+    """
+    levels = _band_levels(octave_frequencies)
+    return np.nan_to_num(np.power(10.0, (levels + BAND_A_FACTORS) / 10.0), nan=0.0)
+
+
+def _damped_rated_energy(source_energy, absorption, distance, reference_distance):
+    """
+    Sums up the A-rated, damped and distance-adjusted energy of all bands.
+
+    source_energy: A-rated energy per band, see _source_energy
+    absorption: damping in dB/m per band, see band_damping
+    distance: distances, broadcastable to absorption.shape[:-1]
+    reference_distance: reference distance in meters
+    """
+    distance = np.asarray(distance, dtype=float)
+    reference_distance = np.asarray(reference_distance, dtype=float)
+    damping_distance = (distance - reference_distance)[..., np.newaxis]
+    attenuation = np.power(10.0, -(damping_distance * absorption) / 10.0)
+    if source_energy.ndim == 1:
+        band_sum = np.dot(attenuation, source_energy)
+    else:
+        band_sum = (attenuation * source_energy).sum(axis=-1)
+    return np.square(reference_distance / distance) * band_sum
+
+
+def _level_energy(levels):
+    """
+    Returns the energy of levels, zero for levels that are 0 or NaN.
+    """
+    energy = np.power(10.0, levels / 10.0)
+    energy[(levels == 0) | np.isnan(levels)] = 0.0
+    return energy
+
+
+def total_level(source_levels):
+    """
+    Calculates the total sound pressure level based on multiple source levels
+    along the last axis. None, NaN and 0 levels are skipped.
+    """
+    if isinstance(source_levels, OctaveSpectrum):
+        source_levels = [level for index, level in source_levels.band_items]
+    levels = np.atleast_1d(np.asarray(source_levels, dtype=float))
+    return 10.0 * np.log10(_level_energy(levels).sum(axis=-1))
+
+
+def total_rated_level(octave_frequencies):
+    """
+    Calculates the A-rated total sound pressure level
+    based on octave band frequencies. octave_frequencies is a dict of
+    band levels, an OctaveSpectrum or an array of shape (..., len(BANDS)).
+    Missing and 0 levels are skipped, like in the Python backend the
+    A-rated level of a band may be 0. Returns 0.0 if all bands are
+    skipped.
+    """
+    levels = np.atleast_1d(_band_levels(octave_frequencies))
+    energy = np.power(10.0, (levels + BAND_A_FACTORS) / 10.0)
+    energy[(levels == 0) | np.isnan(levels)] = 0.0
+    sums = energy.sum(axis=-1)
+    with np.errstate(divide='ignore'):
+        return np.where(sums == 0.0, 0.0, 10.0 * np.log10(sums))[()]
+
+
+def leq3(levels):
+    """
+    Calculates the energy-equivalent (Leq3) value
+    given a regular measurement interval, along the last axis.
+    """
+    levels = np.atleast_1d(np.asarray(levels, dtype=float))
+    n = levels.shape[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        leq = 10.0 * np.log10(_level_energy(levels).sum(axis=-1) / n)
+    leq = np.maximum(0.0, leq)
+    return np.where(levels.sum(axis=-1) == 0.0, 0.0, leq)[()]
+
+
+def _energetic_sum(levels, axis, mask):
+    """
+    Returns the energetic sum of levels along axis (kept with length
+    one) and the number of summed values. NaN levels and levels where
+    mask is False are skipped.
+    """
+    levels = np.asarray(levels, dtype=float)
+    valid = ~np.isnan(levels)
+    if mask is not None:
+        valid &= np.asarray(mask, dtype=bool)
+    levels = np.where(valid, levels, -np.inf)
+    # factor out the largest level, so that no power of 10 overflows
+    peak = levels.max(axis=axis, keepdims=True)
+    peak = np.where(np.isfinite(peak), peak, 0.0)
+    energy = np.power(10.0, (levels - peak) / 10.0).sum(axis=axis, keepdims=True)
+    with np.errstate(divide='ignore'):
+        total = peak + 10.0 * np.log10(energy)
+    return total, valid.sum(axis=axis, keepdims=True)
+
+
+def energetic_sum(levels, axis=-1, mask=None, keepdims=False):
+    """
+    Sums levels in dB energetically along axis, e.g. the contributions
+    of many sources at many receivers. Like total_level, but 0 levels
+    are summed as well: pass mask=levels != 0 to skip them.
+
+    levels: array of levels in dB
+    axis: axis or tuple of axes to sum over
+    mask: boolean array broadcastable to levels, False for missing
+        values. NaN levels are always skipped.
+    keepdims: keep the summed axes with length one
+
+    The sum is evaluated as log-sum-exp relative to the largest level,
+    so it does not overflow for extreme levels. Returns -inf where
+    all values are missing.
+    """
+    total, _ = _energetic_sum(levels, axis, mask)
+    return total if keepdims else np.squeeze(total, axis=axis)[()]
+
+
+def rated_energetic_sum(octave_frequencies, mask=None, keepdims=False):
+    """
+    Sums A-rated octave band levels energetically, like
+    total_rated_level for arrays of spectra (see energetic_sum).
+
+    octave_frequencies: dict of band levels, OctaveSpectrum or an
+        array of shape (..., len(BANDS)), the bands along the last axis
+    mask: boolean array broadcastable to the band levels, False for
+        missing bands. NaN levels are always skipped.
+    """
+    levels = _band_levels(octave_frequencies)
+    total, _ = _energetic_sum(levels + BAND_A_FACTORS, -1, mask)
+    return total if keepdims else total[..., 0][()]
+
+
+def energetic_mean(levels, axis=-1, mask=None, keepdims=False):
+    """
+    Averages levels in dB energetically along axis, like leq3 for
+    values in a regular interval, but without clamping to 0 and
+    without its special case for 0 levels (see energetic_sum).
+    Missing values are not counted. Returns NaN where all values
+    are missing.
+    """
+    total, count = _energetic_sum(levels, axis, mask)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(count > 0, total - 10.0 * np.log10(count), np.nan)
+    return mean if keepdims else np.squeeze(mean, axis=axis)[()]
+
+
+def enable_damping_cache(maxsize=4096, ndigits=2):
+    """
+    Does nothing and returns None: band_damping evaluates the damping
+    once per weather state for a whole array anyway, so this backend
+    has no damping cache. Provided so that code written for the
+    Python backend runs unchanged.
+    """
+    return None
+
+
+def disable_damping_cache():
+    """
+    Does nothing, see enable_damping_cache.
+    """
+
+
+def damping_cache_info():
+    """
+    Returns None, this backend has no damping cache.
+    """
+    return None
+
+
+def level_to_power(level):
+    """
+    Converts logarithmic sound pressure level value (dB)
+    to metric power value (W/m^2)
+    """
+    return np.power(10.0, np.asarray(level, dtype=float) / 10.0) * 1e-12
+
+
+def distant_level(reference_level, distance, reference_distance=1.0):
+    """
+    Calculates the sound pressure level
+    in dependence of a distance
+    where a perfect ball-shaped source and spread is assumed.
+
+    reference_level: Sound pressure level in reference distance in dB
+    distance: Distance to calculate sound pressure level for, in meters
+    reference_distance: reference distance in meters (defaults to 1)
+    """
+    rel_dist = np.asarray(reference_distance, dtype=float) / np.asarray(distance, dtype=float)
+    return np.asarray(reference_level, dtype=float) + 20.0 * np.log10(rel_dist)
+
+
+def distant_total_damped_rated_level(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325):
+    """
+    Calculates the damped, A-rated total sound pressure level
+    in a given distance, temperature and relative humidity
+    from octave frequency sound pressure levels in a reference distance.
+
+    distance, temp, relhum, reference_distance and pres are broadcast
+    against each other. octave_frequencies is a dict of band levels,
+    an OctaveSpectrum or an array of shape (..., len(BANDS)), see
+    stack_spectra, whose leading dimensions are broadcast as well.
+    """
+    energy = _damped_rated_energy(
+        _source_energy(octave_frequencies),
+        band_damping(temp, relhum, pres),
+        distance,
+        reference_distance)
+    return 10.0 * np.log10(energy)
+
+
+def distant_total_damped_rated_level_grid(
+            octave_frequencies,
+            reference_distance,
+            temp,
+            relhum,
+            distance,
+            pres=101325,
+            grid=True):
+    """
+    Calculates the damped, A-rated total sound pressure level
+    for one source over many temperatures, humidities and distances.
+
+    With grid=True, temp, relhum and distance are 1-D axes and the
+    result has the shape (len(temp), len(relhum), len(distance)).
+    The damping is calculated once per (temp, relhum) cell. pres must
+    be a scalar or broadcastable to (len(temp), len(relhum)).
+
+    With grid=False, temp, relhum, distance and pres are broadcast
+    against each other and the result has the broadcast shape.
+
+    The result is calculated in chunks of CHUNK_SIZE cells to keep
+    the memory use bounded.
+    """
+    source_energy = _source_energy(octave_frequencies)
+    if grid:
+        temp = np.asarray(temp, dtype=float).ravel()
+        relhum = np.asarray(relhum, dtype=float).ravel()
+        distance = np.asarray(distance, dtype=float).ravel()
+        absorption = band_damping(temp[:, np.newaxis], relhum[np.newaxis, :], pres)
+        absorption = absorption.reshape(-1, len(BANDS))
+        out = np.empty((absorption.shape[0], distance.size))
+        step = max(1, CHUNK_SIZE // max(1, distance.size))
+        for start in range(0, absorption.shape[0], step):
+            out[start:start + step] = _damped_rated_energy(
+                source_energy,
+                absorption[start:start + step, np.newaxis, :],
+                distance,
+                reference_distance)
+        shape = (temp.size, relhum.size, distance.size)
+    else:
+        temp, relhum, distance, pres = np.broadcast_arrays(temp, relhum, distance, pres)
+        shape = temp.shape
+        temp, relhum, distance, pres = [a.ravel() for a in (temp, relhum, distance, pres)]
+        out = np.empty(distance.size)
+        for start in range(0, distance.size, CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            out[chunk] = _damped_rated_energy(
+                source_energy,
+                band_damping(temp[chunk], relhum[chunk], pres[chunk]),
+                distance[chunk],
+                reference_distance)
+    return 10.0 * np.log10(out).reshape(shape)
+
+
+def threshold_distance(
+            octave_frequencies,
+            reference_distance,
+            target_level,
+            temp,
+            relhum,
+            pres=101325,
+            rtol=1e-10,
+            max_iter=50):
+    """
+    Calculates the distance in meters at which the damped, A-rated
+    total sound pressure level (see distant_total_damped_rated_level)
+    drops to target_level, for arrays of weather states.
+
+    target_level, temp, relhum and pres are broadcast against each
+    other. The damping is calculated once per weather state.
+
+    The level decreases strictly with distance, since both spreading
+    and damping do. Spreading alone reaches the target at
+    d_s = reference_distance * 10 ** ((L_0 - target_level) / 20),
+    where L_0 is the level at the reference distance. Damping only
+    moves the solution towards the reference distance, so the solution
+    always lies between reference_distance and d_s. Within this
+    bracket, a Newton iteration on the logarithm of the distance is
+    used, starting at d_s and falling back to bisection for steps
+    leaving the bracket. It typically converges in less than 10
+    iterations.
+
+    rtol: relative tolerance of the distance
+    max_iter: maximum number of iterations
+    """
+    source_energy = _source_energy(octave_frequencies)
+    absorption = band_damping(temp, relhum, pres)
+    target_level = np.asarray(target_level, dtype=float)
+    shape = np.broadcast_shapes(absorption.shape[:-1], target_level.shape)
+    absorption = np.broadcast_to(absorption, shape + (len(BANDS),))
+    target_level = np.broadcast_to(target_level, shape)
+    reference_distance = float(reference_distance)
+
+    # bracket of log(distance)
+    reference_level = 10.0 * np.log10(source_energy.sum())
+    spread = np.log(reference_distance) + (reference_level - target_level) / 20.0 * np.log(10.0)
+    lower = np.minimum(np.log(reference_distance), spread)
+    upper = np.maximum(np.log(reference_distance), spread)
+    x = spread
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        source_level = 10.0 * np.log10(source_energy)
+        for i in range(max_iter):
+            distance = np.exp(x)
+            # damped band levels, relative to their maximum to avoid underflows
+            band_level = source_level - absorption * (distance - reference_distance)[..., np.newaxis]
+            max_level = band_level.max(axis=-1)
+            band_energy = np.power(10.0, (band_level - max_level[..., np.newaxis]) / 10.0)
+            energy = band_energy.sum(axis=-1)
+            level = (max_level + 10.0 * np.log10(energy) +
+                     20.0 * np.log10(reference_distance / distance))
+            diff = level - target_level
+            lower = np.where(diff > 0, x, lower)
+            upper = np.where(diff <= 0, x, upper)
+            # derivative of the level by log(distance)
+            slope = (-20.0 / np.log(10.0) -
+                     distance * (band_energy * absorption).sum(axis=-1) / energy)
+            x_new = x - diff / slope
+            outside = ~((x_new >= lower) & (x_new <= upper))
+            x_new = np.where(outside, 0.5 * (lower + upper), x_new)
+            converged = np.abs(x_new - x) <= rtol
+            x = x_new
+            if np.all(converged):
+                break
+    return np.exp(x)[()]
+
+
+def _band_damping_derivatives(temp, relhum, pres=101325):
+    """
+    Calculates the damping in dB/m for all octave bands and its
+    analytic partial derivatives by temperature (per kelvin) and
+    relative humidity (per percent).
+
+    Returns a tuple of three arrays of shape (..., len(BANDS)).
+    """
+    temp = np.asarray(temp, dtype=float)[..., np.newaxis] + 273.15  # convert to kelvin
+    pres = np.asarray(pres, dtype=float)[..., np.newaxis] / 101325.0  # relative pressure
+    relhum = np.asarray(relhum, dtype=float)[..., np.newaxis]
+    freq_sq = BAND_FREQUENCIES ** 2
+
+    # humidity: hum = relhum * 10 ** c_humid * pres
+    ratio_pow = np.power(273.15 / temp, 1.261)
+    saturation = np.power(10.0, 4.6151 - 6.8346 * ratio_pow)
+    d_saturation = saturation * np.log(10.0) * 6.8346 * 1.261 * ratio_pow / temp
+    hum = relhum * saturation * pres
+    hum_t = relhum * d_saturation * pres
+    hum_h = saturation * pres
+
+    # oxygen relaxation frequency
+    q = hum * (0.02 + hum) / (0.391 + hum)
+    q_hum = ((2.0 * hum + 0.02) * (0.391 + hum) - hum * (0.02 + hum)) / (0.391 + hum) ** 2
+    frO = pres * (24.0 + 4.04e4 * q)
+    frO_hum = pres * 4.04e4 * q_hum
+
+    # nitrogen relaxation frequency
+    tempr = temp / 293.15
+    relax = np.exp(-4.17 * (np.power(tempr, -1.0 / 3.0) - 1.0))
+    relax_t = relax * 4.17 / 3.0 * np.power(tempr, -4.0 / 3.0) / 293.15
+    inv_sqrt = np.power(tempr, -0.5)
+    inner = 9.0 + 280.0 * hum * relax
+    frN = pres * inv_sqrt * inner
+    frN_t = pres * (-0.5 * inv_sqrt / temp * inner +
+                    inv_sqrt * 280.0 * (hum_t * relax + hum * relax_t))
+    frN_h = pres * inv_sqrt * 280.0 * relax * hum_h
+
+    # temperature dependent factors
+    classic = 1.84e-11 / pres * np.sqrt(tempr)
+    classic_t = classic * 0.5 / temp
+    tempr_pow = np.power(tempr, -2.5)
+    oxygen = tempr_pow * 0.01275 * np.exp(-2239.1 / temp)
+    oxygen_t = oxygen * (-2.5 / temp + 2239.1 / temp ** 2)
+    nitrogen = tempr_pow * 0.1068 * np.exp(-3352 / temp)
+    nitrogen_t = nitrogen * (-2.5 / temp + 3352 / temp ** 2)
+
+    # relaxation terms fr / (fr ** 2 + f ** 2) and their derivatives by fr
+    g_o = frO / (frO ** 2 + freq_sq)
+    g_o_fr = (freq_sq - frO ** 2) / (frO ** 2 + freq_sq) ** 2
+    g_n = frN / (frN ** 2 + freq_sq)
+    g_n_fr = (freq_sq - frN ** 2) / (frN ** 2 + freq_sq) ** 2
+
+    factor = 8.686 * freq_sq
+    absorption = factor * (classic + oxygen * g_o + nitrogen * g_n)
+    d_temp = factor * (
+        classic_t +
+        oxygen_t * g_o + oxygen * g_o_fr * frO_hum * hum_t +
+        nitrogen_t * g_n + nitrogen * g_n_fr * frN_t)
+    d_relhum = factor * (
+        oxygen * g_o_fr * frO_hum * hum_h +
+        nitrogen * g_n_fr * frN_h)
+    return absorption, d_temp, d_relhum
+
+
+# Result of distant_total_damped_rated_level_gradient: the level and
+# its partial derivatives in dB per kelvin, per percent relative
+# humidity and per meter.
+LevelGradient = collections.namedtuple(
+    'LevelGradient', ['level', 'temp', 'relhum', 'distance'])
+
+
+def distant_total_damped_rated_level_gradient(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325):
+    """
+    Calculates the damped, A-rated total sound pressure level like
+    distant_total_damped_rated_level and its analytic partial
+    derivatives by temperature, relative humidity and distance in
+    one pass. All arguments are broadcast like there.
+
+    With the band energies w_b and their share p_b = w_b / sum(w_b):
+
+        dL/d(distance) = -20 / (distance * ln(10)) - sum(p_b * a_b)
+        dL/dx = -(distance - reference_distance) * sum(p_b * da_b/dx)
+
+    for x in temp and relhum, where a_b is the damping of band b and
+    da_b/dx its analytic derivative.
+
+    Returns a LevelGradient of arrays (NumPy scalars for scalar input).
+    """
+    source_energy = _source_energy(octave_frequencies)
+    absorption, d_temp, d_relhum = _band_damping_derivatives(temp, relhum, pres)
+    distance = np.asarray(distance, dtype=float)
+    reference_distance = np.asarray(reference_distance, dtype=float)
+    damping_distance = distance - reference_distance
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # damped band levels, relative to their maximum to avoid underflows
+        band_level = 10.0 * np.log10(source_energy) - absorption * damping_distance[..., np.newaxis]
+        max_level = band_level.max(axis=-1)
+        band_energy = np.power(10.0, (band_level - max_level[..., np.newaxis]) / 10.0)
+        energy = band_energy.sum(axis=-1)
+        share = band_energy / energy[..., np.newaxis]
+    level = max_level + 10.0 * np.log10(energy) + 20.0 * np.log10(reference_distance / distance)
+    return LevelGradient(
+        level[()],
+        (-damping_distance * (share * d_temp).sum(axis=-1))[()],
+        (-damping_distance * (share * d_relhum).sum(axis=-1))[()],
+        (-20.0 / (distance * np.log(10.0)) - (share * absorption).sum(axis=-1))[()])
@@ -1,6 +1,9 @@
 # encoding: utf-8
 
+import collections
 import math
+import threading
+from array import array
 
 
 # per named ocatve band: Tuple of (middle frequency, A factor)
@@ -15,6 +18,112 @@ OCTAVE_BANDS = {
     'f8000': (8000, -1.15)
 }
 
+# octave band names in ascending order of their middle frequency
+BANDS = tuple(sorted(OCTAVE_BANDS, key=lambda band: OCTAVE_BANDS[band][0]))
+_FREQUENCIES = tuple(OCTAVE_BANDS[band][0] for band in BANDS)
+_A_FACTORS = tuple(OCTAVE_BANDS[band][1] for band in BANDS)
+
+
+class OctaveSpectrum(object):
+    """
+    Sound pressure levels per octave band, validated once and packed
+    into a contiguous array of doubles ordered like BANDS.
+
+    octave_frequencies: dict of band name to level in dB, or a sequence
+        of len(BANDS) levels ordered like BANDS. Missing bands and None
+        values are masked out.
+
+    levels: array('d') of band levels, 0.0 for masked bands
+    mask: array('b'), 1 for bands with a level, 0 for masked bands
+    """
+
+    __slots__ = ('levels', 'mask', 'band_items')
+
+    def __init__(self, octave_frequencies):
+        if isinstance(octave_frequencies, dict):
+            unknown = set(octave_frequencies) - set(BANDS)
+            if unknown:
+                raise ValueError("Unknown octave bands: %s" % ", ".join(sorted(unknown)))
+            values = [octave_frequencies.get(band) for band in BANDS]
+        else:
+            values = list(octave_frequencies)
+            if len(values) != len(BANDS):
+                raise ValueError("Expected %d octave band levels, got %d" % (
+                    len(BANDS), len(values)))
+        self.levels = array('d', [0.0] * len(BANDS))
+        self.mask = array('b', [0] * len(BANDS))
+        band_items = []
+        for index, value in enumerate(values):
+            if value is None:
+                continue
+            level = float(value)
+            if math.isnan(level) or math.isinf(level):
+                raise ValueError("Level of band %s is not finite" % BANDS[index])
+            self.levels[index] = level
+            self.mask[index] = 1
+            band_items.append((index, level))
+        # tuple of (band index, level) for all bands with a level
+        self.band_items = tuple(band_items)
+
+    def __getitem__(self, band):
+        index = BANDS.index(band)
+        if not self.mask[index]:
+            raise KeyError(band)
+        return self.levels[index]
+
+    def __contains__(self, band):
+        return band in BANDS and bool(self.mask[BANDS.index(band)])
+
+    def __iter__(self):
+        return (BANDS[index] for index, level in self.band_items)
+
+    def __len__(self):
+        return len(self.band_items)
+
+    def __eq__(self, other):
+        if not isinstance(other, OctaveSpectrum):
+            return NotImplemented
+        return self.band_items == other.band_items
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "OctaveSpectrum(%r)" % self.as_dict()
+
+    def get(self, band, default=None):
+        if band in self:
+            return self[band]
+        return default
+
+    def as_dict(self):
+        """
+        Returns the levels as a dict of band name to level.
+        """
+        return dict((BANDS[index], level) for index, level in self.band_items)
+
+
+def _band_items(octave_frequencies):
+    """
+    Returns a sequence of (band index, level) tuples for all bands
+    with a level, for a dict of band levels or an OctaveSpectrum.
+    """
+    if isinstance(octave_frequencies, OctaveSpectrum):
+        return octave_frequencies.band_items
+    band_items = []
+    for index, band in enumerate(BANDS):
+        if band not in octave_frequencies:
+            continue
+        if octave_frequencies[band] is None:
+            continue
+        band_items.append((index, float(octave_frequencies[band])))
+    return band_items
+
 
 def damping(temp, relhum, freq, pres=101325):
     """
@@ -55,6 +164,8 @@ def total_level(source_levels):
     """
     Calculates the total sound pressure level based on multiple source levels
     """
+    if isinstance(source_levels, OctaveSpectrum):
+        source_levels = [level for index, level in source_levels.band_items]
     sums = 0.0
     for l in source_levels:
         if l is None:
@@ -72,14 +183,10 @@ def total_rated_level(octave_frequencies):
     based on octave band frequencies
     """
     sums = 0.0
-    for band in OCTAVE_BANDS.keys():
-        if band not in octave_frequencies:
-            continue
-        if octave_frequencies[band] is None:
-            continue
-        if octave_frequencies[band] == 0:
+    for index, level in _band_items(octave_frequencies):
+        if level == 0:
             continue
-        sums += pow(10.0, ((float(octave_frequencies[band]) + OCTAVE_BANDS[band][1]) / 10.0))
+        sums += pow(10.0, ((level + _A_FACTORS[index]) / 10.0))
     level = 10.0 * math.log10(sums)
     return level
 
@@ -88,15 +195,21 @@ def leq3(levels):
     """
     Calculates the energy-equivalent (Leq3) value
     given a regular measurement interval.
+
+    levels may be any iterable, it is consumed in a single pass.
+    See audiocalc.leq for incremental and sliding window variants.
     """
-    n = float(len(levels))
+    n = 0
+    level_sum = 0.0
     sums = 0.0
-    if sum(levels) == 0.0:
-        return 0.0
     for l in levels:
+        n += 1
+        level_sum += l
         if l == 0:
             continue
         sums += pow(10.0, float(l) / 10.0)
+    if level_sum == 0.0:
+        return 0.0
     leq3 = 10.0 * math.log10((1.0 / n) * sums)
     leq3 = max(0.0, leq3)
     return leq3
@@ -122,38 +235,149 @@ def distant_total_damped_rated_level(
             distance,
             temp,
             relhum,
-            reference_distance=1.0):
+            reference_distance=1.0,
+            pres=101325):
     """
     Calculates the damped, A-rated total sound pressure level
-    in a given distance, temperature and relative humidity
+    in a given distance, temperature, relative humidity and
+    atmospheric pressure (in Pa)
     from octave frequency sound pressure levels in a reference distance
     """
     damping_distance = distance - reference_distance
+    band_damps = None
+    if _damping_cache is not None:
+        band_damps = _damping_cache.band_damping(temp, relhum, pres)
+    # distance adjustment, the same for all bands
+    spreading = distant_level(
+        reference_level=0.0,
+        distance=distance,
+        reference_distance=reference_distance
+    )
     sums = 0.0
-    for band in OCTAVE_BANDS.keys():
-        if band not in octave_frequencies:
-            continue
-        if octave_frequencies[band] is None:
-            continue
+    for index, level in _band_items(octave_frequencies):
         # distance-adjusted level per band
-        distant_val = distant_level(
-            reference_level=float(octave_frequencies[band]),
-            distance=distance,
-            reference_distance=reference_distance
-        )
+        distant_val = level + spreading
         # damping
-        damp_per_meter = damping(
-            temp=temp,
-            relhum=relhum,
-            freq=OCTAVE_BANDS[band][0])
+        if band_damps is not None:
+            damp_per_meter = band_damps[index]
+        else:
+            damp_per_meter = damping(
+                temp=temp,
+                relhum=relhum,
+                freq=_FREQUENCIES[index],
+                pres=pres)
         distant_val = distant_val - (damping_distance * damp_per_meter)
         # applyng A-rating
-        distant_val += OCTAVE_BANDS[band][1]
+        distant_val += _A_FACTORS[index]
         sums += pow(10.0, (distant_val / 10.0))
     level = 10.0 * math.log10(sums)
     return level
 
 
+class DampingCache(object):
+    """
+    Bounded cache of the damping per octave band with
+    least-recently-used eviction.
+
+    Entries are keyed on the weather state rounded to `ndigits`
+    decimal digits, and the damping is calculated for the rounded
+    weather state.
+
+    maxsize: Maximum number of cached weather states
+    ndigits: Number of decimal digits to round temperature,
+        humidity and pressure to
+    """
+
+    def __init__(self, maxsize=4096, ndigits=2):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ndigits = ndigits
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def band_damping(self, temp, relhum, pres=101325):
+        """
+        Returns a tuple of the damping in dB/m per octave band,
+        ordered like BANDS.
+        """
+        key = (round(temp, self.ndigits),
+               round(relhum, self.ndigits),
+               round(pres, self.ndigits))
+        with self._lock:
+            damps = self._data.get(key)
+            if damps is not None:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return damps
+            self.misses += 1
+        damps = tuple(
+            damping(key[0], key[1], freq, key[2])
+            for freq in _FREQUENCIES)
+        with self._lock:
+            self._data[key] = damps
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return damps
+
+    def info(self):
+        """
+        Returns a dict of hit and miss statistics.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_damping_cache = None
+
+
+def enable_damping_cache(maxsize=4096, ndigits=2):
+    """
+    Enables caching of the per-band damping used by
+    distant_total_damped_rated_level and returns the cache.
+
+    maxsize: Maximum number of cached weather states
+    ndigits: Number of decimal digits to round the weather state to
+    """
+    global _damping_cache
+    _damping_cache = DampingCache(maxsize=maxsize, ndigits=ndigits)
+    return _damping_cache
+
+
+def disable_damping_cache():
+    """
+    Disables and discards the damping cache.
+    """
+    global _damping_cache
+    _damping_cache = None
+
+
+def damping_cache_info():
+    """
+    Returns the hit and miss statistics of the damping cache,
+    or None if the cache is disabled.
+    """
+    if _damping_cache is None:
+        return None
+    return _damping_cache.info()
+
+
 def level_to_power(level):
     """
     Converts logarithmic sound pressure level value (dB)
@@ -179,15 +403,15 @@ def benchmark_damping():
     reference_distance = 300
 
     import time
-    start = time.clock()
+    start = time.perf_counter()
 
-    for temp in xrange(-20, 35):
-        for hum in xrange(30, 98):
-            for distance in xrange(500, 10000, 500):
+    for temp in range(-20, 35):
+        for hum in range(30, 98):
+            for distance in range(500, 10000, 500):
                 distant_total_damped_rated_level(
                     octave_frequencies=octave_frequencies,
                     reference_distance=reference_distance,
                     distance=distance,
                     temp=temp,
                     relhum=hum)
-    print("Duration: %.3f sec" % (time.clock() - start))
+    print("Duration: %.3f sec" % (time.perf_counter() - start))
@@ -0,0 +1,178 @@
+# encoding: utf-8
+
+"""
+Incremental evaluation of the damped, A-rated level of one source for
+interactive what-if tools, where one parameter changes at a time.
+
+A Scenario caches the intermediate per-band stages of
+distant_total_damped_rated_level:
+
+    rated:   A-rated source levels          <- octave_frequencies
+    damping: damping in dB/m per band       <- temp, relhum, pres
+    base:    rated level plus the damping
+             up to the reference distance   <- rated, damping,
+                                               reference_distance
+    bands:   damped level per band at the
+             receiver                       <- base, distance
+    level:   energetic sum of bands         <- bands
+
+Setting a parameter drops the stages depending on it, the next read
+recomputes only those. A distance change costs one multiply-add per
+band and the energetic sum, the damping is not recalculated.
+"""
+
+import math
+
+from . import py_audiocalc
+from .py_audiocalc import BANDS, _A_FACTORS, _FREQUENCIES, _band_items
+
+
+# stages in order of their dependencies
+STAGES = ('rated', 'damping', 'base', 'bands', 'level')
+
+# per parameter: the stages depending on it
+_DEPENDENTS = {
+    'octave_frequencies': ('rated', 'base', 'bands', 'level'),
+    'temp': ('damping', 'base', 'bands', 'level'),
+    'relhum': ('damping', 'base', 'bands', 'level'),
+    'pres': ('damping', 'base', 'bands', 'level'),
+    'reference_distance': ('base', 'bands', 'level'),
+    'distance': ('bands', 'level'),
+}
+
+
+def _parameter(name):
+    """
+    Returns a property reading and setting a scenario parameter.
+    """
+    def getter(self):
+        value = self._params[name]
+        if name == 'octave_frequencies':
+            return dict((BANDS[index], level) for index, level in value)
+        return value
+
+    def setter(self, value):
+        self.update(**{name: value})
+
+    return property(getter, setter)
+
+
+class Scenario(object):
+    """
+    A source with an octave spectrum in a reference distance, a
+    receiver distance and a weather state, with cached intermediate
+    results.
+
+    octave_frequencies: dict of band levels or OctaveSpectrum
+    distance: distance of the receiver in meters
+    temp: temperature in degrees celsius
+    relhum: relative humidity in percent
+    reference_distance: reference distance of the spectrum in meters
+    pres: atmospheric pressure in pascal
+
+    Parameters are read and set as attributes, or set together with
+    update(). evaluations counts the computations of each stage.
+    """
+
+    def __init__(self, octave_frequencies, distance, temp, relhum,
+                 reference_distance=1.0, pres=101325):
+        self._params = {}
+        self._cache = {}
+        self.evaluations = dict((stage, 0) for stage in STAGES)
+        self.update(
+            octave_frequencies=octave_frequencies,
+            distance=distance,
+            temp=temp,
+            relhum=relhum,
+            reference_distance=reference_distance,
+            pres=pres)
+
+    def update(self, **params):
+        """
+        Sets one or more parameters and drops the stages depending
+        on them. Setting a parameter to its current value keeps the
+        cached stages.
+        """
+        unknown = set(params) - set(_DEPENDENTS)
+        if unknown:
+            raise TypeError("Unknown parameters: %s" % ", ".join(sorted(unknown)))
+        for name, value in params.items():
+            if name == 'octave_frequencies':
+                value = list(_band_items(value))
+            else:
+                value = float(value)
+            if name in self._params and self._params[name] == value:
+                continue
+            self._params[name] = value
+            for stage in _DEPENDENTS[name]:
+                self._cache.pop(stage, None)
+
+    octave_frequencies = _parameter('octave_frequencies')
+    distance = _parameter('distance')
+    temp = _parameter('temp')
+    relhum = _parameter('relhum')
+    reference_distance = _parameter('reference_distance')
+    pres = _parameter('pres')
+
+    def _stage(self, stage):
+        try:
+            return self._cache[stage]
+        except KeyError:
+            pass
+        value = getattr(self, '_compute_' + stage)()
+        self.evaluations[stage] += 1
+        self._cache[stage] = value
+        return value
+
+    def _compute_rated(self):
+        return [(index, level + _A_FACTORS[index])
+                for index, level in self._params['octave_frequencies']]
+
+    def _compute_damping(self):
+        temp, relhum, pres = [self._params[name] for name in ('temp', 'relhum', 'pres')]
+        if py_audiocalc._damping_cache is not None:
+            return py_audiocalc._damping_cache.band_damping(temp, relhum, pres)
+        return tuple(py_audiocalc.damping(temp, relhum, freq, pres) for freq in _FREQUENCIES)
+
+    def _compute_base(self):
+        damping = self._stage('damping')
+        reference_distance = self._params['reference_distance']
+        return [(index, level + reference_distance * damping[index], damping[index])
+                for index, level in self._stage('rated')]
+
+    def _compute_bands(self):
+        distance = self._params['distance']
+        spreading = 20.0 * math.log10(self._params['reference_distance'] / distance)
+        return [(index, level + spreading - distance * damp)
+                for index, level, damp in self._stage('base')]
+
+    def _compute_level(self):
+        sums = 0.0
+        for index, level in self._stage('bands'):
+            sums += pow(10.0, level / 10.0)
+        return 10.0 * math.log10(sums)
+
+    @property
+    def damping(self):
+        """
+        The damping in dB/m per octave band as a dict.
+        """
+        damping = self._stage('damping')
+        return dict((band, damping[index]) for index, band in enumerate(BANDS))
+
+    @property
+    def band_levels(self):
+        """
+        The damped, A-rated level per octave band at the receiver
+        as a dict.
+        """
+        return dict((BANDS[index], level) for index, level in self._stage('bands'))
+
+    @property
+    def level(self):
+        """
+        The damped, A-rated total sound pressure level at the
+        receiver, like distant_total_damped_rated_level.
+        """
+        return self._stage('level')
+
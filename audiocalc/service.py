@@ -0,0 +1,390 @@
+# encoding: utf-8
+
+"""
+Local calculation service with micro-batching.
+
+Concurrent single-point requests are collected for up to `max_wait`
+seconds (or until `max_batch` requests are pending) and evaluated as
+one vectorized batch with np_audiocalc. Requests are JSON over HTTP,
+on a TCP port or a Unix socket:
+
+    python -m audiocalc.service --port 8080 --max-batch 1024 --max-wait-ms 2
+
+    POST /level
+    {"octave_frequencies": {"f63": 86, "f125": 89.5}, "distance": 1000,
+     "temp": 15, "relhum": 70, "reference_distance": 300, "pres": 101325}
+    -> {"level": 52.4}
+
+A JSON list of such objects returns a list of results. reference_distance
+(default 1.0) and pres (default 101325) are optional. All values must be
+finite and distance, reference_distance and pres positive, otherwise the
+response has status 400.
+
+    GET /metrics
+    -> request and batch counts, batch sizes and latencies
+"""
+
+import asyncio
+import collections
+import json
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import np_audiocalc
+from .py_audiocalc import OctaveSpectrum
+
+
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_WAIT = 0.002
+
+# number of recent requests and batches the metrics are calculated from
+METRICS_WINDOW = 10000
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            500: 'Internal Server Error'}
+
+# A single-point request, see parse_request
+Request = collections.namedtuple(
+    'Request', ['octave_frequencies', 'distance', 'temp', 'relhum',
+                'reference_distance', 'pres'])
+
+
+def _value(obj, name, default=None, positive=False):
+    """
+    Returns obj[name] (or default) as a finite float, positive if
+    requested. Raises ValueError otherwise.
+    """
+    value = obj[name] if default is None else obj.get(name, default)
+    if isinstance(value, bool):
+        raise ValueError("%s must be a number" % name)
+    try:
+        value = float(value)
+    except TypeError:
+        raise ValueError("%s must be a number" % name)
+    if not math.isfinite(value):
+        raise ValueError("%s must be finite" % name)
+    if positive and value <= 0.0:
+        raise ValueError("%s must be positive" % name)
+    return value
+
+
+def parse_request(obj):
+    """
+    Converts a decoded JSON object into a Request.
+    Raises ValueError for missing or invalid values: all values must
+    be finite, distance, reference_distance and pres positive.
+    """
+    if not isinstance(obj, dict):
+        raise ValueError("Expected a JSON object")
+    try:
+        return Request(
+            OctaveSpectrum(obj['octave_frequencies']),
+            _value(obj, 'distance', positive=True),
+            _value(obj, 'temp'),
+            _value(obj, 'relhum'),
+            _value(obj, 'reference_distance', 1.0, positive=True),
+            _value(obj, 'pres', 101325.0, positive=True))
+    except KeyError as e:
+        raise ValueError("Missing value %s" % e)
+    except TypeError as e:
+        raise ValueError(str(e))
+
+
+def evaluate_batch(requests):
+    """
+    Calculates distant_total_damped_rated_level for a list of
+    Requests in one vectorized call and returns a list of levels.
+    """
+    columns = list(zip(*requests))
+    levels = np_audiocalc.distant_total_damped_rated_level(
+        np_audiocalc.stack_spectra(columns[0]),
+        distance=np.array(columns[1]),
+        temp=np.array(columns[2]),
+        relhum=np.array(columns[3]),
+        reference_distance=np.array(columns[4]),
+        pres=np.array(columns[5]))
+    return levels.tolist()
+
+
+class BatchMetrics(object):
+    """
+    Counts requests and batches, and keeps the sizes of the latest
+    batches and the latencies of the latest requests.
+    """
+
+    def __init__(self, window=METRICS_WINDOW):
+        self.requests = 0
+        self.batches = 0
+        self.errors = 0
+        self.batch_sizes = collections.deque(maxlen=window)
+        self.latencies = collections.deque(maxlen=window)
+
+    def record_batch(self, latencies, failed=False):
+        """
+        Records a batch with the latencies (in seconds) of its requests.
+        """
+        self.batches += 1
+        self.requests += len(latencies)
+        if failed:
+            self.errors += len(latencies)
+        self.batch_sizes.append(len(latencies))
+        self.latencies.extend(latencies)
+
+    def snapshot(self):
+        """
+        Returns the metrics as a dict. Batch sizes and latencies (in
+        milliseconds) are calculated over the latest batches and
+        requests.
+        """
+        result = {
+            'requests': self.requests,
+            'batches': self.batches,
+            'errors': self.errors,
+        }
+        if self.batch_sizes:
+            sizes = np.array(self.batch_sizes)
+            result['batch_size'] = {'mean': float(sizes.mean()), 'max': int(sizes.max())}
+        if self.latencies:
+            latencies = np.array(self.latencies) * 1000.0
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99]).tolist()
+            result['latency_ms'] = {
+                'p50': p50, 'p90': p90, 'p99': p99, 'max': float(latencies.max())}
+        return result
+
+
+class MicroBatcher(object):
+    """
+    Collects items submitted by concurrent coroutines and evaluates
+    them in batches.
+
+    evaluate: function taking a list of items and returning a list of
+        results in the same order. It runs in a worker thread, so the
+        next batch is collected while one is evaluated.
+    max_batch: maximum number of items per batch
+    max_wait: maximum time in seconds the first item of a batch
+        waits for more items
+    """
+
+    def __init__(self, evaluate, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.evaluate = evaluate
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.metrics = BatchMetrics()
+        self._queue = None
+        self._task = None
+        self._executor = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def submit(self, item):
+        """
+        Submits an item and returns its result once its batch has
+        been evaluated.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        """
+        Waits for the first item, then collects more until the batch
+        is full or max_wait has passed.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch:
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            timeout = deadline - loop.time()
+            if len(batch) >= self.max_batch or timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            items = [item for item, future, started in batch]
+            failed = False
+            try:
+                results = await loop.run_in_executor(self._executor, self.evaluate, items)
+            except Exception as e:
+                failed = True
+                for item, future, started in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (item, future, started), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            now = time.perf_counter()
+            self.metrics.record_batch([now - started for item, future, started in batch], failed)
+
+
+class CalculationService(object):
+    """
+    HTTP/1.1 front end of a MicroBatcher evaluating
+    distant_total_damped_rated_level requests.
+    """
+
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        self.batcher = MicroBatcher(evaluate_batch, max_batch, max_wait)
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=8080, path=None):
+        """
+        Starts listening on a Unix socket if path is given,
+        otherwise on host and port (0 for any free port).
+        """
+        await self.batcher.start()
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_connection, path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        await self.batcher.stop()
+
+    async def _dispatch(self, method, path, body):
+        """
+        Returns the HTTP status and the JSON-serializable response.
+        """
+        if path == '/metrics':
+            if method != 'GET':
+                return 405, {'error': "Use GET"}
+            return 200, self.batcher.metrics.snapshot()
+        if path != '/level':
+            return 404, {'error': "Unknown path %s" % path}
+        if method != 'POST':
+            return 405, {'error': "Use POST"}
+        try:
+            obj = json.loads(body.decode('utf-8'))
+            if isinstance(obj, list):
+                requests = [parse_request(o) for o in obj]
+            else:
+                requests = [parse_request(obj)]
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        try:
+            levels = await asyncio.gather(*[self.batcher.submit(r) for r in requests])
+        except Exception as e:
+            return 500, {'error': str(e)}
+        if isinstance(obj, list):
+            return 200, [{'level': level} for level in levels]
+        return 200, {'level': levels[0]}
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                status, response = await self._dispatch(method, path.split('?')[0], body)
+                keep_alive = (version == 'HTTP/1.1' and
+                              headers.get('connection', '').lower() != 'close')
+                try:
+                    payload = json.dumps(response, allow_nan=False)
+                except ValueError as e:
+                    # e.g. a level overflowing to inf, which isn't valid JSON
+                    status = 500
+                    payload = json.dumps({'error': str(e)})
+                payload = payload.encode('utf-8')
+                writer.write((
+                    "HTTP/1.1 %d %s\r\n"
+                    "Content-Type: application/json\r\n"
+                    "Content-Length: %d\r\n"
+                    "Connection: %s\r\n\r\n" % (
+                        status, _REASONS[status], len(payload),
+                        'keep-alive' if keep_alive else 'close')).encode('latin1') + payload)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def serve(host='127.0.0.1', port=8080, path=None,
+          max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+    """
+    Runs a CalculationService until interrupted.
+    """
+    async def run():
+        service = CalculationService(max_batch, max_wait)
+        server = await service.start(host, port, path)
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    import argparse
+    info = "Run the audiocalc micro-batching calculation service"
+    parser = argparse.ArgumentParser(description=info)
+    parser.add_argument('--host', dest="host", default='127.0.0.1',
+            help='Address to listen on')
+    parser.add_argument('-p', '--port', dest="port", type=int, default=8080,
+            help='TCP port to listen on')
+    parser.add_argument('-u', '--unix', dest="path", default=None,
+            help='Listen on this Unix socket instead of a TCP port')
+    parser.add_argument('-b', '--max-batch', dest="max_batch", type=int,
+            default=DEFAULT_MAX_BATCH,
+            help='Maximum number of requests per batch')
+    parser.add_argument('-w', '--max-wait-ms', dest="max_wait", type=float,
+            default=DEFAULT_MAX_WAIT * 1000,
+            help='Maximum time in milliseconds a request waits for a batch')
+    args = parser.parse_args(argv)
+    serve(host=args.host, port=args.port, path=args.path,
+          max_batch=args.max_batch, max_wait=args.max_wait / 1000.0)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# encoding: utf-8
+
+"""
+Parameter sweeps of the damped, A-rated level over temperature,
+humidity and distance, split into chunks and run on a process pool.
+"""
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import np_audiocalc
+
+
+# One chunk of sweep results. All fields except start are flat arrays
+# of the same length, start is the flat index of the first cell.
+SweepChunk = collections.namedtuple(
+    'SweepChunk', ['start', 'temp', 'relhum', 'distance', 'level'])
+
+
+def _evaluate_chunk(source_energy, reference_distance, temp, relhum, distance, pres, start, stop):
+    """
+    Evaluates the cells start..stop of the temp x relhum x distance grid.
+    The damping is calculated once per weather cell in the chunk.
+    """
+    weather, k = np.divmod(np.arange(start, stop), len(distance))
+    first = weather[0]
+    weather -= first
+    i, j = np.unravel_index(np.arange(first, first + weather[-1] + 1), (len(temp), len(relhum)))
+    absorption = np_audiocalc.band_damping(temp[i], relhum[j], pres)
+    energy = np_audiocalc._damped_rated_energy(
+        source_energy, absorption[weather], distance[k], reference_distance)
+    return SweepChunk(start, temp[i][weather], relhum[j][weather], distance[k],
+                      10.0 * np.log10(energy))
+
+
+def sweep(
+            octave_frequencies,
+            reference_distance,
+            temp,
+            relhum,
+            distance,
+            pres=101325,
+            chunk_size=2 ** 16,
+            processes=None,
+            max_pending=None,
+            progress=None):
+    """
+    Calculates the damped, A-rated total sound pressure level over all
+    combinations of temp, relhum and distance and yields SweepChunk
+    tuples in the order of the flat grid index, i.e. with temp as the
+    outermost and distance as the innermost loop.
+
+    octave_frequencies: dict of band levels or OctaveSpectrum
+    reference_distance: reference distance in meters
+    temp, relhum, distance: 1-D axes of the grid
+    pres: Atmospheric pressure in pascal
+    chunk_size: number of grid cells per chunk
+    processes: number of worker processes, defaults to the number of
+        CPUs. With 0 or 1, all chunks are evaluated in this process.
+    max_pending: maximum number of chunks submitted but not yet
+        yielded, bounds the memory use. Defaults to 2 * processes.
+    progress: optional callable(done, total) called with the number of
+        evaluated cells after each chunk
+    """
+    source_energy = np_audiocalc._source_energy(octave_frequencies)
+    temp = np.asarray(temp, dtype=float).ravel()
+    relhum = np.asarray(relhum, dtype=float).ravel()
+    distance = np.asarray(distance, dtype=float).ravel()
+    total = temp.size * relhum.size * distance.size
+    args = (source_energy, reference_distance, temp, relhum, distance, pres)
+    ranges = ((start, min(start + chunk_size, total))
+              for start in range(0, total, chunk_size))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1:
+        for start, stop in ranges:
+            chunk = _evaluate_chunk(*(args + (start, stop)))
+            if progress is not None:
+                progress(stop, total)
+            yield chunk
+        return
+
+    if max_pending is None:
+        max_pending = 2 * processes
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = collections.deque()
+        done = 0
+        while True:
+            for start, stop in ranges:
+                pending.append(executor.submit(_evaluate_chunk, *(args + (start, stop))))
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                break
+            chunk = pending.popleft().result()
+            done += chunk.level.size
+            if progress is not None:
+                progress(done, total)
+            yield chunk
@@ -0,0 +1,200 @@
+# encoding: utf-8
+
+"""
+Precomputed tables of levels or absorption on a grid, persisted in a
+memory-mappable binary format and queried by multilinear
+interpolation.
+
+File format: the magic bytes b'AUDIOCALCTBL', a little-endian uint32
+header length and a JSON header (padded with spaces so the data starts
+at a multiple of 64 bytes), followed by the values as little-endian
+float64 in C order. The header describes the axes (name, values and
+interpolation scale), the shape of the values per grid point, the
+kind of table and free-form metadata.
+
+Tables are opened with numpy.memmap, so opening is nearly free and
+several processes reading the same table share it in the page cache.
+"""
+
+import collections
+import json
+import struct
+
+import numpy as np
+
+from . import np_audiocalc
+from .interpolate import inside, multilinear
+
+
+_MAGIC = b'AUDIOCALCTBL'
+_DTYPE = np.dtype('<f8')
+_ALIGN = 64
+
+# An axis of a table. scale is 'linear' or 'log': levels are
+# interpolated over the logarithm of the distance, in which spreading
+# is linear.
+Axis = collections.namedtuple('Axis', ['name', 'values', 'scale'])
+
+
+def _header(kind, axes, value_shape, metadata):
+    header = json.dumps({
+        'kind': kind,
+        'axes': [{'name': a.name, 'values': [float(v) for v in a.values], 'scale': a.scale}
+                 for a in axes],
+        'value_shape': list(value_shape),
+        'dtype': _DTYPE.str,
+        'metadata': metadata,
+    }).encode('utf-8')
+    size = len(_MAGIC) + 4 + len(header)
+    header += b' ' * (-size % _ALIGN)
+    return _MAGIC + struct.pack('<I', len(header)) + header
+
+
+class Table(object):
+    """
+    A table of values on a rectilinear grid.
+
+    kind: name of the tabulated quantity, e.g. 'level' or 'absorption'
+    axes: sequence of Axis
+    values: array of shape tuple(len(axis.values) for axis in axes)
+        + value_shape
+    metadata: JSON-serializable dict, e.g. the source spectrum
+    """
+
+    def __init__(self, kind, axes, values, metadata=None):
+        self.kind = kind
+        self.axes = [Axis(a.name, np.asarray(a.values, dtype=float), a.scale) for a in axes]
+        self.values = values
+        self.metadata = metadata or {}
+        shape = tuple(len(a.values) for a in self.axes)
+        if values.shape[:len(shape)] != shape:
+            raise ValueError("values of shape %r don't match the axes %r" % (values.shape, shape))
+        for axis in self.axes:
+            if axis.scale not in ('linear', 'log'):
+                raise ValueError("Unknown scale %r of axis %r" % (axis.scale, axis.name))
+            if len(axis.values) < 2 or np.any(np.diff(axis.values) <= 0):
+                raise ValueError("Axis %r must be ascending with at least two values" % axis.name)
+
+    @property
+    def value_shape(self):
+        return self.values.shape[len(self.axes):]
+
+    def save(self, path):
+        """
+        Writes the table to path.
+        """
+        with open(path, 'wb') as tablefile:
+            tablefile.write(_header(self.kind, self.axes, self.value_shape, self.metadata))
+            tablefile.write(np.ascontiguousarray(self.values, dtype=_DTYPE).tobytes())
+
+    @classmethod
+    def load(cls, path, mode='r'):
+        """
+        Opens a table file with the values memory-mapped.
+
+        mode: numpy.memmap mode, 'r' for read-only access
+        """
+        with open(path, 'rb') as tablefile:
+            if tablefile.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("%s is not an audiocalc table" % path)
+            length, = struct.unpack('<I', tablefile.read(4))
+            header = json.loads(tablefile.read(length).decode('utf-8'))
+        axes = [Axis(a['name'], a['values'], a['scale']) for a in header['axes']]
+        shape = tuple(len(a.values) for a in axes) + tuple(header['value_shape'])
+        values = np.memmap(path, dtype=np.dtype(header['dtype']), mode=mode,
+                           offset=len(_MAGIC) + 4 + length, shape=shape)
+        return cls(header['kind'], axes, values, header['metadata'])
+
+    def _coordinates(self, points):
+        return [np.log(x) if axis.scale == 'log' else x
+                for axis, x in zip(self.axes, points)]
+
+    def lookup(self, *points, **named_points):
+        """
+        Interpolates the table multilinearly at arrays of points,
+        given as one coordinate array per axis (positionally in axis
+        order, or by axis name), broadcast against each other.
+        Returns an array of shape broadcast shape + value_shape,
+        NaN for points outside the grid.
+        """
+        if named_points:
+            points = list(points) + [named_points.pop(axis.name) for axis in self.axes[len(points):]]
+            if named_points:
+                raise TypeError("Unknown axes %s" % ", ".join(sorted(named_points)))
+        if len(points) != len(self.axes):
+            raise TypeError("Expected one coordinate array per axis: %s" % ", ".join(
+                axis.name for axis in self.axes))
+        points = [np.asarray(x, dtype=float) for x in points]
+        mask = inside([axis.values for axis in self.axes], points)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = np.asarray(multilinear(
+                self._coordinates([axis.values for axis in self.axes]),
+                self.values,
+                self._coordinates(points)))
+        result[~mask] = np.nan
+        return result[()]
+
+
+def _create(path, kind, axes, value_shape, metadata):
+    """
+    Creates a table file and returns it opened for writing.
+    """
+    axes = [Axis(a.name, np.asarray(a.values, dtype=float), a.scale) for a in axes]
+    shape = tuple(len(a.values) for a in axes) + tuple(value_shape)
+    header = _header(kind, axes, value_shape, metadata)
+    with open(path, 'wb') as tablefile:
+        tablefile.write(header)
+        tablefile.truncate(len(header) + int(np.prod(shape)) * _DTYPE.itemsize)
+    return Table.load(path, mode='r+')
+
+
+def build_level_table(
+            path,
+            octave_frequencies,
+            reference_distance,
+            temp,
+            relhum,
+            distance,
+            pres=101325):
+    """
+    Precomputes distant_total_damped_rated_level of one source over
+    the grid temp x relhum x distance and saves it to path. The
+    values are written one temperature at a time, so memory only
+    depends on len(relhum) * len(distance). Returns the Table.
+
+    Levels are interpolated over the logarithm of the distance.
+    """
+    spectrum = np_audiocalc._band_levels(octave_frequencies)
+    metadata = {
+        'octave_frequencies': [None if np.isnan(v) else float(v) for v in spectrum],
+        'bands': list(np_audiocalc.BANDS),
+        'reference_distance': float(reference_distance),
+        'pres': float(pres),
+    }
+    axes = [Axis('temp', temp, 'linear'), Axis('relhum', relhum, 'linear'),
+            Axis('distance', distance, 'log')]
+    table = _create(path, 'level', axes, (), metadata)
+    for i, t in enumerate(table.axes[0].values):
+        table.values[i] = np_audiocalc.distant_total_damped_rated_level_grid(
+            octave_frequencies, reference_distance, [t], table.axes[1].values,
+            table.axes[2].values, pres)[0]
+    table.values.flush()
+    return Table.load(path)
+
+
+def build_absorption_table(path, temp, relhum, pres=(80000.0, 90000.0, 101325.0, 110000.0)):
+    """
+    Precomputes the damping in dB/m per octave band (see band_damping)
+    over the grid temp x relhum x pres and saves it to path.
+    Returns the Table, whose values have the shape
+    (len(temp), len(relhum), len(pres), len(BANDS)).
+    """
+    axes = [Axis('temp', temp, 'linear'), Axis('relhum', relhum, 'linear'),
+            Axis('pres', pres, 'linear')]
+    metadata = {'bands': list(np_audiocalc.BANDS)}
+    table = _create(path, 'absorption', axes, (len(np_audiocalc.BANDS),), metadata)
+    for i, t in enumerate(table.axes[0].values):
+        table.values[i] = np_audiocalc.band_damping(
+            t, table.axes[1].values[:, np.newaxis], table.axes[2].values)
+    table.values.flush()
+    return Table.load(path)
@@ -1,8 +1,39 @@
 # encoding: utf-8
 
+import asyncio
+import json
+import math
+import os
+import shutil
+import tempfile
+
 import audiocalc
+from audiocalc import py_audiocalc
+from audiocalc import benchmark
+from audiocalc import leq
+from audiocalc import instrument
+from audiocalc import scenario
 import unittest
 
+try:
+    import numpy
+    from audiocalc import np_audiocalc
+    from audiocalc import bulkio
+    from audiocalc import noisemap
+    from audiocalc import indicators
+    from audiocalc import weather
+    from audiocalc import service
+    from audiocalc import interpolate
+    from audiocalc import approx
+    from audiocalc import montecarlo
+    from audiocalc import table
+    from audiocalc import flyover
+    from audiocalc import atmosphere
+    from audiocalc import sweep
+    from audiocalc import threaded
+except ImportError:
+    numpy = None
+
 
 class TestSequenceFunctions(unittest.TestCase):
 
@@ -75,5 +106,1440 @@ class TestSequenceFunctions(unittest.TestCase):
         leq3 = audiocalc.leq3(levels)
         self.assertEqual(leq3, 0.0)
 
+    def test_leq3_generator(self):
+        leq3 = audiocalc.leq3(l for l in [30, 40, 50])
+        self.assertAlmostEqual(leq3, audiocalc.leq3([30, 40, 50]))
+
+
+class TestLeqAccumulator(unittest.TestCase):
+
+    def test_update(self):
+        levels = [30, 42.5, 0, 55, 61]
+        acc = leq.LeqAccumulator()
+        for level in levels:
+            acc.update(level)
+        self.assertAlmostEqual(acc.leq, audiocalc.leq3(levels))
+
+    def test_update_many(self):
+        levels = [30, 42.5, 0, 55, 61]
+        acc = leq.LeqAccumulator()
+        acc.update_many(levels)
+        self.assertAlmostEqual(acc.leq, audiocalc.leq3(levels))
+
+    def test_zeros(self):
+        for levels in ([], [0, 0, 0], [0, 0, 0.1]):
+            acc = leq.LeqAccumulator()
+            acc.update_many(levels)
+            self.assertEqual(acc.leq, audiocalc.leq3(levels))
+
+    def test_merge(self):
+        levels = [30, 42.5, 0, 55, 61, 48]
+        first = leq.LeqAccumulator()
+        first.update_many(levels[:2])
+        second = leq.LeqAccumulator()
+        second.update_many(levels[2:])
+        self.assertAlmostEqual(first.merge(second).leq, audiocalc.leq3(levels))
+
+    def test_sliding(self):
+        levels = [30, 42.5, 0, 55, 61, 48, 0, 0, 0, 70]
+        window = leq.SlidingLeq(3)
+        for i, level in enumerate(levels):
+            window.update(level)
+            expected = audiocalc.leq3(levels[max(0, i - 2):i + 1])
+            self.assertAlmostEqual(window.leq, expected)
+        self.assertEqual(len(window), 3)
+
+    def test_sliding_update_many(self):
+        levels = [30, 42.5, 0, 55, 61, 48, 0, 0, 0.1, 70]
+        window = leq.SlidingLeq(4)
+        window.update_many(levels[:2])
+        window.update_many(levels[2:])
+        self.assertAlmostEqual(window.leq, audiocalc.leq3(levels[-4:]))
+        window.update_many([0, 0, 0, 0])
+        self.assertEqual(window.leq, 0.0)
+
+    def test_bulk_matches_update(self):
+        series = [
+            [30, 0, -10, 10, 55.5, 0],
+            [4000, 30],
+            [float('nan'), 30],
+            [float('-inf'), 40, 0],
+            [float('inf'), float('-inf'), 30],
+        ]
+        for levels in series:
+            single, bulk = leq.LeqAccumulator(), leq.LeqAccumulator()
+            for level in levels:
+                single.update(level)
+            bulk.update_many(levels)
+            self.assertEqual(repr(single.energy), repr(bulk.energy))
+            for size in (2, 5):
+                single, bulk = leq.SlidingLeq(size), leq.SlidingLeq(size)
+                for level in levels * 3:
+                    single.update(level)
+                bulk.update_many(levels[:1])
+                bulk.update_many(levels * 3)
+                # the first level is pushed out of the window again
+                single.update(levels[0])
+                bulk.update(levels[0])
+                self.assertEqual(repr(single.leq), repr(bulk.leq))
+                self.assertEqual(single._updates, (len(levels) * 3 + 1) % size)
+                self.assertEqual(bulk._updates, (len(levels) * 3 + 2) % size)
+
+    def test_sliding_mixed_signs(self):
+        levels = [10, -10, 20, -20, 5, 30, -30, 0, 12, -12]
+        for size in (2, 3):
+            window = leq.SlidingLeq(size)
+            for i, level in enumerate(levels):
+                window.update(level)
+                expected = audiocalc.leq3(levels[max(0, i - size + 1):i + 1])
+                self.assertAlmostEqual(window.leq, expected)
+                self.assertEqual(window.leq == 0.0, expected == 0.0)
+            window = leq.SlidingLeq(size)
+            window.update_many(levels)
+            self.assertEqual(window.leq, audiocalc.leq3(levels[-size:]))
+        window = leq.SlidingLeq(2)
+        window.update_many([10, -10])
+        self.assertEqual(window.leq, 0.0)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestLevelStatistics(unittest.TestCase):
+
+    def test_percentiles(self):
+        levels = numpy.random.default_rng(1).uniform(30, 80, 100000)
+        stats = leq.LevelStatistics()
+        stats.update_many(levels)
+        for n in (1, 10, 50, 90, 99):
+            self.assertAlmostEqual(stats.ln(n), numpy.percentile(levels, 100 - n), delta=0.1)
+        self.assertEqual(stats.lmax, levels.max())
+        self.assertEqual(stats.lmin, levels.min())
+        self.assertEqual(stats.ln(0), levels.max())
+        self.assertEqual(stats.ln(100), levels.min())
+        self.assertAlmostEqual(stats.leq, audiocalc.leq3(levels.tolist()))
+        self.assertEqual(sorted(stats.percentiles()), ['L10', 'L50', 'L90'])
+
+    def test_constant(self):
+        stats = leq.LevelStatistics()
+        for level in [55.0] * 10:
+            stats.update(level)
+        self.assertEqual(stats.count, 10)
+        self.assertEqual(stats.ln(50), 55.0)
+
+    def test_merge(self):
+        levels = numpy.random.default_rng(2).normal(60, 8, 10000)
+        whole = leq.LevelStatistics(resolution=0.5)
+        whole.update_many(levels)
+        first = leq.LevelStatistics(resolution=0.5)
+        first.update_many(levels[:3000])
+        second = leq.LevelStatistics(resolution=0.5)
+        second.update_many(levels[3000:])
+        merged = first.merge(second)
+        self.assertEqual(merged.percentiles(), whole.percentiles())
+        self.assertEqual(merged.lmax, whole.lmax)
+        self.assertAlmostEqual(merged.leq, whole.leq)
+        with self.assertRaises(ValueError):
+            merged.merge(leq.LevelStatistics())
+
+    def test_empty(self):
+        stats = leq.LevelStatistics()
+        self.assertTrue(math.isnan(stats.ln(50)))
+        with self.assertRaises(ValueError):
+            stats.ln(101)
+
+
+class TestBackends(unittest.TestCase):
+
+    def tearDown(self):
+        audiocalc.use_backend()
+
+    def test_use_backend(self):
+        audiocalc.use_backend('python')
+        self.assertEqual(audiocalc.BACKEND, 'python')
+        self.assertIs(audiocalc.damping, py_audiocalc.damping)
+        self.assertIn('python', audiocalc.available_backends())
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, audiocalc.use_backend, 'fortran')
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_backend(self):
+        audiocalc.use_backend('numpy')
+        self.assertEqual(audiocalc.BACKEND, 'numpy')
+        self.assertIs(audiocalc.damping, np_audiocalc.damping)
+        # the numpy backend has no damping cache
+        self.assertIs(audiocalc.enable_damping_cache, np_audiocalc.enable_damping_cache)
+        self.assertIsNone(audiocalc.enable_damping_cache())
+        self.assertIsNone(audiocalc.damping_cache_info())
+        self.assertIsNone(py_audiocalc.damping_cache_info())
+        # scalars for 1-D input, like the other backends
+        leq = audiocalc.leq3([30, 30, 30])
+        self.assertIsInstance(leq, float)
+        self.assertEqual(numpy.ndim(leq), 0)
+        self.assertNotIsInstance(leq, numpy.ndarray)
+        self.assertEqual(audiocalc.leq3([[30, 30], [0, 0]]).shape, (2,))
+
+    @unittest.skipUnless('cython' in audiocalc.available_backends(),
+                         "the compiled backend is not built")
+    def test_cython_backend(self):
+        audiocalc.use_backend('cython')
+        try:
+            self.assertEqual(audiocalc.BACKEND, 'cython')
+            # the compiled backend has no damping cache
+            self.assertIsNone(audiocalc.enable_damping_cache())
+            for distance in (500, 1000, 500):
+                audiocalc.distant_total_damped_rated_level({'f63': 70}, distance, 20, 80)
+            self.assertIsNone(audiocalc.damping_cache_info())
+            self.assertIsNone(py_audiocalc.damping_cache_info())
+            audiocalc.disable_damping_cache()
+        finally:
+            py_audiocalc.disable_damping_cache()
+
+    def test_parity(self):
+        self.assertEqual(audiocalc.backends.check_parity(), [])
+
+
+class TestInstrument(unittest.TestCase):
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+        py_audiocalc.disable_damping_cache()
+
+    def test_disabled(self):
+        self.assertFalse(instrument.enabled())
+        self.assertEqual(py_audiocalc.damping.__module__, 'audiocalc.py_audiocalc')
+        py_audiocalc.damping(20, 80, 1000)
+        self.assertEqual(instrument.snapshot()['functions'], {})
+
+    def test_enable(self):
+        original = py_audiocalc.leq3
+        instrument.enable(['.py_audiocalc'])
+        self.assertTrue(instrument.enabled())
+        self.assertIsNot(py_audiocalc.leq3, original)
+        self.assertEqual(py_audiocalc.leq3([30, 30, 30]), original([30, 30, 30]))
+        py_audiocalc.leq3(list(range(1, 100)))
+        py_audiocalc.damping(20, 80, 1000)
+        stats = instrument.snapshot()['functions']
+        self.assertEqual(stats['py_audiocalc.leq3']['calls'], 2)
+        self.assertEqual(stats['py_audiocalc.leq3']['sizes'], {'4': 1, '128': 1})
+        self.assertEqual(stats['py_audiocalc.damping']['sizes'], {'1': 1})
+        self.assertGreater(stats['py_audiocalc.leq3']['seconds'], 0)
+        instrument.disable()
+        self.assertIs(py_audiocalc.leq3, original)
+        self.assertEqual(json.loads(instrument.snapshot_json())['functions']['py_audiocalc.leq3']['calls'], 2)
+        instrument.reset()
+        self.assertEqual(instrument.snapshot()['functions'], {})
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_batch_sizes(self):
+        instrument.enable(['.np_audiocalc', '.threaded'])
+        spectrum = {'f63': 70, 'f1000': 60}
+        np_audiocalc.distant_total_damped_rated_level(
+            spectrum, numpy.linspace(100, 5000, 100000), 20, 80)
+        np_audiocalc.band_damping(20, numpy.linspace(10, 90, 1000))
+        np_audiocalc.total_rated_level(numpy.full((300, 8), 60.0))
+        np_audiocalc.distant_total_damped_rated_level_grid(
+            spectrum, 300, numpy.arange(10), numpy.arange(20), numpy.arange(1, 51))
+        stats = instrument.snapshot()['functions']
+        self.assertEqual(stats['np_audiocalc.distant_total_damped_rated_level']['sizes'], {'131072': 1})
+        # one weather state for the level and 10 x 20 for the grid evaluator
+        self.assertEqual(stats['np_audiocalc.band_damping']['sizes'], {'1': 1, '256': 1, '1024': 1})
+        self.assertEqual(stats['np_audiocalc.total_rated_level']['sizes'], {'512': 1})
+        self.assertEqual(stats['np_audiocalc.distant_total_damped_rated_level_grid']['sizes'], {'16384': 1})
+        threaded.distant_total_damped_rated_level(
+            spectrum, numpy.linspace(100, 5000, 5000), 20, numpy.full((1, 1), 80), threads=1)
+        stats = instrument.snapshot()['functions']
+        self.assertEqual(stats['threaded.distant_total_damped_rated_level']['sizes'], {'8192': 1})
+
+    def test_package_lookup(self):
+        audiocalc.use_backend('python')
+        try:
+            audiocalc.damping(20, 80, 1000)
+            instrument.enable(['.py_audiocalc'])
+            audiocalc.damping(20, 80, 1000)
+            self.assertEqual(instrument.snapshot()['functions']['py_audiocalc.damping']['calls'], 1)
+        finally:
+            audiocalc.use_backend()
+
+    def test_damping_cache(self):
+        instrument.enable(['.py_audiocalc'])
+        py_audiocalc.enable_damping_cache()
+        for _ in range(4):
+            py_audiocalc.distant_total_damped_rated_level({'f63': 70}, 1000, 20, 80)
+        snapshot = instrument.snapshot()
+        self.assertEqual(snapshot['damping_cache']['hit_rate'], 0.75)
+        self.assertEqual(snapshot['functions']['py_audiocalc.distant_total_damped_rated_level']['calls'], 4)
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_run(self):
+        results = benchmark.run(sizes=[100], repeat=1, pattern='distant_level')
+        self.assertIn('python.distant_level[100]', results)
+        for name, result in results.items():
+            self.assertIn('distant_level', name)
+            self.assertEqual(result['size'], 100)
+            self.assertAlmostEqual(result['ns_per_call'] * result['calls_per_sec'] / 1e9, 1.0)
+
+    def test_all_benchmarks_run(self):
+        results = benchmark.run(sizes=[100], repeat=1)
+        self.assertIn('python.distant_total_damped_rated_level[100]', results)
+        self.assertIn('python.leq3[100]', results)
+        if numpy is not None:
+            for name in ('threaded.distant_total_damped_rated_level[100]',
+                         'threaded.total_rated_level.threads1[100]',
+                         'approx.band_damping[100]',
+                         'approx.distant_total_damped_rated_level.threads1[100]',
+                         'numpy.total_rated_level.bulk[100]'):
+                self.assertIn(name, results)
+            self.assertIn('kernels', benchmark.report(results))
+
+    def test_compare(self):
+        baseline = {'results': {
+            'a[1]': {'calls_per_sec': 100.0},
+            'b[1]': {'calls_per_sec': 100.0},
+        }}
+        results = {
+            'a[1]': {'calls_per_sec': 95.0},
+            'b[1]': {'calls_per_sec': 50.0},
+            'c[1]': {'calls_per_sec': 1.0},
+        }
+        self.assertEqual(benchmark.compare(results, baseline, threshold=0.1),
+                         [('b[1]', 100.0, 50.0, -0.5)])
+
+
+class TestOctaveSpectrum(unittest.TestCase):
+
+    def setUp(self):
+        self.octave_frequencies = {
+            'f63': 71.5,
+            'f125': 68.5,
+            'f250': 64,
+            'f500': 58,
+            'f1000': 53,
+            'f2000': 47,
+            'f4000': 40,
+            'f8000': 32}
+        self.spectrum = audiocalc.OctaveSpectrum(self.octave_frequencies)
+
+    def test_packing(self):
+        spectrum = audiocalc.OctaveSpectrum({'f63': 71.5, 'f1000': None, 'f8000': 32})
+        self.assertEqual(list(spectrum.levels), [71.5, 0, 0, 0, 0, 0, 0, 32])
+        self.assertEqual(list(spectrum.mask), [1, 0, 0, 0, 0, 0, 0, 1])
+        self.assertEqual(list(spectrum), ['f63', 'f8000'])
+        self.assertNotIn('f1000', spectrum)
+        self.assertIsNone(spectrum.get('f1000'))
+        self.assertEqual(spectrum['f8000'], 32.0)
+        self.assertEqual(spectrum.as_dict(), {'f63': 71.5, 'f8000': 32.0})
+
+    def test_sequence(self):
+        spectrum = audiocalc.OctaveSpectrum([71.5, 68.5, 64, 58, 53, 47, 40, 32])
+        self.assertEqual(spectrum, self.spectrum)
+
+    def test_validation(self):
+        self.assertRaises(ValueError, audiocalc.OctaveSpectrum, {'f16': 50})
+        self.assertRaises(ValueError, audiocalc.OctaveSpectrum, [50, 50])
+        self.assertRaises(ValueError, audiocalc.OctaveSpectrum, {'f63': float('nan')})
+        self.assertRaises(ValueError, audiocalc.OctaveSpectrum, {'f63': 'loud'})
+
+    def test_total_level(self):
+        level = audiocalc.total_level(self.spectrum)
+        self.assertAlmostEqual(level, 73.9109, places=4)
+
+    def test_total_rated_level(self):
+        level = audiocalc.total_rated_level(self.spectrum)
+        self.assertEqual("%.4f" % level, "60.5055")
+
+    def test_distant_total_level_damped_rated(self):
+        level = audiocalc.distant_total_damped_rated_level(
+            octave_frequencies=self.spectrum,
+            reference_distance=300,
+            distance=5000,
+            temp=20,
+            relhum=80)
+        self.assertEqual("%.4f" % level, "30.0600")
+
+
+class TestDampingCache(unittest.TestCase):
+
+    def setUp(self):
+        self.octave_frequencies = {
+            'f63': 71.5,
+            'f125': 68.5,
+            'f250': 64,
+            'f500': 58,
+            'f1000': 53,
+            'f2000': 47,
+            'f4000': 40,
+            'f8000': 32}
+
+    def tearDown(self):
+        py_audiocalc.disable_damping_cache()
+
+    def test_cached_level(self):
+        py_audiocalc.enable_damping_cache(maxsize=2)
+        for i in range(3):
+            level = py_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies=self.octave_frequencies,
+                reference_distance=300,
+                distance=5000,
+                temp=20,
+                relhum=80)
+            self.assertEqual("%.4f" % level, "30.0600")
+        info = py_audiocalc.damping_cache_info()
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(info['misses'], 1)
+        self.assertEqual(info['size'], 1)
+
+    def test_eviction(self):
+        cache = py_audiocalc.DampingCache(maxsize=2)
+        cache.band_damping(10, 50)
+        cache.band_damping(20, 50)
+        cache.band_damping(10, 50)
+        cache.band_damping(30, 50)  # evicts (20, 50)
+        cache.band_damping(10, 50)
+        cache.band_damping(20, 50)
+        self.assertEqual(cache.info(), {
+            'hits': 2, 'misses': 4, 'size': 2, 'maxsize': 2})
+
+    def test_quantization(self):
+        cache = py_audiocalc.DampingCache(ndigits=1)
+        damps = cache.band_damping(20.04, 80.01)
+        self.assertIs(cache.band_damping(19.96, 79.98), damps)
+        self.assertAlmostEqual(damps[-1], py_audiocalc.damping(20, 80, 8000))
+
+    def test_disabled(self):
+        self.assertIsNone(py_audiocalc.damping_cache_info())
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyDamping(unittest.TestCase):
+
+    def test_damping_scalar(self):
+        damp = np_audiocalc.damping(20, 80, 8000)
+        self.assertEqual("%.4f" % damp, "0.0695")
+
+    def test_damping_broadcast(self):
+        temp = numpy.arange(-20, 35, 5.0)[:, numpy.newaxis, numpy.newaxis]
+        relhum = numpy.arange(10, 100, 10.0)[numpy.newaxis, :, numpy.newaxis]
+        freq = numpy.array([62.5, 1000, 8000])
+        damp = np_audiocalc.damping(temp, relhum, freq, pres=95000)
+        self.assertEqual(damp.shape, (11, 9, 3))
+        for i, t in enumerate(temp.ravel()):
+            for j, h in enumerate(relhum.ravel()):
+                for k, f in enumerate(freq):
+                    expected = py_audiocalc.damping(t, h, f, pres=95000)
+                    self.assertAlmostEqual(damp[i, j, k] / expected, 1.0, places=12)
+
+    def test_total_rated_level_zero_rated_band(self):
+        # 26.21 dB at 63 Hz is 0 dB(A), summed like in the Python backend
+        spectra = [{'f63': 26.21, 'f1000': 60}, {'f63': 26.21}, {'f1000': 0}]
+        levels = np_audiocalc.total_rated_level(np_audiocalc.stack_spectra(spectra))
+        self.assertAlmostEqual(levels[0], py_audiocalc.total_rated_level(spectra[0]), places=12)
+        self.assertAlmostEqual(levels[1], 0.0)
+        self.assertEqual(levels[2], 0.0)
+
+    def test_band_damping(self):
+        damp = np_audiocalc.band_damping([0, 20], [50, 80])
+        self.assertEqual(damp.shape, (2, 8))
+        for i, (t, h) in enumerate([(0, 50), (20, 80)]):
+            for j, band in enumerate(np_audiocalc.BANDS):
+                expected = py_audiocalc.damping(t, h, py_audiocalc.OCTAVE_BANDS[band][0])
+                self.assertAlmostEqual(damp[i, j] / expected, 1.0, places=12)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyDistantLevel(unittest.TestCase):
+
+    def setUp(self):
+        self.octave_frequencies = {
+            'f63': 71.5,
+            'f125': 68.5,
+            'f250': 64,
+            'f500': 58,
+            'f1000': 53,
+            'f2000': 47,
+            'f4000': 40,
+            'f8000': None}
+
+    def test_distant_total_damped_rated_level(self):
+        level = np_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies=self.octave_frequencies,
+            reference_distance=300,
+            distance=[200, 5000],
+            temp=20,
+            relhum=80)
+        for i, distance in enumerate([200, 5000]):
+            expected = py_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies=self.octave_frequencies,
+                reference_distance=300,
+                distance=distance,
+                temp=20,
+                relhum=80)
+            self.assertAlmostEqual(level[i], expected, places=9)
+
+    def test_grid(self):
+        temps = [-10, 0, 12.5, 30]
+        relhums = [20, 55, 90]
+        distances = [100, 500, 2500]
+        cube = np_audiocalc.distant_total_damped_rated_level_grid(
+            self.octave_frequencies, 300, temps, relhums, distances)
+        self.assertEqual(cube.shape, (4, 3, 3))
+        for i, temp in enumerate(temps):
+            for j, relhum in enumerate(relhums):
+                for k, distance in enumerate(distances):
+                    expected = py_audiocalc.distant_total_damped_rated_level(
+                        octave_frequencies=self.octave_frequencies,
+                        reference_distance=300,
+                        distance=distance,
+                        temp=temp,
+                        relhum=relhum)
+                    self.assertAlmostEqual(cube[i, j, k], expected, places=9)
+
+    def test_stacked_spectra(self):
+        spectra = [
+            self.octave_frequencies,
+            audiocalc.OctaveSpectrum({'f63': 80, 'f1000': 70})]
+        levels = np_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies=np_audiocalc.stack_spectra(spectra),
+            reference_distance=300,
+            distance=2000,
+            temp=10,
+            relhum=60)
+        self.assertEqual(levels.shape, (2,))
+        for i, spectrum in enumerate(spectra):
+            expected = py_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies=spectrum,
+                reference_distance=300,
+                distance=2000,
+                temp=10,
+                relhum=60)
+            self.assertAlmostEqual(levels[i], expected, places=9)
+
+    def test_threshold_distance(self):
+        temps = numpy.array([-10, 0, 12.5, 30])[:, numpy.newaxis]
+        relhums = numpy.array([20, 55, 90])
+        distance = np_audiocalc.threshold_distance(
+            self.octave_frequencies, 300, 35, temps, relhums)
+        self.assertEqual(distance.shape, (4, 3))
+        for i in range(4):
+            for j in range(3):
+                level = py_audiocalc.distant_total_damped_rated_level(
+                    octave_frequencies=self.octave_frequencies,
+                    reference_distance=300,
+                    distance=distance[i, j],
+                    temp=temps[i, 0],
+                    relhum=relhums[j])
+                self.assertAlmostEqual(level, 35, places=6)
+
+    def test_threshold_distance_below_reference(self):
+        distance = np_audiocalc.threshold_distance(
+            self.octave_frequencies, 300, 70, 20, 80)
+        self.assertLess(distance, 300)
+        level = py_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies=self.octave_frequencies,
+            reference_distance=300,
+            distance=distance,
+            temp=20,
+            relhum=80)
+        self.assertAlmostEqual(level, 70, places=6)
+
+    def test_grid_flat(self):
+        temps = numpy.array([-10, 0, 12.5, 30])
+        relhums = numpy.array([20, 55, 90, 40])
+        distances = numpy.array([100, 500, 2500, 300])
+        levels = np_audiocalc.distant_total_damped_rated_level_grid(
+            self.octave_frequencies, 300, temps, relhums, distances, grid=False)
+        self.assertEqual(levels.shape, (4,))
+        for i in range(4):
+            expected = py_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies=self.octave_frequencies,
+                reference_distance=300,
+                distance=distances[i],
+                temp=temps[i],
+                relhum=relhums[i])
+            self.assertAlmostEqual(levels[i], expected, places=9)
+
+    def test_gradient(self):
+        rng = numpy.random.default_rng(4)
+        temp = rng.uniform(-30, 45, 500)
+        relhum = rng.uniform(5, 100, 500)
+        pres = rng.uniform(80000, 110000, 500)
+        distance = rng.uniform(50, 8000, 500)
+        gradient = np_audiocalc.distant_total_damped_rated_level_gradient(
+            self.octave_frequencies, distance, temp, relhum, 300, pres)
+
+        def level(distance, temp, relhum):
+            return np_audiocalc.distant_total_damped_rated_level(
+                self.octave_frequencies, distance, temp, relhum, 300, pres)
+
+        numpy.testing.assert_allclose(gradient.level, level(distance, temp, relhum), rtol=1e-12)
+        h = 1e-4
+        differences = {
+            'temp': (level(distance, temp + h, relhum) - level(distance, temp - h, relhum)) / (2 * h),
+            'relhum': (level(distance, temp, relhum + h) - level(distance, temp, relhum - h)) / (2 * h),
+            'distance': (level(distance + h, temp, relhum) - level(distance - h, temp, relhum)) / (2 * h),
+        }
+        for name, expected in differences.items():
+            numpy.testing.assert_allclose(getattr(gradient, name), expected, rtol=1e-5, atol=1e-8)
+
+    def test_gradient_scalar(self):
+        gradient = np_audiocalc.distant_total_damped_rated_level_gradient(
+            self.octave_frequencies, 1000, 20, 80, 300)
+        self.assertEqual(numpy.ndim(gradient.level), 0)
+        self.assertAlmostEqual(gradient.level, py_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, 1000, 20, 80, 300))
+        self.assertLess(gradient.distance, 0)
+        # no damping at the reference distance
+        gradient = np_audiocalc.distant_total_damped_rated_level_gradient(
+            self.octave_frequencies, 300, 20, 80, 300)
+        self.assertEqual(gradient.temp, 0)
+        self.assertEqual(gradient.relhum, 0)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpyEnergeticSum(unittest.TestCase):
+
+    def setUp(self):
+        self.levels = numpy.random.default_rng(0).uniform(20, 100, (6, 5, 8))
+
+    def test_energetic_sum(self):
+        total = np_audiocalc.energetic_sum(self.levels)
+        self.assertEqual(total.shape, (6, 5))
+        self.assertAlmostEqual(total[2, 3], py_audiocalc.total_level(self.levels[2, 3].tolist()))
+        total = np_audiocalc.energetic_sum(self.levels, axis=0)
+        self.assertAlmostEqual(total[1, 7], py_audiocalc.total_level(self.levels[:, 1, 7].tolist()))
+        self.assertEqual(np_audiocalc.energetic_sum(self.levels, axis=(0, 1), keepdims=True).shape,
+                         (1, 1, 8))
+        self.assertAlmostEqual(np_audiocalc.energetic_sum([50, 50]), 50 + 10 * math.log10(2))
+
+    def test_mask(self):
+        mask = self.levels > 50
+        total = np_audiocalc.energetic_sum(self.levels, mask=mask)
+        self.assertAlmostEqual(
+            total[4, 0], py_audiocalc.total_level(self.levels[4, 0][mask[4, 0]].tolist()))
+        levels = numpy.array([[40.0, numpy.nan, 0.0], [numpy.nan, numpy.nan, numpy.nan]])
+        total = np_audiocalc.energetic_sum(levels)
+        self.assertAlmostEqual(total[0], 10 * math.log10(10 ** 4 + 1))
+        self.assertEqual(total[1], -numpy.inf)
+        with numpy.errstate(divide='ignore'):
+            expected = np_audiocalc.total_level(levels)
+        numpy.testing.assert_allclose(np_audiocalc.energetic_sum(levels, mask=levels != 0), expected)
+
+    def test_extreme_levels(self):
+        with numpy.errstate(all='raise'):
+            self.assertAlmostEqual(
+                np_audiocalc.energetic_sum([4000.0, 4000.0]), 4000 + 10 * math.log10(2))
+            self.assertAlmostEqual(
+                np_audiocalc.energetic_sum([-4000.0, -4000.0]), -4000 + 10 * math.log10(2))
+            self.assertAlmostEqual(np_audiocalc.energetic_mean([4000.0, 3990.0, numpy.nan]),
+                                   3990 + 10 * math.log10(5.5))
+
+    def test_rated_energetic_sum(self):
+        total = np_audiocalc.rated_energetic_sum(self.levels)
+        self.assertEqual(total.shape, (6, 5))
+        numpy.testing.assert_allclose(total, np_audiocalc.total_rated_level(self.levels))
+        spectrum = {'f63': 71.5, 'f500': 58, 'f8000': None}
+        self.assertAlmostEqual(np_audiocalc.rated_energetic_sum(spectrum),
+                               py_audiocalc.total_rated_level(spectrum))
+        mask = numpy.arange(8) < 4
+        self.assertAlmostEqual(np_audiocalc.rated_energetic_sum(self.levels[0, 0], mask=mask),
+                               py_audiocalc.total_rated_level(dict(
+                                   zip(np_audiocalc.BANDS[:4], self.levels[0, 0, :4]))))
+
+    def test_energetic_mean(self):
+        numpy.testing.assert_allclose(
+            np_audiocalc.energetic_mean(self.levels), np_audiocalc.leq3(self.levels))
+        levels = numpy.array([[30.0, 40.0, numpy.nan], [numpy.nan] * 3])
+        mean = np_audiocalc.energetic_mean(levels)
+        self.assertAlmostEqual(mean[0], py_audiocalc.leq3([30, 40]))
+        self.assertTrue(numpy.isnan(mean[1]))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.octave_frequencies = {
+            'f63': 86,
+            'f125': 89.5,
+            'f250': 87.5,
+            'f500': 86.0,
+            'f1000': 83.0,
+            'f2000': 80.0,
+            'f4000': 77,
+            'f8000': 67.5}
+        self.temps = range(-10, 30, 5)
+        self.relhums = range(30, 90, 20)
+        self.distances = range(500, 3000, 500)
+        self.cube = np_audiocalc.distant_total_damped_rated_level_grid(
+            self.octave_frequencies, 300, self.temps, self.relhums, self.distances)
+
+    def run_sweep(self, processes):
+        progress = []
+        chunks = list(sweep.sweep(
+            self.octave_frequencies, 300, self.temps, self.relhums, self.distances,
+            chunk_size=7, processes=processes, max_pending=3,
+            progress=lambda done, total: progress.append((done, total))))
+        self.assertEqual([c.start for c in chunks], list(range(0, self.cube.size, 7)))
+        self.assertEqual(progress[-1], (self.cube.size, self.cube.size))
+        levels = numpy.concatenate([c.level for c in chunks])
+        numpy.testing.assert_allclose(levels, self.cube.ravel())
+        self.assertEqual(chunks[1].temp[0], -10)
+        self.assertEqual(chunks[1].relhum[0], 50)
+        self.assertEqual(chunks[1].distance[0], 1500)
+
+    def test_sequential(self):
+        self.run_sweep(processes=1)
+
+    def test_process_pool(self):
+        self.run_sweep(processes=2)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestThreaded(unittest.TestCase):
+    """
+    Runs with the compiled batch kernels if they have been built,
+    otherwise with the NumPy fallback.
+    """
+
+    def setUp(self):
+        self.octave_frequencies = {
+            'f63': 71.5,
+            'f125': 68.5,
+            'f250': 64,
+            'f500': 58,
+            'f1000': 53,
+            'f2000': 47,
+            'f4000': 40,
+            'f8000': None}
+        n = 3 * threaded.MIN_CHUNK_SIZE
+        self.temp = numpy.linspace(-20, 35, n)
+        self.relhum = numpy.linspace(5, 100, n)
+        self.distance = numpy.linspace(50, 5000, n)
+
+    def test_damping(self):
+        damp = threaded.damping(self.temp, self.relhum, 2000, threads=3)
+        numpy.testing.assert_allclose(
+            damp, np_audiocalc.damping(self.temp, self.relhum, 2000), rtol=1e-12)
+        self.assertEqual("%.4f" % threaded.damping(20, 80, 8000), "0.0695")
+
+    def test_total_rated_level(self):
+        spectra = np_audiocalc.stack_spectra([self.octave_frequencies] * 5)
+        levels = threaded.total_rated_level(spectra, threads=2)
+        self.assertEqual(levels.shape, (5,))
+        numpy.testing.assert_allclose(
+            levels, py_audiocalc.total_rated_level(self.octave_frequencies), rtol=1e-12)
+
+    def test_distant_total_damped_rated_level(self):
+        levels = threaded.distant_total_damped_rated_level(
+            self.octave_frequencies, self.distance, self.temp, self.relhum,
+            reference_distance=300, threads=3)
+        expected = np_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, self.distance, self.temp, self.relhum,
+            reference_distance=300)
+        numpy.testing.assert_allclose(levels, expected, rtol=1e-12)
+        self.assertAlmostEqual(levels[100], py_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, self.distance[100], self.temp[100],
+            self.relhum[100], reference_distance=300), places=9)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBulkIO(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.columns = {
+            'temp': numpy.arange(10, dtype=float),
+            'relhum': numpy.linspace(20, 90, 10),
+            'level': numpy.linspace(30.5, 75.25, 10),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def roundtrip(self, filename):
+        path = os.path.join(self.tmpdir, filename)
+        with bulkio.ColumnWriter(path, ['temp', 'relhum', 'level']) as writer:
+            writer.write(dict((k, v[:4]) for k, v in self.columns.items()))
+            writer.write([v[4:] for v in (
+                self.columns['temp'], self.columns['relhum'], self.columns['level'])])
+        self.assertEqual(writer.count, 10)
+        chunks = list(bulkio.read_columns(path, columns=['level', 'temp'], chunk_size=3))
+        self.assertEqual([len(c['temp']) for c in chunks], [3, 3, 3, 1])
+        for name in ['level', 'temp']:
+            numpy.testing.assert_allclose(
+                numpy.concatenate([c[name] for c in chunks]), self.columns[name])
+        return path
+
+    def test_csv(self):
+        path = self.roundtrip('result.csv')
+        with open(path) as csvfile:
+            self.assertEqual(csvfile.readline().strip(), 'temp,relhum,level')
+
+    def test_npy(self):
+        path = self.roundtrip('result.npy')
+        records = numpy.load(path, mmap_mode='r')
+        self.assertEqual(records.shape, (10,))
+        numpy.testing.assert_allclose(records['relhum'], self.columns['relhum'])
+
+    def test_csv_formats(self):
+        path = os.path.join(self.tmpdir, 'result.csv')
+        with bulkio.ColumnWriter(path, ['temp', 'level'], formats=['%d', '%.3f']) as writer:
+            writer.write([[1, 2], [30.12345, 40]])
+        with open(path, 'rb') as csvfile:
+            self.assertEqual(csvfile.read(), b'temp,level\r\n1,30.123\r\n2,40.000\r\n')
+
+    def test_read_spectra(self):
+        path = os.path.join(self.tmpdir, 'spectra.csv')
+        with bulkio.ColumnWriter(path, ['f63', 'f1000', 'f8000']) as writer:
+            writer.write([[80, 81], [70, 71], [60, 61]])
+        spectra = list(bulkio.read_spectra(path))
+        self.assertEqual(len(spectra), 1)
+        self.assertEqual(spectra[0].shape, (2, 8))
+        self.assertEqual(spectra[0][1, 4], 71)
+        self.assertTrue(numpy.isnan(spectra[0][0, 1]))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNoiseMap(unittest.TestCase):
+
+    def setUp(self):
+        self.sources = [
+            noisemap.PointSource((100, 200, 30), {'f63': 86, 'f500': 80, 'f2000': 75}, 10),
+            noisemap.PointSource((900, 700), {'f125': 70, 'f1000': 66, 'f8000': 50}, 1),
+            noisemap.PointSource((-3000, 500, 10), {'f63': 60, 'f4000': 60}, 1),
+        ]
+        self.x = numpy.linspace(0, 1000, 21)
+        self.y = numpy.linspace(0, 800, 17)
+
+    def contributions(self, i, j):
+        levels = []
+        for source in self.sources:
+            position = tuple(source.position) + (0,) * (3 - len(source.position))
+            distance = numpy.sqrt(
+                (self.x[j] - position[0]) ** 2 +
+                (self.y[i] - position[1]) ** 2 +
+                position[2] ** 2)
+            levels.append(py_audiocalc.distant_total_damped_rated_level(
+                octave_frequencies=source.octave_frequencies,
+                reference_distance=source.reference_distance,
+                distance=max(distance, 1.0),
+                temp=15,
+                relhum=70))
+        return levels
+
+    def test_map(self):
+        levels = noisemap.noise_map(self.sources, self.x, self.y, 15, 70)
+        self.assertEqual(levels.shape, (17, 21))
+        for i, j in [(0, 0), (4, 2), (16, 20), (14, 18)]:
+            self.assertAlmostEqual(levels[i, j], audiocalc.total_level(self.contributions(i, j)))
+
+    def test_culling(self):
+        floor = 35.0
+        levels = noisemap.noise_map(self.sources, self.x, self.y, 15, 70, floor=floor)
+        for i in range(len(self.y)):
+            for j in range(len(self.x)):
+                contributions = [l for l in self.contributions(i, j) if l >= floor]
+                if not contributions:
+                    self.assertEqual(levels[i, j], -numpy.inf)
+                else:
+                    self.assertAlmostEqual(levels[i, j], audiocalc.total_level(contributions))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestIndicators(unittest.TestCase):
+
+    def setUp(self):
+        # two days of 1-minute levels, starting at midnight
+        self.timestamps = numpy.arange(0, 2 * 86400, 60.0)
+        hours = (self.timestamps // 3600) % 24
+        self.levels = numpy.where((hours >= 7) & (hours < 19), 60.0,
+                                  numpy.where((hours >= 19) & (hours < 23), 55.0, 45.0))
+        self.levels[::7] += 3.0
+
+    def test_levels(self):
+        agg = indicators.IndicatorAggregator()
+        agg.update(self.timestamps, self.levels)
+        result = agg.levels()
+        hours = (self.timestamps // 3600) % 24
+        night = (hours >= 23) | (hours < 7)
+        self.assertAlmostEqual(result['night'], audiocalc.leq3(self.levels[night].tolist()))
+        day = (hours >= 7) & (hours < 19)
+        self.assertAlmostEqual(result['day'], audiocalc.leq3(self.levels[day].tolist()))
+        expected = 10 * math.log10(
+            (12 * 10 ** (result['day'] / 10) +
+             4 * 10 ** ((result['evening'] + 5) / 10) +
+             8 * 10 ** ((result['night'] + 10) / 10)) / 24)
+        self.assertAlmostEqual(result['den'], expected)
+
+    def test_daily(self):
+        agg = indicators.IndicatorAggregator()
+        agg.update(self.timestamps, self.levels)
+        daily = agg.daily()
+        # the first night hours (00:00-07:00) belong to the day before
+        self.assertEqual(daily['start'].tolist(), [-17 * 3600.0, 7 * 3600.0, 31 * 3600.0])
+        self.assertTrue(numpy.isnan(daily['day'][0]))
+        self.assertTrue(numpy.isnan(daily['den'][0]))
+        hours = self.timestamps / 3600
+        night = (hours >= 23) & (hours < 31)
+        self.assertAlmostEqual(daily['night'][1], audiocalc.leq3(self.levels[night].tolist()))
+        evening = (hours >= 43) & (hours < 47)
+        self.assertAlmostEqual(daily['evening'][2], audiocalc.leq3(self.levels[evening].tolist()))
+
+    def test_chunks_and_merge(self):
+        whole = indicators.IndicatorAggregator()
+        whole.update(self.timestamps.astype('datetime64[s]'), self.levels)
+        first = indicators.IndicatorAggregator()
+        second = indicators.IndicatorAggregator()
+        for start in range(0, self.levels.size, 1000):
+            target = first if start < 2000 else second
+            target.update(self.timestamps[start:start + 1000], self.levels[start:start + 1000])
+        merged = first.merge(second)
+        for name, value in whole.levels().items():
+            self.assertAlmostEqual(merged.levels()[name], value)
+        hourly = merged.hourly()
+        self.assertEqual(len(hourly['start']), 48)
+        self.assertAlmostEqual(hourly['leq'][0], audiocalc.leq3(self.levels[:60].tolist()))
+
+    def test_utc_offset(self):
+        agg = indicators.IndicatorAggregator(utc_offset=3600)
+        agg.update([6 * 3600.0], [50])
+        self.assertEqual(agg.levels()['day'], 50.0)
+        self.assertEqual(agg.daily()['start'].tolist(), [6 * 3600.0])
+
+    def test_invalid_periods(self):
+        with self.assertRaises(ValueError):
+            indicators.IndicatorAggregator(periods=[('day', 6, 22, 0), ('night', 21, 6, 10)])
+        with self.assertRaises(ValueError):
+            indicators.IndicatorAggregator(periods=[('day', 6, 22, 0)])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestWeather(unittest.TestCase):
+
+    octave_frequencies = {'f63': 86, 'f125': 89.5, 'f500': 86.0, 'f2000': 80.0, 'f8000': 67.5}
+
+    def test_unique_states(self):
+        temp = [10.0, 10.001, 12.0, 10.0]
+        relhum = [80, 80, 80, 80]
+        states, inverse = weather.unique_states(temp, relhum, 101325)
+        self.assertEqual(len(states), 3)
+        numpy.testing.assert_array_equal(states[inverse][:, 0], temp)
+        states, inverse = weather.unique_states(temp, relhum, 101325, ndigits=1)
+        self.assertEqual(len(states), 2)
+        self.assertEqual(inverse.tolist(), [0, 0, 1, 0])
+
+    def test_series(self):
+        temp = numpy.array([10, 15, 10, 15, -5, 10])
+        relhum = numpy.array([80, 60, 80, 60, 90, 80])
+        pres = numpy.array([101325, 99000, 101325, 99000, 103000, 101325])
+        distance = numpy.array([200, 1000, 5000])
+        levels = weather.distant_total_damped_rated_level(
+            self.octave_frequencies, distance, temp, relhum, 10, pres)
+        self.assertEqual(levels.shape, (6, 3))
+        for i in range(len(temp)):
+            for j in range(len(distance)):
+                expected = py_audiocalc.distant_total_damped_rated_level(
+                    self.octave_frequencies, distance[j], temp[i], relhum[i], 10, pres[i])
+                self.assertAlmostEqual(levels[i, j], expected)
+
+    def test_pres(self):
+        low = py_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, 3000, 20, 50, pres=80000)
+        high = py_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, 3000, 20, 50, pres=101325)
+        self.assertNotAlmostEqual(low, high)
+        py_audiocalc.enable_damping_cache()
+        try:
+            cached = py_audiocalc.distant_total_damped_rated_level(
+                self.octave_frequencies, 3000, 20, 50, pres=80000)
+        finally:
+            py_audiocalc.disable_damping_cache()
+        self.assertAlmostEqual(cached, low)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestService(unittest.TestCase):
+
+    point = {'octave_frequencies': {'f63': 86, 'f500': 80, 'f4000': 70},
+             'distance': 1000, 'temp': 15, 'relhum': 70, 'reference_distance': 10}
+
+    @staticmethod
+    async def http(port, method, path, obj=None):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        body = b'' if obj is None else json.dumps(obj).encode('utf-8')
+        writer.write(("%s %s HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % (
+            method, path, len(body))).encode('latin1') + body)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, body = response.partition(b'\r\n\r\n')
+        return int(head.split()[1]), json.loads(body.decode('utf-8'))
+
+    def run_service(self, coroutine, **kwargs):
+        async def run():
+            svc = service.CalculationService(**kwargs)
+            server = await svc.start(port=0)
+            try:
+                return await coroutine(server.sockets[0].getsockname()[1])
+            finally:
+                await svc.close()
+        return asyncio.run(run())
+
+    def test_level(self):
+        async def requests(port):
+            points = [dict(self.point, distance=d) for d in range(100, 5000, 100)]
+            results = await asyncio.gather(*[self.http(port, 'POST', '/level', p) for p in points])
+            listed = await self.http(port, 'POST', '/level', points[:3])
+            metrics = await self.http(port, 'GET', '/metrics')
+            return points, results, listed, metrics
+
+        points, results, listed, metrics = self.run_service(requests, max_wait=0.01)
+        for point, (status, result) in zip(points, results):
+            self.assertEqual(status, 200)
+            expected = py_audiocalc.distant_total_damped_rated_level(
+                point['octave_frequencies'], point['distance'], 15, 70, 10)
+            self.assertAlmostEqual(result['level'], expected)
+        self.assertEqual(listed[0], 200)
+        self.assertEqual([r['level'] for r in listed[1]], [r['level'] for s, r in results[:3]])
+        status, metrics = metrics
+        self.assertEqual(metrics['requests'], len(points) + 3)
+        self.assertLess(metrics['batches'], metrics['requests'])
+        self.assertIn('p99', metrics['latency_ms'])
+
+    def test_errors(self):
+        async def requests(port):
+            return [
+                await self.http(port, 'POST', '/level', {'distance': 1}),
+                await self.http(port, 'POST', '/level', dict(self.point, octave_frequencies={'f1': 1})),
+                await self.http(port, 'GET', '/level'),
+                await self.http(port, 'GET', '/unknown'),
+            ]
+
+        results = self.run_service(requests)
+        self.assertEqual([status for status, result in results], [400, 400, 405, 404])
+        self.assertIn('octave_frequencies', results[0][1]['error'])
+
+    def test_invalid_values(self):
+        invalid = [
+            dict(self.point, distance=0),
+            dict(self.point, distance=-100),
+            dict(self.point, reference_distance=0),
+            dict(self.point, pres=-1),
+            dict(self.point, temp=float('nan')),
+            dict(self.point, distance=float('inf')),
+            dict(self.point, relhum=True),
+        ]
+        for obj in invalid:
+            with self.assertRaises(ValueError):
+                service.parse_request(obj)
+
+        async def requests(port):
+            return [
+                await self.http(port, 'POST', '/level', dict(self.point, distance=0)),
+                await self.http(port, 'POST', '/level', [self.point, dict(self.point, distance=-1)]),
+            ]
+
+        results = self.run_service(requests)
+        self.assertEqual([status for status, result in results], [400, 400])
+        self.assertIn('distance', results[0][1]['error'])
+
+    def test_non_finite_result(self):
+        async def run():
+            svc = service.CalculationService()
+            svc.batcher.evaluate = lambda items: [float('nan')] * len(items)
+            server = await svc.start(port=0)
+            try:
+                return await self.http(server.sockets[0].getsockname()[1], 'POST', '/level', self.point)
+            finally:
+                await svc.close()
+
+        status, result = asyncio.run(run())
+        self.assertEqual(status, 500)
+        self.assertIn('error', result)
+
+    def test_max_batch(self):
+        async def run():
+            batcher = service.MicroBatcher(lambda items: [i * 2 for i in items],
+                                           max_batch=4, max_wait=0.05)
+            await batcher.start()
+            try:
+                results = await asyncio.gather(*[batcher.submit(i) for i in range(10)])
+            finally:
+                await batcher.stop()
+            return results, batcher.metrics.snapshot()
+
+        results, metrics = asyncio.run(run())
+        self.assertEqual(results, [i * 2 for i in range(10)])
+        self.assertEqual(metrics['batches'], 3)
+        self.assertEqual(metrics['batch_size']['max'], 4)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestInterpolate(unittest.TestCase):
+
+    def test_multilinear(self):
+        axes = [numpy.array([0.0, 1.0, 3.0, 4.0]), numpy.linspace(-1, 1, 5)]
+        grid = numpy.meshgrid(*axes, indexing='ij')
+        values = numpy.stack([2 * grid[0] + 3 * grid[1], grid[0] * grid[1]], axis=-1)
+        x = numpy.array([0.0, 0.5, 2.2, 4.0])
+        y = numpy.array([[-1.0], [0.3]])
+        result = interpolate.multilinear(axes, values, [x, y])
+        self.assertEqual(result.shape, (2, 4, 2))
+        # bilinear functions are reproduced exactly
+        numpy.testing.assert_allclose(result[..., 0], 2 * x + 3 * y)
+        numpy.testing.assert_allclose(result[..., 1], x * y, atol=1e-15)
+
+    def test_nan(self):
+        for axis in (numpy.linspace(0, 4, 5), numpy.array([0.0, 1.0, 3.0])):
+            with numpy.errstate(invalid='ignore'):
+                result = interpolate.multilinear([axis], 2 * axis, [numpy.array([numpy.nan, 0.5])])
+            self.assertTrue(numpy.isnan(result[0]))
+            self.assertEqual(result[1], 1.0)
+        self.assertEqual(interpolate.inside([axis], [numpy.nan]).tolist(), False)
+
+    def test_inside(self):
+        axes = [numpy.array([0.0, 1.0]), numpy.array([10.0, 20.0])]
+        mask = interpolate.inside(axes, [[0.0, 1.0, 1.5], 15.0])
+        self.assertEqual(mask.tolist(), [True, True, False])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestApprox(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(3)
+        self.weather = [rng.uniform(-30, 45, 5000), rng.uniform(5, 100, 5000),
+                        rng.uniform(80000, 110000, 5000)]
+
+    def test_max_error(self):
+        # below 0.01 dB/km in all bands
+        error = approx.default_table().max_error(samples=10000)
+        self.assertEqual(error.shape, (8,))
+        self.assertTrue(numpy.all(error < 1e-5))
+
+    def test_table(self):
+        table = approx.default_table()
+        numpy.testing.assert_allclose(
+            table._table_band_damping(*self.weather),
+            np_audiocalc.band_damping(*self.weather), rtol=1e-4)
+        numpy.testing.assert_allclose(
+            approx.band_damping(*self.weather),
+            np_audiocalc.band_damping(*self.weather), rtol=1e-4)
+        if approx.HAVE_KERNELS:
+            numpy.testing.assert_allclose(
+                approx.band_damping(*self.weather),
+                table._table_band_damping(*self.weather), rtol=1e-12)
+
+    def test_outside_envelope(self):
+        temp, relhum, pres = [50, 20, -40], [50, 3, 50], [101325, 101325, 70000]
+        self.assertFalse(approx.default_table().inside(temp, relhum, pres).any())
+        numpy.testing.assert_allclose(
+            approx.band_damping(temp, relhum, pres), np_audiocalc.band_damping(temp, relhum, pres),
+            rtol=1e-12)
+
+    def test_level(self):
+        octave_frequencies = {'f63': 86, 'f500': 80, 'f4000': 70, 'f8000': 60}
+        distance = numpy.linspace(100, 10000, 5000)
+        levels = approx.distant_total_damped_rated_level(
+            octave_frequencies, distance, self.weather[0], self.weather[1], 10, self.weather[2])
+        expected = np_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies, distance, self.weather[0], self.weather[1], 10, self.weather[2])
+        self.assertEqual(levels.shape, (5000,))
+        self.assertLess(numpy.abs(levels - expected).max(), 1e-3)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestMonteCarlo(unittest.TestCase):
+
+    octave_frequencies = {
+        'f63': montecarlo.Normal(86, 2) if numpy is not None else None,
+        'f500': 80,
+        'f4000': montecarlo.Uniform(65, 70) if numpy is not None else None,
+    }
+
+    def run_monte_carlo(self, **kwargs):
+        return montecarlo.monte_carlo(
+            self.octave_frequencies, 1500, montecarlo.Normal(10, 5), montecarlo.Uniform(40, 95),
+            reference_distance=10, samples=20000, chunk_size=3000, **kwargs)
+
+    def test_reproducible(self):
+        first = self.run_monte_carlo(seed=7, processes=1)
+        second = self.run_monte_carlo(seed=7, processes=2)
+        self.assertEqual(first.count, 20000)
+        self.assertEqual(first.mean, second.mean)
+        self.assertEqual(first.std, second.std)
+        numpy.testing.assert_array_equal(first.statistics.counts, second.statistics.counts)
+        other = self.run_monte_carlo(seed=8, processes=1)
+        self.assertNotEqual(first.mean, other.mean)
+        self.assertAlmostEqual(first.mean, other.mean, delta=0.1)
+
+    def test_serial_by_default(self):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("no process pool expected")
+
+        original = montecarlo.ProcessPoolExecutor
+        montecarlo.ProcessPoolExecutor = no_pool
+        try:
+            result = self.run_monte_carlo(seed=7)
+        finally:
+            montecarlo.ProcessPoolExecutor = original
+        self.assertEqual(result.mean, self.run_monte_carlo(seed=7, processes=1).mean)
+
+    def test_constant(self):
+        result = montecarlo.monte_carlo(
+            {'f63': 86, 'f500': 80}, 1500, 10, 70, reference_distance=10,
+            samples=1000, processes=1)
+        expected = py_audiocalc.distant_total_damped_rated_level(
+            {'f63': 86, 'f500': 80}, 1500, 10, 70, 10)
+        self.assertAlmostEqual(result.mean, expected)
+        self.assertAlmostEqual(result.std, 0.0)
+        self.assertAlmostEqual(result.percentile(50), expected)
+
+    def test_result(self):
+        levels = numpy.random.default_rng(5).normal(50, 3, 10000)
+        result = montecarlo.MonteCarloResult()
+        for chunk in numpy.array_split(levels, 7):
+            result.update(chunk)
+        self.assertAlmostEqual(result.mean, levels.mean())
+        self.assertAlmostEqual(result.std, levels.std(ddof=1))
+        low, high = result.interval(0.9)
+        self.assertAlmostEqual(low, numpy.percentile(levels, 5), delta=0.1)
+        self.assertAlmostEqual(high, numpy.percentile(levels, 95), delta=0.1)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestTable(unittest.TestCase):
+
+    octave_frequencies = {'f63': 86, 'f125': 89.5, 'f500': 86.0, 'f2000': 80.0, 'f8000': 67.5}
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_level_table(self):
+        path = os.path.join(self.tmpdir, 'levels.tbl')
+        temp = numpy.arange(-10, 31, 2.0)
+        relhum = numpy.arange(20, 101, 5.0)
+        distance = numpy.geomspace(100, 5000, 40)
+        table.build_level_table(path, self.octave_frequencies, 10, temp, relhum, distance)
+        levels = table.Table.load(path)
+        self.assertIsInstance(levels.values, numpy.memmap)
+        self.assertEqual(levels.kind, 'level')
+        self.assertEqual([axis.name for axis in levels.axes], ['temp', 'relhum', 'distance'])
+        self.assertEqual(levels.metadata['reference_distance'], 10)
+        # exact on the grid points
+        self.assertAlmostEqual(
+            levels.lookup(temp[3], relhum[4], distance[5]),
+            py_audiocalc.distant_total_damped_rated_level(
+                self.octave_frequencies, distance[5], temp[3], relhum[4], 10), places=9)
+        rng = numpy.random.default_rng(6)
+        points = [rng.uniform(-10, 30, 1000), rng.uniform(20, 100, 1000), rng.uniform(100, 5000, 1000)]
+        expected = np_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, points[2], points[0], points[1], 10)
+        self.assertLess(numpy.abs(levels.lookup(*points) - expected).max(), 0.2)
+        numpy.testing.assert_array_equal(
+            levels.lookup(*points), levels.lookup(temp=points[0], relhum=points[1], distance=points[2]))
+        self.assertTrue(numpy.isnan(levels.lookup(35, 50, 1000)))
+        # NaN coordinates are outside the grid, on uniform and other axes
+        self.assertTrue(numpy.isnan(levels.lookup(temp=numpy.nan, relhum=50, distance=1000)))
+        result = levels.lookup(10, [50, numpy.nan], [1000, numpy.nan])
+        self.assertFalse(numpy.isnan(result[0]))
+        self.assertTrue(numpy.isnan(result[1]))
+        with self.assertRaises(TypeError):
+            levels.lookup(10, 50)
+
+    def test_absorption_table(self):
+        path = os.path.join(self.tmpdir, 'absorption.tbl')
+        table.build_absorption_table(path, numpy.arange(-10, 31, 1.0), numpy.arange(20, 101, 1.0))
+        absorption = table.Table.load(path)
+        self.assertEqual(absorption.value_shape, (8,))
+        result = absorption.lookup([10.5, 20.25], 50.5, 95000)
+        self.assertEqual(result.shape, (2, 8))
+        numpy.testing.assert_allclose(
+            result, np_audiocalc.band_damping([10.5, 20.25], 50.5, 95000), rtol=0.02)
+
+    def test_save(self):
+        path = os.path.join(self.tmpdir, 'plane.tbl')
+        axes = [table.Axis('x', [0, 1, 2], 'linear'), table.Axis('y', [1, 10], 'log')]
+        values = numpy.arange(6, dtype=float).reshape(3, 2)
+        table.Table('plane', axes, values, {'note': 'test'}).save(path)
+        loaded = table.Table.load(path)
+        numpy.testing.assert_array_equal(loaded.values, values)
+        self.assertEqual(loaded.metadata, {'note': 'test'})
+        self.assertAlmostEqual(loaded.lookup(0.5, numpy.sqrt(10)), 1.5)
+        with open(path, 'r+b') as tablefile:
+            tablefile.write(b'X')
+        with self.assertRaises(ValueError):
+            table.Table.load(path)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestFlyover(unittest.TestCase):
+
+    octave_frequencies = {'f63': 130, 'f125': 128, 'f500': 122, 'f2000': 115, 'f8000': 102}
+
+    def setUp(self):
+        self.times = numpy.arange(0, 60, 0.5)
+        x = -2000 + 70 * self.times
+        self.positions = numpy.stack(
+            [x, numpy.zeros_like(x), 100 + 0.1 * numpy.maximum(x, 0)], axis=-1)
+
+    def test_flyover(self):
+        result = flyover.flyover(
+            self.times, self.positions, [0, 200, 1.5], self.octave_frequencies, 1, 15, 70)
+        self.assertEqual(result.level.shape, (120,))
+        for k in (0, 29, 57, 119):
+            self.assertAlmostEqual(result.level[k], py_audiocalc.distant_total_damped_rated_level(
+                self.octave_frequencies, result.distance[k], 15, 70, 1))
+        self.assertEqual(result.lmax, result.level.max())
+        self.assertEqual(result.level.argmax(), numpy.argmin(result.distance))
+        self.assertGreater(result.sel, result.lmax)
+
+    def test_tracks(self):
+        positions = numpy.stack([self.positions, self.positions + [0, 300, 0]])
+        spectra = np_audiocalc.stack_spectra([self.octave_frequencies, {'f500': 110}])
+        result = flyover.flyover(
+            self.times, positions, [0, 200, 1.5], spectra, 1, [15, -5], [70, 40])
+        self.assertEqual(result.level.shape, (2, 120))
+        self.assertEqual(result.sel.shape, (2,))
+        single = flyover.flyover(
+            self.times, positions[1], [0, 200, 1.5], {'f500': 110}, 1, -5, 40)
+        numpy.testing.assert_allclose(result.level[1], single.level)
+        self.assertAlmostEqual(result.sel[1], single.sel)
+
+    def test_sound_exposure_level(self):
+        times = numpy.linspace(0, 10, 11)
+        self.assertAlmostEqual(flyover.sound_exposure_level(times, numpy.full(11, 70.0)), 80.0)
+        # uneven sampling
+        times = numpy.array([0, 1, 4, 10])
+        self.assertAlmostEqual(flyover.sound_exposure_level(times, numpy.full(4, 70.0)), 80.0)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestAtmosphere(unittest.TestCase):
+
+    octave_frequencies = {'f125': 120, 'f500': 115, 'f2000': 110, 'f8000': 100}
+
+    def setUp(self):
+        self.profile = atmosphere.Profile(
+            [0, 100, 500, 1000], temp=[15, 12, 8, 2], relhum=[70, 60, 50, 40],
+            pres=[101325, 100000, 96000, 90000])
+
+    def test_layer_lengths(self):
+        lengths = self.profile.layer_lengths([0, 1200, 300, 50], [800, 0, 300, 50], [1000, 2400, 700, 10])
+        numpy.testing.assert_allclose(lengths, [
+            [125, 500, 375, 0],
+            [200, 800, 1000, 400],
+            [0, 700, 0, 0],
+            [10, 0, 0, 0]])
+        # below and above the profile
+        numpy.testing.assert_allclose(
+            self.profile.layer_lengths(-100, 2000, 2100), [200, 400, 500, 1000])
+
+    def test_uniform_profile(self):
+        profile = atmosphere.Profile([0, 500], 10, 60)
+        source = numpy.array([[0, 0, 1000], [0, 0, 10], [300, 400, 20]])
+        receiver = numpy.array([2000, 0, 1.5])
+        distance = numpy.sqrt(numpy.square(receiver - source).sum(axis=-1))
+        numpy.testing.assert_allclose(
+            profile.distant_total_damped_rated_level(self.octave_frequencies, source, receiver, 2),
+            np_audiocalc.distant_total_damped_rated_level(self.octave_frequencies, distance, 10, 60, 2))
+
+    def test_distant_level(self):
+        source = [0, 0, 1500]
+        receiver = [2000, 0, 0]
+        distance = 2500.0
+        lengths = self.profile.layer_lengths(1500 * (1 - 1 / distance), 0, distance - 1)
+        expected = 10 * numpy.log10(sum(
+            10 ** ((self.octave_frequencies[band] + np_audiocalc.BAND_A_FACTORS[i] -
+                    numpy.dot(lengths, self.profile.absorption[:, i])) / 10)
+            for i, band in enumerate(np_audiocalc.BANDS) if band in self.octave_frequencies))
+        expected -= 20 * numpy.log10(distance)
+        self.assertAlmostEqual(
+            self.profile.distant_total_damped_rated_level(self.octave_frequencies, source, receiver),
+            expected)
+        # between the level with the weather of the lowest and the highest layer
+        levels = [np_audiocalc.distant_total_damped_rated_level(
+            self.octave_frequencies, distance, t, h, 1, p)
+            for t, h, p in [(15, 70, 101325), (2, 40, 90000)]]
+        self.assertTrue(min(levels) < expected < max(levels))
+
+    def test_batch(self):
+        rng = numpy.random.default_rng(0)
+        source = rng.uniform([-3000, -3000, 0], [3000, 3000, 3000], (50, 3))
+        receiver = numpy.array([[0, 0, 1.5], [500, 0, 4]])
+        levels = self.profile.distant_total_damped_rated_level(
+            self.octave_frequencies, source[:, numpy.newaxis], receiver, 1)
+        self.assertEqual(levels.shape, (50, 2))
+        for i, j in [(0, 0), (17, 1), (49, 0)]:
+            self.assertAlmostEqual(levels[i, j], self.profile.distant_total_damped_rated_level(
+                self.octave_frequencies, source[i], receiver[j], 1))
+        attenuation = self.profile.attenuation(source[:, numpy.newaxis], receiver)
+        self.assertEqual(attenuation.shape, (50, 2, len(np_audiocalc.BANDS)))
+
+    def test_invalid_profile(self):
+        with self.assertRaises(ValueError):
+            atmosphere.Profile([0, 0], 10, 60)
+        with self.assertRaises(ValueError):
+            atmosphere.Profile([0, 100], [10, 8, 6], 60)
+
+
+class TestScenario(unittest.TestCase):
+
+    octave_frequencies = {'f63': 86, 'f250': 87.5, 'f1000': 83.0, 'f4000': 77, 'f8000': 67.5}
+
+    def setUp(self):
+        self.scenario = scenario.Scenario(self.octave_frequencies, 800, 10, 60, 300)
+
+    def expected(self, distance=800, temp=10, relhum=60, reference_distance=300,
+                 pres=101325, octave_frequencies=None):
+        return py_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies or self.octave_frequencies, distance, temp, relhum,
+            reference_distance, pres)
+
+    def test_level(self):
+        self.assertAlmostEqual(self.scenario.level, self.expected())
+        self.assertEqual(set(self.scenario.band_levels), set(self.octave_frequencies))
+        self.assertAlmostEqual(
+            py_audiocalc.total_level(self.scenario.band_levels.values()), self.scenario.level)
+        self.assertEqual(self.scenario.damping['f1000'], py_audiocalc.damping(10, 60, 1000))
+
+    def test_distance_update(self):
+        self.scenario.level
+        for distance in range(500, 5000, 250):
+            self.scenario.distance = distance
+            self.assertAlmostEqual(self.scenario.level, self.expected(distance=distance))
+        self.assertEqual(self.scenario.evaluations['damping'], 1)
+        self.assertEqual(self.scenario.evaluations['base'], 1)
+        self.assertEqual(self.scenario.evaluations['level'], 19)
+
+    def test_invalidation(self):
+        self.scenario.level
+        self.scenario.update(temp=-5, relhum=80)
+        self.assertAlmostEqual(self.scenario.level, self.expected(temp=-5, relhum=80))
+        self.assertEqual(self.scenario.evaluations['damping'], 2)
+        self.assertEqual(self.scenario.evaluations['rated'], 1)
+        self.scenario.pres = 90000
+        self.scenario.reference_distance = 100
+        self.scenario.octave_frequencies = {'f500': 90}
+        self.assertEqual(self.scenario.octave_frequencies, {'f500': 90})
+        self.assertAlmostEqual(self.scenario.level, self.expected(
+            temp=-5, relhum=80, pres=90000, reference_distance=100,
+            octave_frequencies={'f500': 90}))
+        self.assertEqual(self.scenario.evaluations['damping'], 3)
+        self.assertEqual(self.scenario.evaluations['rated'], 2)
+        # unchanged values keep the cache
+        self.scenario.update(distance=800, temp=-5)
+        self.scenario.level
+        self.assertEqual(self.scenario.evaluations['level'], 3)
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(TypeError):
+            self.scenario.update(humidity=50)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,116 @@
+# encoding: utf-8
+
+"""
+Multi-threaded batch evaluation with the GIL-releasing batch kernels
+of the compiled backend. Batches are split into one part per thread,
+so no data is copied between processes.
+
+If the compiled backend has not been built, the functions fall back
+to the (single-threaded) NumPy implementation in np_audiocalc.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import np_audiocalc
+
+try:
+    from . import _audiocalc
+except ImportError:
+    _audiocalc = None
+
+
+# whether the compiled batch kernels are available
+HAVE_KERNELS = _audiocalc is not None and hasattr(_audiocalc, 'damping_batch')
+
+# minimum number of elements per thread
+MIN_CHUNK_SIZE = 4096
+
+
+def _map(kernel, arrays, out, threads):
+    """
+    Splits arrays and out along the first axis into one part per
+    thread and calls kernel(*parts, out=out_part) for each part.
+    """
+    n = out.shape[0]
+    if threads is None:
+        threads = os.cpu_count() or 1
+    threads = max(1, min(threads, n // MIN_CHUNK_SIZE))
+    if threads == 1:
+        kernel(*arrays, out=out)
+        return out
+    bounds = np.linspace(0, n, threads + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = [
+            executor.submit(kernel, *[a[lo:hi] for a in arrays], out=out[lo:hi])
+            for lo, hi in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+    return out
+
+
+def _flat(*arrays):
+    """
+    Broadcasts arrays against each other and returns the shape and
+    contiguous flat float64 copies.
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in arrays])
+    return arrays[0].shape, [np.ascontiguousarray(a).ravel() for a in arrays]
+
+
+def damping(temp, relhum, freq, pres=101325, threads=None):
+    """
+    Calculates the damping in dB/m like np_audiocalc.damping,
+    using `threads` threads (defaults to the number of CPUs).
+    """
+    if not HAVE_KERNELS:
+        return np_audiocalc.damping(temp, relhum, freq, pres)
+    shape, arrays = _flat(temp, relhum, freq, pres)
+    out = np.empty(arrays[0].size)
+    return _map(_audiocalc.damping_batch, arrays, out, threads).reshape(shape)
+
+
+def total_rated_level(octave_frequencies, threads=None):
+    """
+    Calculates the A-rated total sound pressure level like
+    np_audiocalc.total_rated_level for an array of band levels of
+    shape (..., len(BANDS)), using `threads` threads.
+    """
+    if not HAVE_KERNELS:
+        return np_audiocalc.total_rated_level(octave_frequencies)
+    band_levels = np_audiocalc._band_levels(octave_frequencies)
+    shape = band_levels.shape[:-1]
+    band_levels = np.ascontiguousarray(band_levels.reshape(-1, len(np_audiocalc.BANDS)))
+    out = np.empty(band_levels.shape[0])
+    return _map(_audiocalc.total_rated_level_batch, [band_levels], out, threads).reshape(shape)
+
+
+def distant_total_damped_rated_level(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325,
+            threads=None):
+    """
+    Calculates the damped, A-rated total sound pressure level of one
+    source like np_audiocalc.distant_total_damped_rated_level, using
+    `threads` threads. distance, temp, relhum and pres are broadcast
+    against each other.
+    """
+    if not HAVE_KERNELS:
+        return np_audiocalc.distant_total_damped_rated_level(
+            octave_frequencies, distance, temp, relhum, reference_distance, pres)
+    band_levels = np_audiocalc._band_levels(octave_frequencies)
+    shape, arrays = _flat(distance, temp, relhum, pres)
+    out = np.empty(arrays[0].size)
+
+    def kernel(distance, temp, relhum, pres, out):
+        _audiocalc.distant_total_damped_rated_level_batch(
+            band_levels, distance, temp, relhum, pres,
+            float(reference_distance), out=out)
+
+    return _map(kernel, arrays, out, threads).reshape(shape)
@@ -0,0 +1,72 @@
+# encoding: utf-8
+
+"""
+Propagation over weather time series, e.g. years of hourly
+meteorological records applied to a fixed source/receiver geometry.
+
+Rounded weather data repeats heavily. The absorption of all octave
+bands is calculated once per unique weather state and the results
+are scattered back to the time axis.
+"""
+
+import numpy as np
+
+from . import np_audiocalc
+
+
+def unique_states(temp, relhum, pres=101325, ndigits=None):
+    """
+    Returns the unique weather states of a time series and the index
+    of the state of every record.
+
+    temp, relhum, pres: weather records, broadcast against each other
+    ndigits: optional number of decimal places the records are
+        rounded to before looking for repeated states, like
+        DampingCache. None only merges exactly equal records.
+
+    Returns (states, inverse): states is an array of shape (n, 3)
+    with the columns temp, relhum and pres, inverse has the broadcast
+    shape of the records and indexes states.
+    """
+    temp, relhum, pres = np.broadcast_arrays(
+        *[np.asarray(a, dtype=float) for a in (temp, relhum, pres)])
+    records = np.stack([temp.ravel(), relhum.ravel(), pres.ravel()], axis=-1)
+    if ndigits is not None:
+        records = np.round(records, ndigits)
+    states, inverse = np.unique(records, axis=0, return_inverse=True)
+    return states, inverse.reshape(temp.shape)
+
+
+def distant_total_damped_rated_level(
+            octave_frequencies,
+            distance,
+            temp,
+            relhum,
+            reference_distance=1.0,
+            pres=101325,
+            ndigits=None):
+    """
+    Calculates the damped, A-rated total sound pressure level like
+    np_audiocalc.distant_total_damped_rated_level for every record
+    of a weather time series and every distance of a fixed geometry.
+
+    octave_frequencies: band levels in the reference distance, a dict,
+        OctaveSpectrum or array broadcastable to distance.shape + (8,)
+    distance: distance or array of distances (e.g. one per receiver)
+    temp, relhum, pres: weather records, broadcast against each other
+    reference_distance: reference distance in meters
+    ndigits: optional rounding of the records, see unique_states
+
+    Returns an array of shape weather.shape + distance.shape.
+    """
+    states, inverse = unique_states(temp, relhum, pres, ndigits)
+    distance = np.asarray(distance, dtype=float)
+    absorption = np_audiocalc.band_damping(states[:, 0], states[:, 1], states[:, 2])
+    absorption = absorption.reshape(
+        (len(states),) + (1,) * distance.ndim + (len(np_audiocalc.BANDS),))
+    energy = np_audiocalc._damped_rated_energy(
+        np_audiocalc._source_energy(octave_frequencies),
+        absorption,
+        distance,
+        reference_distance)
+    return (10.0 * np.log10(energy))[inverse]
@@ -10,7 +10,13 @@ except:
     from distutils.core import setup
 
 from distutils.extension import Extension
-from Cython.Distutils import build_ext
+
+# The compiled backend is optional. Without Cython or a working
+# compiler, the package is installed with the Python backends only.
+try:
+    from Cython.Distutils import build_ext
+except ImportError:
+    build_ext = None
 
 try:
     import pypandoc
@@ -20,12 +26,34 @@ except (IOError, ImportError):
 
 PKG_DIR = 'audiocalc'
 
-extensions = [
-    Extension(
-        PKG_DIR + "._audiocalc",
-        sources=[join(PKG_DIR, "_audiocalc.pyx")],
+extensions = []
+cmdclass = {}
+
+if build_ext is not None:
+    class optional_build_ext(build_ext):
+        """
+        Builds the extension if possible, otherwise warns and continues.
+        """
+
+        def run(self):
+            try:
+                build_ext.run(self)
+            except Exception as e:
+                print("WARNING: Could not build the compiled backend: %s" % e)
+
+        def build_extension(self, ext):
+            try:
+                build_ext.build_extension(self, ext)
+            except Exception as e:
+                print("WARNING: Could not build %s: %s" % (ext.name, e))
+
+    extensions.append(
+        Extension(
+            PKG_DIR + "._audiocalc",
+            sources=[join(PKG_DIR, "_audiocalc.pyx")],
+        )
     )
-]
+    cmdclass['build_ext'] = optional_build_ext
 
 setup(name='audiocalc',
     version='0.0.9',
@@ -37,6 +65,7 @@ setup(name='audiocalc',
     packages=['audiocalc'],
     license='MIT',
     requires=[],
+    extras_require={'numpy': ['numpy']},
     ext_modules = extensions,
-    cmdclass = {'build_ext': build_ext}
+    cmdclass = cmdclass
 )
\ No newline at end of file